@@ -13,8 +13,8 @@ import magic
 from loguru import logger
 
 from src.core.tasks import extract_pdf_task
-from src.core.job_tracker import JobTracker, JobStatus
-from src.core.config import settings
+from src.core.job_tracker import JobStatus, get_job_tracker
+from src.core.config import get_settings
 from src.utils.file_utils import copy_file_to_upload
 
 router = APIRouter(prefix="/api/v1", tags=["extraction"])
@@ -68,7 +68,7 @@ def validate_api_key(api_key: Optional[str]) -> bool:
         bool: True if valid or not required.
     """
     # Feature #113: Optional API key authentication
-    expected_key = getattr(settings, 'api_key', None)
+    expected_key = getattr(get_settings(), 'api_key', None)
 
     if not expected_key:
         # API key not configured, allow all
@@ -207,6 +207,7 @@ async def extract_pdf(
         content = await file.read()
 
         # Feature #110: File size limit
+        settings = get_settings()
         max_size_bytes = settings.max_file_size_mb * 1024 * 1024
         if len(content) > max_size_bytes:
             raise HTTPException(
@@ -261,7 +262,7 @@ async def extract_pdf(
 
     # Feature #107: Store callback URL if provided
     if request_data and request_data.callback_url:
-        tracker = JobTracker()
+        tracker = get_job_tracker()
         tracker.set_status(
             job_id,
             JobStatus.PENDING,
@@ -297,7 +298,7 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
     """
     logger.info(f"GET /api/v1/status/{job_id}")
 
-    tracker = JobTracker()
+    tracker = get_job_tracker()
     status_data = tracker.get_status(job_id)
 
     if not status_data:
@@ -391,7 +392,7 @@ async def submit_arbitration(
     # Feature #95: Apply choices to regenerate merged document
     # Feature #96: Update job status to completed
 
-    tracker = JobTracker()
+    tracker = get_job_tracker()
     tracker.set_status(
         job_id,
         JobStatus.COMPLETED,
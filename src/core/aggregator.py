@@ -72,58 +72,14 @@ class ExtractionAggregator:
 
         logger.info(f"Aggregating results from {len(results)} extractors")
 
-        # Separate successful and failed results
-        successful = {
-            name: result
-            for name, result in results.items()
-            if result.success
-        }
-
-        failed = {
-            name: result
-            for name, result in results.items()
-            if not result.success
-        }
+        aggregation = None
+        for name, result in results.items():
+            aggregation = self.update(aggregation, name, result)
 
-        # Calculate metrics
-        extractor_count = len(results)
-        successful_count = len(successful)
-        failed_count = len(failed)
-
-        # Get best result (highest confidence)
-        best_result = self._get_best_result(successful) if successful else None
-
-        # Check consensus
-        consensus_available = successful_count >= 2
-
-        # Calculate average confidence
-        if successful:
-            avg_confidence = sum(r.confidence_score for r in successful.values()) / len(successful)
-        else:
-            avg_confidence = 0.0
-
-        # Calculate total extraction time
-        total_time = sum(r.extraction_time for r in results.values())
-
-        # Build aggregation summary
-        aggregation = {
-            'extractor_count': extractor_count,
-            'successful_count': successful_count,
-            'failed_count': failed_count,
-            'extractors': {
-                name: {
-                    'success': result.success,
-                    'confidence': result.confidence_score,
-                    'extraction_time': result.extraction_time,
-                    'char_count': len(result.markdown),
-                }
-                for name, result in results.items()
-            },
-            'best_result': best_result,
-            'consensus_available': consensus_available,
-            'average_confidence': avg_confidence,
-            'total_extraction_time': total_time,
-        }
+        successful_count = aggregation['successful_count']
+        extractor_count = aggregation['extractor_count']
+        avg_confidence = aggregation['average_confidence']
+        total_time = aggregation['total_extraction_time']
 
         logger.info(
             f"Aggregation: {successful_count}/{extractor_count} successful, "
@@ -132,33 +88,67 @@ class ExtractionAggregator:
 
         return aggregation
 
-    def _get_best_result(
+    def update(
         self,
-        results: Dict[str, ExtractionResult],
-    ) -> Optional[ExtractionResult]:
+        aggregation: Optional[Dict[str, Any]],
+        name: str,
+        result: ExtractionResult,
+    ) -> Dict[str, Any]:
         """
-        Get the best result based on confidence score.
+        Fold one extractor result into an aggregation, in place (Feature #59).
+
+        Lets callers aggregate results as extractors complete instead of
+        waiting for all of them.
 
         Args:
-            results: Dictionary of successful results.
+            aggregation: Aggregation dict to update (as returned by aggregate()),
+                         or None to start a new one.
+            name: Extractor name.
+            result: Extraction result.
 
         Returns:
-            ExtractionResult: Result with highest confidence, or None.
+            dict: The updated aggregation.
+
+        Example:
+            >>> aggregator = ExtractionAggregator()
+            >>> aggregation = aggregator.update(None, 'docling', result1)
+            >>> aggregation = aggregator.update(aggregation, 'mineru', result2)
+            >>> print(aggregation['consensus_available'])
+            True
         """
-        if not results:
-            return None
+        if aggregation is None:
+            aggregation = self._empty_aggregation()
 
-        best_name, best_result = max(
-            results.items(),
-            key=lambda item: item[1].confidence_score
-        )
+        success = result.success
 
-        logger.debug(
-            f"Best result: {best_name} "
-            f"(confidence={best_result.confidence_score})"
-        )
+        extractors = aggregation['extractors']
+        extractors[name] = {
+            'success': success,
+            'confidence': result.confidence_score,
+            'extraction_time': result.extraction_time,
+            'char_count': len(result.markdown),
+        }
 
-        return best_result
+        aggregation['extractor_count'] = len(extractors)
+        aggregation['total_extraction_time'] += result.extraction_time
+
+        if not success:
+            aggregation['failed_count'] += 1
+            return aggregation
+
+        successful_count = aggregation['successful_count'] + 1
+        aggregation['successful_count'] = successful_count
+        aggregation['consensus_available'] = successful_count >= 2
+        aggregation['average_confidence'] = sum(
+            entry['confidence'] for entry in extractors.values() if entry['success']
+        ) / successful_count
+
+        best_result = aggregation['best_result']
+        if best_result is None or result.confidence_score > best_result.confidence_score:
+            aggregation['best_result'] = result
+            logger.debug(f"Best result: {name} (confidence={result.confidence_score})")
+
+        return aggregation
 
     def _empty_aggregation(self) -> Dict[str, Any]:
         """
@@ -5,10 +5,17 @@ Celery configuration for asynchronous PDF extraction tasks.
 """
 
 import os
+from typing import Optional
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 from kombu import Exchange, Queue
 from loguru import logger
 
+from src.core.config import get_settings
+from src.core.job_tracker import JobTracker, get_job_tracker
+from src.core.orchestrator import Orchestrator
+
 # ==========================================
 # Environment Configuration
 # ==========================================
@@ -16,6 +23,14 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL)
 
+# msgpack payloads are smaller and faster to encode than JSON; fall back to
+# JSON when msgpack is not installed
+try:
+    import msgpack  # noqa: F401
+    CELERY_SERIALIZER = "msgpack"
+except ImportError:
+    CELERY_SERIALIZER = "json"
+
 # ==========================================
 # Celery Application
 # ==========================================
@@ -30,10 +45,10 @@ app = Celery(
 # Celery Configuration
 # ==========================================
 app.conf.update(
-    # Serialization
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Serialization (JSON still accepted for messages from older producers)
+    task_serializer=CELERY_SERIALIZER,
+    accept_content=["msgpack", "json"],
+    result_serializer=CELERY_SERIALIZER,
 
     # Timezone
     timezone="UTC",
@@ -93,6 +108,65 @@ def setup_periodic_tasks(sender, **kwargs):
     pass
 
 
+@worker_init.connect
+def preload_settings(sender=None, **kwargs):
+    """
+    Build settings once in the parent worker process, before pool forks.
+
+    Prefork children inherit the cached instance, so they don't re-read
+    .env or re-validate Settings on startup.
+    """
+    settings = get_settings()
+    logger.info(f"Settings preloaded for worker (environment={settings.environment})")
+
+
+# Per-process instances shared by every task run in a worker process
+_ORCHESTRATOR: Optional[Orchestrator] = None
+_TRACKER: Optional[JobTracker] = None
+
+
+@worker_process_init.connect
+def init_worker_process(sender=None, **kwargs):
+    """
+    Build the orchestrator and job tracker once per worker process.
+
+    Runs in each pool child after the fork, so extractor discovery and
+    Redis connections are not shared across processes.
+    """
+    get_worker_orchestrator()
+    get_worker_tracker()
+    logger.info(f"Worker process initialized (pid={os.getpid()})")
+
+
+def get_worker_orchestrator() -> Orchestrator:
+    """
+    Get this worker process's Orchestrator, creating it if needed.
+
+    Pools that skip worker_process_init (solo, threads, eager mode)
+    create it on first use instead.
+
+    Returns:
+        Orchestrator: Process-wide orchestrator.
+    """
+    global _ORCHESTRATOR
+    if _ORCHESTRATOR is None:
+        _ORCHESTRATOR = Orchestrator()
+    return _ORCHESTRATOR
+
+
+def get_worker_tracker() -> JobTracker:
+    """
+    Get this worker process's JobTracker, creating it if needed.
+
+    Returns:
+        JobTracker: Process-wide job tracker.
+    """
+    global _TRACKER
+    if _TRACKER is None:
+        _TRACKER = get_job_tracker()
+    return _TRACKER
+
+
 # ==========================================
 # Tasks
 # ==========================================
@@ -4,16 +4,174 @@ PDF-to-Markdown Extractor - Complexity Analyzer.
 Analyzes PDF complexity to determine optimal extraction strategy.
 """
 
-import hashlib
 import json
 import re
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 import fitz  # PyMuPDF
+import numpy as np
 from loguru import logger
 
 from src.utils.redis_client import get_redis_client
+from src.utils.result_cache import fingerprint_file
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the pure-Python reducer
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Patterns that suggest mathematical formulas (Feature #41)
+MATH_PATTERNS = [
+    re.compile(r'\$[^$]+\$'),  # LaTeX inline math
+    re.compile(r'\\\[.+?\\\]'),  # LaTeX display math
+    re.compile(r'\\begin\{equation\}'),  # LaTeX equation environment
+    re.compile(r'∑|∫|∏|√|∞|≤|≥|≠|≈|±'),  # Mathematical symbols
+    re.compile(r'\^[0-9]|\_{[0-9]}'),  # Superscripts/subscripts
+]
+
+# Number of leading pages sampled by the layout/text heuristics
+TABLE_SAMPLE_PAGES = 10
+COLUMN_SAMPLE_PAGES = 5
+FORMULA_SAMPLE_PAGES = 10
+SCAN_SAMPLE_PAGES = 5
+
+# Column layout of the per-page counter array built by ComplexityAnalyzer._scan_pages
+COL_TABLE_BLOCKS = 0
+COL_MULTI_COLUMN = 1
+COL_IMAGES = 2
+COL_FORMULAS = 3
+COL_LOW_TEXT = 4
+PAGE_COUNTER_COLUMNS = 5
+
+
+def _count_table_blocks(blocks: list) -> int:
+    """Count table-like text blocks on a page (Feature #38 heuristic)."""
+    # Multiple lines in a single block suggest a potential table
+    return sum(1 for block in blocks if "lines" in block and len(block.get("lines", [])) > 3)
+
+
+def _is_multi_column(blocks: list) -> bool:
+    """Check whether block x-positions suggest a multi-column page (Feature #39 heuristic)."""
+    x_positions = sorted(block["bbox"][0] for block in blocks if "bbox" in block)
+
+    # Gaps of 100+ points between left edges suggest column boundaries
+    return any(
+        x_positions[i + 1] - x_positions[i] > 100
+        for i in range(len(x_positions) - 1)
+    )
+
+
+def _count_formulas(text: str) -> int:
+    """Count formula-like matches in page text (Feature #41 heuristic)."""
+    return sum(len(pattern.findall(text)) for pattern in MATH_PATTERNS)
+
+
+def _is_low_text(text: str, image_count: int) -> bool:
+    """Check whether a page looks scanned: images but very little text (Feature #42 heuristic)."""
+    return image_count > 0 and len(text.strip()) < 100
+
+
+@njit(cache=True)
+def _reduce_page_counts(page_counts: np.ndarray) -> tuple:
+    """
+    Reduce per-page counters to the six component scores.
+
+    Compiled with numba when available. Applies the same sampling windows
+    and bin thresholds as the individual ``*_score`` methods.
+
+    Args:
+        page_counts: (N, PAGE_COUNTER_COLUMNS) int64 array, one row per page.
+
+    Returns:
+        tuple: (page_count, tables, columns, images, formulas, scans) scores.
+    """
+    page_count = page_counts.shape[0]
+
+    # Page count (Feature #37)
+    if page_count <= 5:
+        page_count_score = 0
+    elif page_count <= 20:
+        page_count_score = 5
+    elif page_count <= 50:
+        page_count_score = 10
+    else:
+        page_count_score = 15
+
+    # Tables (Feature #38): average over sampled pages, scaled to the document
+    sample = min(TABLE_SAMPLE_PAGES, page_count)
+    total_tables = 0
+    if sample > 0:
+        table_count = page_counts[:sample, COL_TABLE_BLOCKS].sum()
+        total_tables = int(table_count / sample * page_count)
+    if total_tables == 0:
+        table_score = 0
+    elif total_tables <= 3:
+        table_score = 10
+    else:
+        table_score = 25
+
+    # Columns (Feature #39)
+    sample = min(COLUMN_SAMPLE_PAGES, page_count)
+    multi_column_pages = page_counts[:sample, COL_MULTI_COLUMN].sum()
+    if multi_column_pages >= sample * 0.5:
+        column_score = 25
+    elif multi_column_pages > 0:
+        column_score = 15
+    else:
+        column_score = 0
+
+    # Images (Feature #40)
+    images_per_page = 0.0
+    if page_count > 0:
+        images_per_page = page_counts[:, COL_IMAGES].sum() / page_count
+    if images_per_page < 0.1:
+        image_score = 0
+    elif images_per_page < 0.5:
+        image_score = 10
+    elif images_per_page < 1.0:
+        image_score = 20
+    else:
+        image_score = 30
+
+    # Formulas (Feature #41)
+    sample = min(FORMULA_SAMPLE_PAGES, page_count)
+    total_formulas = 0
+    if sample > 0:
+        formula_count = page_counts[:sample, COL_FORMULAS].sum()
+        total_formulas = int(formula_count * page_count / sample)
+    if total_formulas == 0:
+        formula_score = 0
+    elif total_formulas <= 5:
+        formula_score = 15
+    else:
+        formula_score = 30
+
+    # Scans (Feature #42)
+    sample = min(SCAN_SAMPLE_PAGES, page_count)
+    scan_ratio = 0.0
+    if sample > 0:
+        scan_ratio = page_counts[:sample, COL_LOW_TEXT].sum() / sample
+    if scan_ratio == 0:
+        scan_score = 0
+    elif scan_ratio < 0.5:
+        scan_score = 20
+    else:
+        scan_score = 40
+
+    return (
+        page_count_score,
+        table_score,
+        column_score,
+        image_score,
+        formula_score,
+        scan_score,
+    )
 
 
 class ComplexityScore:
@@ -76,11 +234,16 @@ class ComplexityScore:
             self.complexity_level = "complex"
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to dictionary.
+
+        Scores are shared across requests (memoized analyses, forced
+        levels), so each call returns a fresh dict callers may modify.
+        """
         return {
             "total_score": self.total_score,
             "complexity_level": self.complexity_level,
-            "components": self.components,
+            "components": dict(self.components),
         }
 
 
@@ -155,22 +318,25 @@ class ComplexityAnalyzer:
         doc = fitz.open(file_path)
 
         try:
-            # Calculate individual scores
-            page_count_score = self.page_count_score(doc)
-            table_score = self.table_score(doc)
-            column_score = self.column_score(doc)
-            image_score = self.image_score(doc)
-            formula_score = self.formula_score(doc)
-            scan_score = self.scan_score(doc)
+            # Single pass over the pages, then a compiled reduction to scores
+            page_counts = self._scan_pages(doc)
+            (
+                page_count_score,
+                table_score,
+                column_score,
+                image_score,
+                formula_score,
+                scan_score,
+            ) = _reduce_page_counts(page_counts)
 
             # Build complexity score
             score = ComplexityScore(
-                page_count_score=page_count_score,
-                table_score=table_score,
-                column_score=column_score,
-                image_score=image_score,
-                formula_score=formula_score,
-                scan_score=scan_score,
+                page_count_score=int(page_count_score),
+                table_score=int(table_score),
+                column_score=int(column_score),
+                image_score=int(image_score),
+                formula_score=int(formula_score),
+                scan_score=int(scan_score),
             )
 
             logger.info(
@@ -187,6 +353,45 @@ class ComplexityAnalyzer:
         finally:
             doc.close()
 
+    def _scan_pages(self, doc: fitz.Document) -> np.ndarray:
+        """
+        Collect per-page heuristic counters in a single pass.
+
+        Each page is parsed at most once (one ``get_text("dict")``, one
+        ``get_text()``, one ``get_images()``) instead of once per scorer.
+        Pages outside a heuristic's sampling window keep a zero counter.
+
+        Args:
+            doc: PyMuPDF document.
+
+        Returns:
+            np.ndarray: (page_count, PAGE_COUNTER_COLUMNS) int64 counter array.
+        """
+        page_count = len(doc)
+        page_counts = np.zeros((page_count, PAGE_COUNTER_COLUMNS), dtype=np.int64)
+        layout_pages = max(TABLE_SAMPLE_PAGES, COLUMN_SAMPLE_PAGES)
+        text_pages = max(FORMULA_SAMPLE_PAGES, SCAN_SAMPLE_PAGES)
+
+        for page_num, page in enumerate(doc):
+            image_count = len(page.get_images())
+            page_counts[page_num, COL_IMAGES] = image_count
+
+            if page_num < layout_pages:
+                blocks = page.get_text("dict")["blocks"]
+                if page_num < TABLE_SAMPLE_PAGES:
+                    page_counts[page_num, COL_TABLE_BLOCKS] = _count_table_blocks(blocks)
+                if page_num < COLUMN_SAMPLE_PAGES:
+                    page_counts[page_num, COL_MULTI_COLUMN] = _is_multi_column(blocks)
+
+            if page_num < text_pages:
+                text = page.get_text()
+                if page_num < FORMULA_SAMPLE_PAGES:
+                    page_counts[page_num, COL_FORMULAS] = _count_formulas(text)
+                if page_num < SCAN_SAMPLE_PAGES:
+                    page_counts[page_num, COL_LOW_TEXT] = _is_low_text(text, image_count)
+
+        return page_counts
+
     def page_count_score(self, doc: fitz.Document) -> int:
         """
         Score based on page count (Feature #37).
@@ -234,21 +439,12 @@ class ComplexityAnalyzer:
         table_count = 0
 
         # Sample first 10 pages for table detection
-        sample_pages = min(10, len(doc))
+        sample_pages = min(TABLE_SAMPLE_PAGES, len(doc))
 
         for page_num in range(sample_pages):
-            page = doc[page_num]
-
-            # Use layout analysis to detect tables
-            # Look for grid-like structures (multiple horizontal/vertical lines)
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                # Simple heuristic: check for table-like structures
-                # (This is a simplified approach - more sophisticated in future)
-                if "lines" in block and len(block.get("lines", [])) > 3:
-                    # Multiple lines suggest potential table
-                    table_count += 1
+            # Use layout analysis to detect table-like structures
+            blocks = doc[page_num].get_text("dict")["blocks"]
+            table_count += _count_table_blocks(blocks)
 
         # Average over sampled pages
         avg_tables = table_count / sample_pages if sample_pages > 0 else 0
@@ -281,30 +477,15 @@ class ComplexityAnalyzer:
             int: Column score.
         """
         # Sample first 5 pages
-        sample_pages = min(5, len(doc))
+        sample_pages = min(COLUMN_SAMPLE_PAGES, len(doc))
         multi_column_pages = 0
 
         for page_num in range(sample_pages):
-            page = doc[page_num]
-            blocks = page.get_text("dict")["blocks"]
-
-            # Group blocks by x-coordinate to detect columns
-            x_positions = []
-            for block in blocks:
-                if "bbox" in block:
-                    x = block["bbox"][0]  # Left x-coordinate
-                    x_positions.append(x)
-
-            # Simple heuristic: if we have blocks at significantly different x positions,
-            # it suggests multi-column layout
-            if len(x_positions) >= 2:
-                x_positions.sort()
-                # Check for gaps that suggest column boundaries
-                gaps = [x_positions[i+1] - x_positions[i] for i in range(len(x_positions)-1)]
-                large_gaps = [g for g in gaps if g > 100]  # Significant gap (100+ points)
-
-                if len(large_gaps) >= 1:
-                    multi_column_pages += 1
+            blocks = doc[page_num].get_text("dict")["blocks"]
+
+            # Blocks at significantly different x positions suggest multi-column layout
+            if _is_multi_column(blocks):
+                multi_column_pages += 1
 
         # If majority of sampled pages are multi-column
         if multi_column_pages >= sample_pages * 0.5:
@@ -370,25 +551,11 @@ class ComplexityAnalyzer:
         formula_count = 0
 
         # Sample first 10 pages
-        sample_pages = min(10, len(doc))
-
-        # Patterns that suggest mathematical formulas
-        math_patterns = [
-            r'\$[^$]+\$',  # LaTeX inline math
-            r'\\\[.+?\\\]',  # LaTeX display math
-            r'\\begin\{equation\}',  # LaTeX equation environment
-            r'∑|∫|∏|√|∞|≤|≥|≠|≈|±',  # Mathematical symbols
-            r'\^[0-9]|\_{[0-9]}',  # Superscripts/subscripts
-        ]
+        sample_pages = min(FORMULA_SAMPLE_PAGES, len(doc))
 
         for page_num in range(sample_pages):
-            page = doc[page_num]
-            text = page.get_text()
-
             # Check for math patterns
-            for pattern in math_patterns:
-                matches = re.findall(pattern, text)
-                formula_count += len(matches)
+            formula_count += _count_formulas(doc[page_num].get_text())
 
         # Estimate for full document
         total_formulas = int(formula_count * len(doc) / sample_pages) if sample_pages > 0 else 0
@@ -418,18 +585,14 @@ class ComplexityAnalyzer:
             int: Scan score.
         """
         # Sample first 5 pages
-        sample_pages = min(5, len(doc))
+        sample_pages = min(SCAN_SAMPLE_PAGES, len(doc))
         low_text_pages = 0
 
         for page_num in range(sample_pages):
             page = doc[page_num]
 
-            # Get text and image count
-            text = page.get_text().strip()
-            images = page.get_images()
-
             # Heuristic: if page has images but very little text, likely scanned
-            if len(images) > 0 and len(text) < 100:
+            if _is_low_text(page.get_text(), len(page.get_images())):
                 low_text_pages += 1
 
         # Calculate scan ratio
@@ -446,7 +609,9 @@ class ComplexityAnalyzer:
         """
         Generate cache key for PDF file (Feature #48).
 
-        Uses file hash to ensure cache invalidation when file changes.
+        Uses file hash to ensure cache invalidation when file changes. The
+        file is hashed in place (see fingerprint_file), never read into one
+        bytes object.
 
         Args:
             file_path: Path to PDF file.
@@ -455,7 +620,7 @@ class ComplexityAnalyzer:
             str: Redis cache key.
         """
         # Calculate file hash for cache key
-        file_hash = hashlib.md5(file_path.read_bytes()).hexdigest()
+        file_hash = fingerprint_file(file_path)
         return f"complexity:{file_hash}"
 
     def _get_cached_score(self, file_path: Path) -> Optional[ComplexityScore]:
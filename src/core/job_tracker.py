@@ -4,20 +4,27 @@ PDF-to-Markdown Extractor - Job Status Tracker (Feature #65).
 Tracks extraction job status in Redis.
 """
 
-import json
-from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
-
+import threading
+import time
+from collections import OrderedDict
+from enum import StrEnum
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import orjson
 from loguru import logger
 
-from src.utils.redis_client import get_redis_client
+from src.utils.redis_client import RedisClient, get_redis_client
 
 
-class JobStatus(Enum):
+class JobStatus(StrEnum):
     """
     Job status enumeration (Feature #65).
 
+    Members are ``str`` instances, so they serialize and compare as their
+    plain string values without ``.value`` lookups.
+
     States:
         PENDING: Job queued, not started yet
         EXTRACTING: Extraction in progress
@@ -33,6 +40,49 @@ class JobStatus(Enum):
     FAILED = "failed"
 
 
+# Batch size for SCAN/MGET when listing jobs
+LIST_BATCH_SIZE = 500
+
+# Unchanged status writes only refresh the TTL, at most this often (seconds)
+TTL_REFRESH_INTERVAL = 10.0
+
+# Number of jobs whose last written status is remembered for deduplication
+DEDUP_CACHE_SIZE = 1024
+
+# Redis key layout: job:<job_id>:status, pre-encoded to skip per-call encoding
+_KEY_PREFIX = b"job:"
+_KEY_SUFFIX = b":status"
+_INDEX_KEYS = {status: f"job:by_status:{status}".encode() for status in JobStatus}
+
+
+def _status_key(job_id: str) -> bytes:
+    """Build the Redis key holding a job's status."""
+    return _KEY_PREFIX + job_id.encode() + _KEY_SUFFIX
+
+
+def to_iso(timestamp_ns: int) -> str:
+    """
+    Format an epoch timestamp in nanoseconds as an ISO UTC string.
+
+    Args:
+        timestamp_ns: Epoch time in nanoseconds, as stored in ``updated_at_ns``.
+
+    Returns:
+        str: ISO 8601 UTC timestamp at one-second resolution,
+             e.g. "2025-12-30T14:30:00".
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(timestamp_ns // 1_000_000_000))
+
+
+def _decode_status(data: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode a stored job status, adding the ISO ``updated_at`` for API responses."""
+    status_data = orjson.loads(data)
+    timestamp_ns = status_data.get("updated_at_ns")
+    if timestamp_ns is not None:
+        status_data.setdefault("updated_at", to_iso(timestamp_ns))
+    return status_data
+
+
 class JobTracker:
     """
     Job status tracker using Redis (Feature #65).
@@ -48,6 +98,9 @@ class JobTracker:
         extracting
     """
 
+    # Redis client shared by all trackers, bound on first use
+    _redis: Optional[RedisClient] = None
+
     def __init__(self, ttl: int = 86400):
         """
         Initialize job tracker.
@@ -55,9 +108,26 @@ class JobTracker:
         Args:
             ttl: TTL for job status in Redis (seconds). Default: 24 hours.
         """
-        self.redis_client = get_redis_client()
         self.ttl = ttl
 
+        # job_id -> (status, integer percent, monotonic time of last write).
+        # The tracker is a process-wide singleton used from several threads,
+        # so every access goes through _last_written_lock
+        self._last_written: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self._last_written_lock = threading.Lock()
+
+    @classmethod
+    def _client(cls) -> RedisClient:
+        """
+        Get the Redis client shared by all JobTracker instances.
+
+        Returns:
+            RedisClient: Redis client.
+        """
+        if cls._redis is None:
+            cls._redis = get_redis_client()
+        return cls._redis
+
     def set_status(
         self,
         job_id: str,
@@ -68,6 +138,10 @@ class JobTracker:
         """
         Store job status in Redis (Features #65-66).
 
+        Repeating the last status written by this tracker with the same
+        integer percentage and no metadata skips the write; the key's TTL
+        is refreshed at most every TTL_REFRESH_INTERVAL seconds instead.
+
         Args:
             job_id: Unique job identifier.
             status: Job status (pending, extracting, comparing, completed, failed).
@@ -83,12 +157,98 @@ class JobTracker:
             ...     progress_percentage=50.0
             ... )
         """
-        key = f"job:{job_id}:status"
+        try:
+            # SET + index update go out in a single round-trip
+            pipe = self._client().get_client().pipeline(transaction=False)
+            if not self._queue_status(pipe, job_id, status, metadata, progress_percentage):
+                return
+            pipe.execute()
+
+            logger.debug(
+                "Job status updated: {} -> {} ({}%)",
+                job_id,
+                status,
+                progress_percentage,
+            )
+
+        except Exception as e:
+            self._forget(job_id)
+            logger.warning(f"Failed to set job status: {e}")
+
+    def set_status_batch(
+        self,
+        updates: List[Tuple[str, JobStatus, Optional[Dict[str, Any]], Optional[float]]],
+    ) -> None:
+        """
+        Store several job status updates in one Redis round-trip (Features #65-66).
+
+        Args:
+            updates: List of (job_id, status, metadata, progress_percentage)
+                     tuples, applied in order.
+
+        Example:
+            >>> tracker = JobTracker()
+            >>> tracker.set_status_batch([
+            ...     ("job-123", JobStatus.COMPLETED, None, 100.0),
+            ...     ("job-456", JobStatus.FAILED, {"error": "timeout"}, None),
+            ... ])
+        """
+        if not updates:
+            return
+
+        try:
+            pipe = self._client().get_client().pipeline(transaction=False)
+            for job_id, status, metadata, progress_percentage in updates:
+                self._queue_status(pipe, job_id, status, metadata, progress_percentage)
+            pipe.execute()
+
+            logger.debug(f"Job statuses updated: {len(updates)} updates")
+
+        except Exception as e:
+            for job_id, *_ in updates:
+                self._forget(job_id)
+            logger.warning(f"Failed to set job statuses: {e}")
+
+    def _queue_status(
+        self,
+        pipe: Any,
+        job_id: str,
+        status: JobStatus,
+        metadata: Optional[Dict[str, Any]],
+        progress_percentage: Optional[float],
+    ) -> bool:
+        """
+        Queue a status write and its index update on a Redis pipeline.
+
+        Args:
+            pipe: Redis pipeline.
+            job_id: Unique job identifier.
+            status: Job status.
+            metadata: Additional job metadata.
+            progress_percentage: Progress percentage 0-100 (Feature #66).
+
+        Returns:
+            bool: False if the update is a duplicate and nothing was queued.
+        """
+        now = time.monotonic()
+        percent = -1 if progress_percentage is None else int(progress_percentage)
+
+        # Skip unchanged progress ticks; only keep the key alive. The check
+        # and the update are one step so concurrent writers cannot interleave
+        with self._last_written_lock:
+            last = self._last_written.get(job_id)
+            if not metadata and last is not None and last[:2] == (status, percent):
+                if now - last[2] < TTL_REFRESH_INTERVAL:
+                    return False
+                pipe.expire(_status_key(job_id), self.ttl)
+                self._remember(job_id, status, percent, now)
+                return True
+            self._remember(job_id, status, percent, now)
 
         status_data = {
             "job_id": job_id,
-            "status": status.value,
-            "updated_at": datetime.utcnow().isoformat(),
+            "status": status,
+            "updated_at_ns": time.time_ns(),
         }
 
         # Feature #66: Add progress percentage
@@ -98,17 +258,30 @@ class JobTracker:
         if metadata:
             status_data["metadata"] = metadata
 
-        try:
-            # Store as JSON
-            self.redis_client.set(key, json.dumps(status_data), ex=self.ttl)
+        # Store as JSON (orjson returns bytes, accepted as-is by redis-py)
+        pipe.set(_status_key(job_id), orjson.dumps(status_data), ex=self.ttl)
 
-            logger.debug(
-                f"Job status updated: {job_id} -> {status.value} "
-                f"({progress_percentage}%)" if progress_percentage else ""
-            )
+        # Keep the per-status secondary index in sync (used by list_jobs)
+        for other in JobStatus:
+            if other is not status:
+                pipe.srem(self._index_key(other), job_id)
 
-        except Exception as e:
-            logger.warning(f"Failed to set job status: {e}")
+        index_key = self._index_key(status)
+        pipe.sadd(index_key, job_id)
+        pipe.expire(index_key, self.ttl)
+        return True
+
+    def _remember(self, job_id: str, status: JobStatus, percent: int, written_at: float) -> None:
+        """Record the last status written for a job (caller holds _last_written_lock)."""
+        self._last_written[job_id] = (status, percent, written_at)
+        self._last_written.move_to_end(job_id)
+        if len(self._last_written) > DEDUP_CACHE_SIZE:
+            self._last_written.popitem(last=False)
+
+    def _forget(self, job_id: str) -> None:
+        """Drop the last status written for a job (e.g. when the write failed)."""
+        with self._last_written_lock:
+            self._last_written.pop(job_id, None)
 
     def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -123,6 +296,7 @@ class JobTracker:
                     'job_id': str,
                     'status': str,
                     'updated_at': str,
+                    'updated_at_ns': int,
                     'metadata': dict (optional),
                 }
 
@@ -132,13 +306,13 @@ class JobTracker:
             >>> if status:
             ...     print(f"Status: {status['status']}")
         """
-        key = f"job:{job_id}:status"
+        key = _status_key(job_id)
 
         try:
-            data = self.redis_client.get(key)
+            data = self._client().get(key)
 
             if data:
-                return json.loads(data)
+                return _decode_status(data)
 
             return None
 
@@ -156,10 +330,15 @@ class JobTracker:
         Returns:
             bool: True if deleted, False otherwise.
         """
-        key = f"job:{job_id}:status"
+        key = _status_key(job_id)
+        self._forget(job_id)
 
         try:
-            deleted_count = self.redis_client.delete(key)
+            pipe = self._client().get_client().pipeline(transaction=False)
+            pipe.delete(key)
+            for status in JobStatus:
+                pipe.srem(self._index_key(status), job_id)
+            deleted_count = pipe.execute()[0]
             return deleted_count > 0
 
         except Exception as e:
@@ -170,6 +349,10 @@ class JobTracker:
         """
         List all jobs, optionally filtered by status.
 
+        Unfiltered listings walk the keyspace with non-blocking SCAN and fetch
+        values in MGET batches. Filtered listings read the per-status index
+        set instead, so only matching jobs are fetched.
+
         Args:
             status_filter: Filter by job status (optional).
 
@@ -181,7 +364,70 @@ class JobTracker:
             >>> pending_jobs = tracker.list_jobs(JobStatus.PENDING)
             >>> print(len(pending_jobs))
         """
-        # This requires scanning Redis keys (not implemented for now)
-        # Will be implemented when needed
-        logger.warning("list_jobs() not yet implemented")
-        return []
+        try:
+            client = self._client().get_client()
+
+            if status_filter is None:
+                keys = client.scan_iter(match="job:*:status", count=LIST_BATCH_SIZE)
+                return self._fetch_jobs(keys)
+
+            index_key = self._index_key(status_filter)
+            job_ids = client.smembers(index_key)
+            jobs = self._fetch_jobs(_status_key(job_id) for job_id in job_ids)
+
+            # Drop index entries whose status key expired or moved on
+            live_ids = {job["job_id"] for job in jobs if job.get("status") == status_filter}
+            stale_ids = set(job_ids) - live_ids
+            if stale_ids:
+                client.srem(index_key, *stale_ids)
+
+            return [job for job in jobs if job["job_id"] in live_ids]
+
+        except Exception as e:
+            logger.warning(f"Failed to list jobs: {e}")
+            return []
+
+    def _fetch_jobs(self, keys: Iterable[Union[str, bytes]]) -> List[Dict[str, Any]]:
+        """
+        Fetch and decode job status values in MGET batches.
+
+        Args:
+            keys: Redis status keys to fetch.
+
+        Returns:
+            list[dict]: Decoded job status data (missing keys skipped).
+        """
+        client = self._client().get_client()
+        keys = iter(keys)
+        jobs = []
+
+        while batch := list(islice(keys, LIST_BATCH_SIZE)):
+            for data in client.mget(batch):
+                if data:
+                    jobs.append(_decode_status(data))
+
+        return jobs
+
+    @staticmethod
+    def _index_key(status: JobStatus) -> bytes:
+        """Get the Redis key of the secondary index set for a status."""
+        return _INDEX_KEYS[status]
+
+
+@lru_cache(maxsize=1)
+def get_job_tracker(ttl: int = 86400) -> JobTracker:
+    """
+    Get the shared JobTracker instance.
+
+    Args:
+        ttl: TTL for job status in Redis (seconds). Default: 24 hours.
+
+    Returns:
+        JobTracker: Job tracker.
+
+    Example:
+        >>> from src.core.job_tracker import get_job_tracker
+        >>> tracker = get_job_tracker()
+        >>> tracker.set_status("job-123", JobStatus.PENDING)
+    """
+    return JobTracker(ttl=ttl)
@@ -4,7 +4,7 @@ PDF-to-Markdown Extractor - Result Merger (Features #84-87).
 Merges extraction results using various strategies.
 """
 
-from enum import Enum
+from enum import StrEnum
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -13,10 +13,13 @@ from src.core.comparator import Divergence, ExtractionComparator
 from src.extractors.base import ExtractionResult
 
 
-class MergeStrategy(Enum):
+class MergeStrategy(StrEnum):
     """
     Merge strategies (Feature #85).
 
+    Members are ``str`` instances, so strategy checks are plain string
+    comparisons.
+
     Strategies:
         PREFER_DOCLING: Always prefer Docling results
         PREFER_MINERU: Always prefer MinerU results
@@ -56,7 +59,7 @@ class ExtractionMerger:
         """
         self.strategy = strategy
         self.comparator = comparator or ExtractionComparator()
-        logger.debug(f"ExtractionMerger initialized (strategy={strategy.value})")
+        logger.debug(f"ExtractionMerger initialized (strategy={strategy})")
 
     def select_best_extraction(
         self,
@@ -85,37 +88,36 @@ class ExtractionMerger:
             logger.warning("No results to select from")
             return None
 
-        # Filter successful results
-        successful = {
-            name: result
-            for name, result in results.items()
-            if result.success
-        }
-
-        if not successful:
-            logger.error("No successful results to select from")
-            return None
-
         # Apply strategy (Feature #85)
         if self.strategy == MergeStrategy.PREFER_DOCLING:
-            if "docling" in successful:
+            preferred = results.get("docling")
+            if preferred is not None and preferred.success:
                 logger.info("Selected Docling (strategy: prefer_docling)")
-                return successful["docling"]
+                return preferred
 
         elif self.strategy == MergeStrategy.PREFER_MINERU:
-            if "mineru" in successful:
+            preferred = results.get("mineru")
+            if preferred is not None and preferred.success:
                 logger.info("Selected MinerU (strategy: prefer_mineru)")
-                return successful["mineru"]
+                return preferred
 
-        # Default: HIGHEST_CONFIDENCE (Feature #84)
-        best_name, best_result = max(
-            successful.items(),
-            key=lambda item: item[1].confidence_score
-        )
+        # Default: HIGHEST_CONFIDENCE (Feature #84), single pass over successful results
+        best_name, best_result = None, None
+        best_confidence = -1.0
+
+        for name, result in results.items():
+            if not result.success:
+                continue
+            if result.confidence_score > best_confidence:
+                best_confidence, best_name, best_result = result.confidence_score, name, result
+
+        if best_result is None:
+            logger.error("No successful results to select from")
+            return None
 
         logger.info(
             f"Selected {best_name} (confidence={best_result.confidence_score}, "
-            f"strategy={self.strategy.value})"
+            f"strategy={self.strategy})"
         )
 
         return best_result
@@ -150,8 +152,7 @@ class ExtractionMerger:
 
         # If only one result, return it
         if len(results) == 1:
-            result = list(results.values())[0]
-            return result.markdown
+            return next(iter(results.values())).markdown
 
         # For multiple results, use strategy
         best_result = self.select_best_extraction(results)
@@ -159,7 +160,7 @@ class ExtractionMerger:
         if best_result:
             logger.info(
                 f"Using {best_result.extractor_name} as base for merged document "
-                f"(strategy={self.strategy.value})"
+                f"(strategy={self.strategy})"
             )
             return best_result.markdown
 
@@ -187,17 +188,21 @@ class ExtractionMerger:
             >>> if merger.check_needs_review(divergences):
             ...     print("Human arbitration required")
         """
-        needs_review = len(divergences) > threshold
+        divergence_count = len(divergences)
+        needs_review = divergence_count > threshold
 
+        # Brace-style args are only formatted if a sink accepts the level
         if needs_review:
             logger.warning(
-                f"Human review needed: {len(divergences)} divergences "
-                f"(threshold: {threshold})"
+                "Human review needed: {} divergences (threshold: {})",
+                divergence_count,
+                threshold,
             )
         else:
             logger.info(
-                f"No review needed: {len(divergences)} divergences "
-                f"(threshold: {threshold})"
+                "No review needed: {} divergences (threshold: {})",
+                divergence_count,
+                threshold,
             )
 
         return needs_review
@@ -5,17 +5,180 @@ Coordinates PDF extraction workflows, routes documents to appropriate
 extractors based on complexity, and manages multi-extraction strategies.
 """
 
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 
 from src.core.aggregator import ExtractionAggregator
 from src.core.complexity import ComplexityAnalyzer, ComplexityScore
-from src.core.config import settings
+from src.core.config import Settings, get_settings
 from src.core.parallel_executor import ParallelExecutor
-from src.core.registry import ExtractorRegistry
+from src.core.registry import get_registry
 from src.extractors.base import BaseExtractor, ExtractionResult
+from src.utils.file_utils import prefetch_file
+
+# Number of complexity analyses memoized per orchestrator
+COMPLEXITY_CACHE_SIZE = 128
+
+# Fallback chain priority: Docling → MinerU → Mistral
+FALLBACK_ORDER = ("docling", "mineru", "mistral")
+
+# Complexity levels, from least to most complex
+COMPLEXITY_LEVELS = ("simple", "medium", "complex")
+
+# Scores for forced complexity levels (Feature #49). Only page_count_score is
+# set, to a value that produces the desired classification. Shared instances:
+# treat as read-only.
+_FORCED_COMPLEXITY: Dict[str, ComplexityScore] = {
+    "simple": ComplexityScore(page_count_score=0),     # <= 10 = simple
+    "medium": ComplexityScore(page_count_score=20),    # 11-35 = medium
+    "complex": ComplexityScore(page_count_score=50),   # > 35 = complex
+}
+
+# Extractors used by each strategy, in priority order
+STRATEGY_EXTRACTORS = {
+    "fallback": FALLBACK_ORDER,
+    "parallel_local": ("docling", "mineru"),
+    "parallel_all": ("docling", "mineru", "mistral"),
+}
+
+
+class _LazyComplexity:
+    """
+    ComplexityScore stand-in that runs the analysis on first use.
+
+    Attribute access (complexity_level, total_score, to_dict(), ...) is
+    delegated to the resolved score.
+    """
+
+    __slots__ = ("_resolve", "_score")
+
+    def __init__(self, resolve: Callable[[], ComplexityScore]):
+        self._resolve = resolve
+        self._score: Optional[ComplexityScore] = None
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the analysis has already run."""
+        return self._score is not None
+
+    def get(self) -> ComplexityScore:
+        """Run the analysis if not done yet and return the score."""
+        if self._score is None:
+            self._score = self._resolve()
+        return self._score
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+
+@dataclass(slots=True)
+class ExtractionOutcome:
+    """
+    Outcome of Orchestrator.extract() (Feature #45).
+
+    Attributes:
+        result: Best extraction result (None if a parallel run produced none).
+        complexity_score: Complexity analysis of the document. For the
+            fallback strategy, the analysis runs on first access.
+        strategy_used: Strategy that actually ran.
+        all_results: Per-extractor results (parallel strategies only).
+        aggregation: Aggregation summary (parallel strategies only).
+        strategy_downgraded_from: Requested parallel strategy, when a simple
+            document was routed to fallback instead.
+
+    For callers written against the previous dict return value, read-only
+    mapping access is supported: ``outcome["result"]``,
+    ``"aggregation" in outcome``, ``outcome.get("all_results")``.
+    Optional keys are only present when set.
+    """
+
+    result: Optional[ExtractionResult]
+    complexity_score: Union[ComplexityScore, _LazyComplexity]
+    strategy_used: str
+    all_results: Optional[Dict[str, ExtractionResult]] = None
+    aggregation: Optional[Dict[str, Any]] = None
+    strategy_downgraded_from: Optional[str] = None
+
+    @property
+    def complexity(self) -> Dict[str, Any]:
+        """Complexity analysis as a dictionary (ComplexityScore.to_dict())."""
+        return self.complexity_score.to_dict()
+
+    @property
+    def complexity_analyzed(self) -> bool:
+        """Whether the complexity analysis has run (reading complexity runs it)."""
+        score = self.complexity_score
+        return not isinstance(score, _LazyComplexity) or score.resolved
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the dictionary form (optional keys only when set).
+
+        Returns:
+            dict: {"result", "complexity", "strategy_used", ...}.
+        """
+        data = {
+            "result": self.result,
+            "complexity": self.complexity,
+            "strategy_used": self.strategy_used,
+        }
+        for key in _OUTCOME_OPTIONAL_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _OUTCOME_KEYS or (
+            key in _OUTCOME_OPTIONAL_KEYS and getattr(self, key) is not None
+        ):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-style get (see class docstring)."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+_OUTCOME_KEYS = frozenset({"result", "complexity", "strategy_used"})
+_OUTCOME_OPTIONAL_KEYS = ("all_results", "aggregation", "strategy_downgraded_from")
+
+
+def _stat_pdf(file_path: Path) -> os.stat_result:
+    """
+    Stat a PDF file, raising the orchestrator's not-found error if missing.
+
+    Args:
+        file_path: Path to PDF file.
+
+    Returns:
+        os.stat_result: File status.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+    """
+    try:
+        return os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF file not found: {file_path}") from None
 
 
 class Orchestrator:
@@ -35,12 +198,38 @@ class Orchestrator:
     """
 
     def __init__(self):
-        """Initialize orchestrator with ExtractorRegistry (Feature #56)."""
-        self.registry = ExtractorRegistry()
+        """Initialize orchestrator with the shared ExtractorRegistry (Feature #56)."""
+        settings = get_settings()
+        self.registry = get_registry()
         self.complexity_analyzer = ComplexityAnalyzer()
-        self.parallel_executor = ParallelExecutor()  # Feature #61
+        self.parallel_executor = ParallelExecutor(  # Feature #61
+            max_workers=settings.parallel_max_workers,
+            use_processes=settings.parallel_use_processes,
+        )
         self.aggregator = ExtractionAggregator()  # Feature #61
-        logger.info(f"Orchestrator initialized with {self.registry.count()} extractors")
+
+        # Memoize complexity per file identity (path, mtime, size) so retries
+        # and strategy reruns on the same document skip re-parsing the PDF
+        self._analyze_cached = lru_cache(maxsize=COMPLEXITY_CACHE_SIZE)(self._analyze_file)
+
+        # In-flight extractions by request identity, for request coalescing
+        self._inflight: Dict[Tuple[Any, ...], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Strategy dispatch table and per-strategy extractors, built once
+        self._strategies: Dict[str, Callable[..., ExtractionOutcome]] = {
+            "fallback": self._run_fallback,
+            "parallel_local": self._run_parallel_local,
+            "parallel_all": self._run_parallel_all,
+        }
+        self.refresh_extractors()
+
+        # Background threads for extractor warmup (model loading)
+        self._prewarm_pool = ThreadPoolExecutor(
+            max_workers=len(FALLBACK_ORDER), thread_name_prefix="prewarm"
+        )
+
+        logger.info("Orchestrator initialized with {} extractors", self.registry.count())
 
     def extract(
         self,
@@ -48,7 +237,7 @@ class Orchestrator:
         strategy: Optional[str] = None,
         force_complexity: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ExtractionOutcome:
         """
         Extract PDF with complexity-based routing (Feature #45).
 
@@ -64,12 +253,9 @@ class Orchestrator:
             options: Extraction options to pass to extractors.
 
         Returns:
-            dict: Extraction result with complexity analysis.
-                {
-                    "result": ExtractionResult,
-                    "complexity": ComplexityScore.to_dict(),
-                    "strategy_used": str,
-                }
+            ExtractionOutcome: Extraction result with complexity analysis
+                (result, complexity, strategy_used, and for parallel strategies
+                all_results and aggregation).
 
         Raises:
             FileNotFoundError: If file doesn't exist.
@@ -77,164 +263,600 @@ class Orchestrator:
         Example:
             >>> orchestrator = Orchestrator()
             >>> result = orchestrator.extract(Path("doc.pdf"))
-            >>> print(result["complexity"]["complexity_level"])
+            >>> print(result.complexity_score.complexity_level)
             medium
-            >>> print(result["result"].markdown)
+            >>> print(result.result.markdown)
         """
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
+        # Validate file exists; the stat also keys the complexity cache
+        stat = _stat_pdf(file_path)
 
         # Determine strategy
+        settings = get_settings()
         strategy = strategy or settings.default_extraction_strategy
 
+        if not settings.enable_request_coalescing:
+            return self._extract(file_path, stat, strategy, force_complexity, options, settings)
+
+        # Concurrent identical requests share one extraction (single-flight)
+        key = (
+            str(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            strategy,
+            force_complexity,
+            repr(sorted(options.items())) if options else None,
+        )
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+
+        if not is_leader:
+            logger.info("Joining in-flight extraction: {}", file_path.name)
+            return future.result()
+
+        try:
+            outcome = self._extract(file_path, stat, strategy, force_complexity, options, settings)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(outcome)
+            return outcome
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _extract(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        strategy: str,
+        force_complexity: Optional[str],
+        options: Optional[Dict[str, Any]],
+        settings: Settings,
+    ) -> ExtractionOutcome:
+        """
+        Run an extraction for extract() once the file and strategy are resolved.
+
+        Args:
+            file_path: Path to PDF file.
+            stat: File status.
+            strategy: Extraction strategy.
+            force_complexity: Forced complexity level, if any.
+            options: Extraction options to pass to extractors.
+            settings: Application settings.
+
+        Returns:
+            ExtractionOutcome: Extraction result with complexity analysis.
+        """
+        # Warm the page cache while we analyze / set up the extractor
+        prefetch_file(file_path)
+
+        # Warm up the strategy's extractors while complexity is analyzed
+        prewarm_futures = self._prewarm(strategy, file_path)
+
         # Analyze complexity (Feature #45)
         if force_complexity:
             # Feature #49: Force complexity option
-            logger.info(f"Forcing complexity level: {force_complexity}")
+            logger.info("Forcing complexity level: {}", force_complexity)
             # Create a fake complexity score with forced level
             complexity_score = self._create_forced_complexity(force_complexity)
         else:
-            # Normal complexity analysis
-            logger.info(f"Analyzing document complexity: {file_path.name}")
-            complexity_score = self.complexity_analyzer.analyze(file_path)
+            # Normal complexity analysis. The fallback chain never routes on
+            # complexity, so there it only runs if a consumer reads it.
+            complexity_score = _LazyComplexity(lambda: self._analyze(file_path, stat))
+            if strategy != "fallback" or settings.always_analyze_complexity:
+                complexity_score.get()
+
+        # Parallel extraction is wasted on documents a single pass handles well
+        downgraded_from = None
+        if (
+            strategy in ("parallel_local", "parallel_all")
+            and not force_complexity
+            and COMPLEXITY_LEVELS.index(complexity_score.complexity_level)
+            < COMPLEXITY_LEVELS.index(settings.multi_extractor_min_complexity)
+        ):
             logger.info(
-                f"Complexity: {complexity_score.complexity_level} "
-                f"(score: {complexity_score.total_score})"
+                "Downgrading strategy to fallback for {} document",
+                complexity_score.complexity_level,
             )
+            downgraded_from, strategy = strategy, "fallback"
+
+        wait(prewarm_futures)
 
         # Route based on complexity and strategy (Feature #61)
-        logger.info(f"Using extraction strategy: {strategy}")
+        logger.info("Using extraction strategy: {}", strategy)
+
+        handler = self._strategies.get(strategy)
+        if handler is None:
+            # hybrid not yet implemented
+            logger.warning(
+                "Strategy '{}' not yet implemented, using fallback strategy", strategy
+            )
+            handler = self._run_hybrid_fallback
+
+        outcome = handler(file_path, options, complexity_score)
+        outcome.strategy_downgraded_from = downgraded_from
+        return outcome
+
+    def extract_batch(
+        self,
+        paths: Iterable[Path],
+        strategy: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        max_inflight: int = 8,
+    ) -> Iterator[Tuple[Path, Optional[ExtractionOutcome]]]:
+        """
+        Extract many PDFs through one shared thread pool.
 
-        # Feature #61: Use parallel extraction for complex documents
+        Files are submitted as earlier ones finish, with at most max_inflight
+        extractions running at a time, and results are yielded in completion
+        order. For parallel strategies, max_inflight is capped so the total
+        number of concurrent extractors stays within the CPU count.
+
+        Args:
+            paths: PDF file paths.
+            strategy: Extraction strategy (see extract()).
+            options: Extraction options to pass to extractors.
+            max_inflight: Maximum number of files extracted concurrently.
+
+        Yields:
+            tuple: (file_path, extract() response), or (file_path, None) if
+                   the extraction raised (the error is logged).
+
+        Example:
+            >>> orchestrator = Orchestrator()
+            >>> for path, response in orchestrator.extract_batch(Path("docs").glob("*.pdf")):
+            ...     if response:
+            ...         print(path.name, response.result.confidence_score)
+        """
+        strategy = strategy or get_settings().default_extraction_strategy
+        if strategy in ("parallel_local", "parallel_all"):
+            extractors_per_file = self.parallel_executor.max_workers
+            max_inflight = min(max_inflight, (os.cpu_count() or 1) // extractors_per_file)
+        max_inflight = max(1, max_inflight)
+
+        paths = iter(paths)
+        pending: Dict[Future, Path] = {}
+
+        with ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="batch") as pool:
+
+            def submit_next() -> None:
+                file_path = next(paths, None)
+                if file_path is not None:
+                    future = pool.submit(self.extract, file_path, strategy=strategy, options=options)
+                    pending[future] = file_path
+
+            for _ in range(max_inflight):
+                submit_next()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = pending.pop(future)
+                    submit_next()
+
+                    try:
+                        yield file_path, future.result()
+                    except Exception as e:
+                        logger.error("Batch extraction failed for {}: {}", file_path.name, e)
+                        yield file_path, None
+
+    def refresh_extractors(self) -> None:
+        """
+        Reset the extractor cache and recompute the extractors of each strategy.
+
+        Called at init; call again if the registry contents change.
+        """
+        self._extractor_cache: Dict[str, Optional[BaseExtractor]] = {}
+
+        # Available extractor keys, instances and display names per strategy
+        self._strategy_names: Dict[str, List[str]] = {}
+        self._strategy_extractors: Dict[str, List[BaseExtractor]] = {}
+        self._strategy_names_str: Dict[str, str] = {}
+
+        for strategy, names in STRATEGY_EXTRACTORS.items():
+            available = [name for name in names if self._resolve(name) is not None]
+            extractors = [self._resolve(name) for name in available]
+
+            self._strategy_names[strategy] = available
+            self._strategy_extractors[strategy] = extractors
+            self._strategy_names_str[strategy] = ", ".join(e.name for e in extractors)
+
+            if strategy != "fallback" and len(extractors) < 2:
+                logger.info(
+                    "Strategy '{}' unavailable ({} of {} extractors), will use fallback",
+                    strategy,
+                    len(extractors),
+                    len(names),
+                )
+
+    def _resolve(self, name: str) -> Optional[BaseExtractor]:
+        """
+        Get an extractor by name, caching the registry lookup (Feature #56).
+
+        Args:
+            name: Extractor name or key.
+
+        Returns:
+            BaseExtractor: Extractor instance or None if not available.
+        """
+        try:
+            return self._extractor_cache[name]
+        except KeyError:
+            extractor = self.registry.get(name) if self.registry.has_extractor(name) else None
+            self._extractor_cache[name] = extractor
+            return extractor
+
+    def _prewarm(self, strategy: str, file_path: Path) -> List[Future]:
+        """
+        Start warming up the extractors a strategy is certain to run.
+
+        The fallback chain always starts with its first extractor; parallel
+        strategies run all of theirs. Warmup failures are logged and ignored,
+        the extraction itself will surface any real problem.
+
+        Args:
+            strategy: Extraction strategy.
+            file_path: Path to PDF file.
+
+        Returns:
+            list[Future]: Warmup futures to wait on before extracting.
+        """
+        extractors = self._strategy_extractors.get(strategy, [])
         if strategy == "fallback":
-            # Try extractors in order: Docling → MinerU → Mistral
-            fallback_order = ["docling", "mineru", "mistral"]
-            result = None
-            last_error = None
-
-            for extractor_name in fallback_order:
-                if not self.registry.has_extractor(extractor_name):
-                    logger.debug(f"Extractor '{extractor_name}' not available in fallback chain, skipping")
-                    continue
+            extractors = extractors[:1]
+
+        return [
+            self._prewarm_pool.submit(self._prewarm_extractor, extractor, file_path)
+            for extractor in extractors
+        ]
+
+    @staticmethod
+    def _prewarm_extractor(extractor: BaseExtractor, file_path: Path) -> None:
+        """Run an extractor's prewarm hook, logging failures."""
+        try:
+            extractor.prewarm(file_path)
+        except Exception as e:
+            logger.debug("{} prewarm failed: {}", extractor.name, e)
+
+    def _run_fallback(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        complexity_score: ComplexityScore,
+    ) -> ExtractionOutcome:
+        """Run the fallback strategy: Docling → MinerU → Mistral."""
+        settings = get_settings()
+        if settings.fallback_mode == "hedged":
+            result, last_error = self._run_fallback_hedged(
+                file_path, options, settings.fallback_hedge_ms / 1000
+            )
+        else:
+            result, last_error = self._run_fallback_sequential(file_path, options)
+
+        # If all extractors failed, return last result or raise
+        if not result or not result.success:
+            logger.error("All extractors in fallback chain failed. Last error: {}", last_error)
+            # Return failed result if we have one, otherwise raise
+            if not result:
+                raise ValueError(f"All extractors in fallback chain failed: {last_error}")
 
-                logger.info(f"Fallback: trying {extractor_name}...")
-                try:
-                    result = self.extract_simple(file_path, extractor_name=extractor_name, options=options)
+        return ExtractionOutcome(
+            result=result,
+            complexity_score=complexity_score,
+            strategy_used="fallback",
+        )
+
+    def _run_parallel_local(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        complexity_score: ComplexityScore,
+    ) -> ExtractionOutcome:
+        """Run parallel extraction with local extractors only (Docling + MinerU)."""
+        return self._run_parallel("parallel_local", file_path, options, complexity_score)
 
-                    if result.success:
-                        logger.info(f"✅ Fallback successful with {extractor_name} (confidence: {result.confidence_score})")
-                        break
+    def _run_parallel_all(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        complexity_score: ComplexityScore,
+    ) -> ExtractionOutcome:
+        """Run parallel extraction with ALL extractors (Docling + MinerU + Mistral)."""
+        return self._run_parallel("parallel_all", file_path, options, complexity_score)
+
+    def _run_parallel(
+        self,
+        strategy: str,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        complexity_score: ComplexityScore,
+    ) -> ExtractionOutcome:
+        """
+        Run a parallel strategy and aggregate the results (Feature #61).
+
+        Falls back to a single Docling extraction when fewer than two of the
+        strategy's extractors are available.
+
+        Args:
+            strategy: Parallel strategy name (parallel_local, parallel_all).
+            file_path: Path to PDF file.
+            options: Extraction options to pass to extractors.
+            complexity_score: Complexity analysis of the document.
+
+        Returns:
+            ExtractionOutcome: Extraction result with aggregation and complexity analysis.
+        """
+        extractors_to_use = self._strategy_extractors[strategy]
+
+        if len(extractors_to_use) < 2:
+            logger.warning("Not enough extractors available for {}, using fallback", strategy)
+            result = self._extract_single(file_path, extractor_name="docling", options=options)
+            return ExtractionOutcome(
+                result=result,
+                complexity_score=complexity_score,
+                strategy_used="fallback",
+            )
+
+        logger.info(
+            "Running parallel extraction with {} extractors: {}",
+            len(extractors_to_use),
+            self._strategy_names_str[strategy],
+        )
+
+        # Aggregate results as extractors complete, optionally stopping early
+        early_exit_confidence = get_settings().early_exit_confidence
+        results: Dict[str, ExtractionResult] = {}
+        aggregation = None
+
+        stream = self.parallel_executor.execute_streaming(extractors_to_use, file_path, options)
+        for name, result in stream:
+            results[name] = result
+            aggregation = self.aggregator.update(aggregation, name, result)
+
+            best_result = aggregation["best_result"]
+            if (
+                early_exit_confidence is not None
+                and best_result is not None
+                and best_result.confidence_score >= early_exit_confidence
+                and len(results) < len(extractors_to_use)
+            ):
+                logger.info(
+                    "Early exit: {} reached confidence {:.2f} (threshold {:.2f})",
+                    name,
+                    best_result.confidence_score,
+                    early_exit_confidence,
+                )
+                stream.close()
+                break
+
+        if aggregation is None:
+            aggregation = self.aggregator.aggregate(results)
+
+        return ExtractionOutcome(
+            result=aggregation["best_result"],
+            complexity_score=complexity_score,
+            strategy_used=strategy,
+            all_results=results,
+            aggregation=aggregation,
+        )
+
+    def _run_hybrid_fallback(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        complexity_score: ComplexityScore,
+    ) -> ExtractionOutcome:
+        """Run unknown strategies (hybrid not yet implemented) as a Docling extraction."""
+        result = self._extract_single(file_path, extractor_name="docling", options=options)
+
+        return ExtractionOutcome(
+            result=result,
+            complexity_score=complexity_score,
+            strategy_used="fallback",
+        )
+
+    def _run_fallback_sequential(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[ExtractionResult], Optional[str]]:
+        """
+        Try fallback extractors one at a time until one succeeds.
+
+        An extractor with a time budget in settings.per_extractor_timeout_s
+        is abandoned once the budget runs out and the chain moves on. The
+        abandoned run cannot be interrupted; it finishes in the background
+        and its result is discarded.
+
+        Args:
+            file_path: Path to PDF file.
+            options: Extraction options to pass to extractors.
+
+        Returns:
+            tuple: (last result or None, last error message or None).
+        """
+        budgets = get_settings().per_extractor_timeout_s
+        result = None
+        last_error = None
+
+        for extractor_name in self._strategy_names["fallback"]:
+            logger.info("Fallback: trying {}...", extractor_name)
+            budget = budgets.get(extractor_name)
+            try:
+                if budget is None:
+                    candidate = self._extract_single(file_path, extractor_name=extractor_name, options=options)
+                else:
+                    candidate = self._extract_with_budget(file_path, extractor_name, options, budget)
+            except FutureTimeoutError:
+                logger.warning("❌ {} exceeded its {}s budget, trying next", extractor_name, budget)
+                last_error = f"{extractor_name} exceeded its {budget}s budget"
+                continue
+            except Exception as e:
+                logger.warning("❌ {} raised exception: {}, trying next", extractor_name, e)
+                last_error = str(e)
+                continue
+
+            result = candidate
+            if result.success:
+                logger.info("✅ Fallback successful with {} (confidence: {})", extractor_name, result.confidence_score)
+                break
+
+            logger.warning("❌ {} failed (success=False), trying next in chain", extractor_name)
+            last_error = f"{extractor_name} returned success=False"
+
+        return result, last_error
+
+    def _extract_with_budget(
+        self,
+        file_path: Path,
+        extractor_name: str,
+        options: Optional[Dict[str, Any]],
+        budget: float,
+    ) -> ExtractionResult:
+        """
+        Run a single extractor, giving up after budget seconds.
+
+        Args:
+            file_path: Path to PDF file.
+            extractor_name: Name of extractor to use.
+            options: Extraction options to pass to extractor.
+            budget: Time budget in seconds.
+
+        Returns:
+            ExtractionResult: Extraction result.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the budget runs out.
+        """
+        # One-off thread, so an abandoned run never delays the next extractor
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"fallback-{extractor_name}")
+        try:
+            future = pool.submit(self._extract_single, file_path, extractor_name=extractor_name, options=options)
+            return future.result(timeout=budget)
+        finally:
+            pool.shutdown(wait=False)
+
+    def _run_fallback_hedged(
+        self,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+        hedge_delay: float,
+    ) -> Tuple[Optional[ExtractionResult], Optional[str]]:
+        """
+        Race fallback extractors, hedging slow ones with the next in the chain.
+
+        The top-priority extractor starts immediately. The next one starts
+        when every running extractor has failed, or when none has finished
+        within hedge_delay seconds. The first successful result wins; losers
+        that have not started are cancelled, running ones are left to finish
+        in the background.
+
+        Args:
+            file_path: Path to PDF file.
+            options: Extraction options to pass to extractors.
+            hedge_delay: Seconds to wait for a result before hedging.
+
+        Returns:
+            tuple: (winning or last result or None, last error message or None).
+        """
+        names = self._strategy_names["fallback"]
+        if not names:
+            return None, None
+
+        result = None
+        last_error = None
+        pending: Dict[Future, str] = {}
+        pool = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="fallback")
+        launched = 0
+
+        def launch_next() -> None:
+            nonlocal launched
+            name = names[launched]
+            launched += 1
+            logger.info("Fallback: starting {}...", name)
+            future = pool.submit(self._extract_single, file_path, extractor_name=name, options=options)
+            pending[future] = name
+
+        try:
+            launch_next()
+
+            while pending:
+                timeout = hedge_delay if launched < len(names) else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    logger.info("Fallback: no result after {:.1f}s, hedging", hedge_delay)
+                    launch_next()
+                    continue
+
+                # Prefer the higher-priority extractor when several finish together
+                for future in sorted(done, key=lambda f: names.index(pending[f])):
+                    extractor_name = pending.pop(future)
+                    try:
+                        candidate = future.result()
+                    except Exception as e:
+                        logger.warning("❌ {} raised exception: {}, trying next", extractor_name, e)
+                        last_error = str(e)
                     else:
-                        logger.warning(f"❌ {extractor_name} failed (success=False), trying next in chain")
+                        result = candidate
+                        if candidate.success:
+                            logger.info("✅ Fallback successful with {} (confidence: {})", extractor_name, candidate.confidence_score)
+                            return result, last_error
+                        logger.warning("❌ {} failed (success=False), trying next in chain", extractor_name)
                         last_error = f"{extractor_name} returned success=False"
-                except Exception as e:
-                    logger.warning(f"❌ {extractor_name} raised exception: {e}, trying next")
-                    last_error = str(e)
-                    continue
 
-            # If all extractors failed, return last result or raise
-            if not result or not result.success:
-                logger.error(f"All extractors in fallback chain failed. Last error: {last_error}")
-                # Return failed result if we have one, otherwise raise
-                if result:
-                    return {
-                        "result": result,
-                        "complexity": complexity_score.to_dict(),
-                        "strategy_used": strategy,
-                    }
-                raise ValueError(f"All extractors in fallback chain failed: {last_error}")
+                    if launched < len(names):
+                        launch_next()
 
-            return {
-                "result": result,
-                "complexity": complexity_score.to_dict(),
-                "strategy_used": strategy,
-            }
-
-        elif strategy == "parallel_local":
-            # Parallel extraction with local extractors only (Docling + MinerU)
-            extractors_to_use = []
-
-            if self.registry.has_extractor("docling"):
-                extractors_to_use.append(self.registry.get("docling"))
-            if self.registry.has_extractor("mineru"):
-                extractors_to_use.append(self.registry.get("mineru"))
-
-            if len(extractors_to_use) < 2:
-                logger.warning("Not enough local extractors available, using fallback")
-                result = self.extract_simple(file_path, extractor_name="docling", options=options)
-                return {
-                    "result": result,
-                    "complexity": complexity_score.to_dict(),
-                    "strategy_used": "fallback",
-                }
-
-            # Run parallel extraction
-            results = self.parallel_executor.execute(extractors_to_use, file_path, options)
-
-            # Aggregate results
-            aggregation = self.aggregator.aggregate(results)
+            return result, last_error
 
-            return {
-                "result": aggregation["best_result"],
-                "all_results": results,
-                "aggregation": aggregation,
-                "complexity": complexity_score.to_dict(),
-                "strategy_used": strategy,
-            }
-
-        elif strategy == "parallel_all":
-            # Parallel extraction with ALL extractors (Docling + MinerU + Mistral)
-            extractors_to_use = []
-
-            # Add all available extractors
-            for extractor_name in ["docling", "mineru", "mistral"]:
-                if self.registry.has_extractor(extractor_name):
-                    extractors_to_use.append(self.registry.get(extractor_name))
-
-            if len(extractors_to_use) < 2:
-                logger.warning("Not enough extractors available for parallel_all, using fallback")
-                result = self.extract_simple(file_path, extractor_name="docling", options=options)
-                return {
-                    "result": result,
-                    "complexity": complexity_score.to_dict(),
-                    "strategy_used": "fallback",
-                }
-
-            logger.info(f"Running parallel extraction with {len(extractors_to_use)} extractors: {[e.name for e in extractors_to_use]}")
-
-            # Run parallel extraction
-            results = self.parallel_executor.execute(extractors_to_use, file_path, options)
-
-            # Aggregate results
-            aggregation = self.aggregator.aggregate(results)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-            return {
-                "result": aggregation["best_result"],
-                "all_results": results,
-                "aggregation": aggregation,
-                "complexity": complexity_score.to_dict(),
-                "strategy_used": strategy,
-            }
+    def _analyze(self, file_path: Path, stat: os.stat_result) -> ComplexityScore:
+        """
+        Analyze document complexity, memoized by file identity (Feature #45).
 
-        else:
-            # hybrid not yet implemented
-            logger.warning(
-                f"Strategy '{strategy}' not yet implemented, using fallback strategy"
-            )
-            result = self.extract_simple(file_path, extractor_name="docling", options=options)
+        Args:
+            file_path: Path to PDF file.
+            stat: File status, used as part of the cache key.
 
-            return {
-                "result": result,
-                "complexity": complexity_score.to_dict(),
-                "strategy_used": "fallback",
-            }
+        Returns:
+            ComplexityScore: Complexity scoring result.
+        """
+        logger.info("Analyzing document complexity: {}", file_path.name)
+        complexity_score = self._analyze_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+        logger.info(
+            "Complexity: {} (score: {})",
+            complexity_score.complexity_level,
+            complexity_score.total_score,
+        )
+        return complexity_score
+
+    def _analyze_file(self, path: str, mtime_ns: int, size: int) -> ComplexityScore:
+        """
+        Analyze document complexity (memoized through _analyze_cached).
+
+        Args:
+            path: PDF file path.
+            mtime_ns: File modification time in nanoseconds (cache key only).
+            size: File size in bytes (cache key only).
+
+        Returns:
+            ComplexityScore: Complexity scoring result.
+        """
+        return self.complexity_analyzer.analyze(Path(path))
 
     def _create_forced_complexity(self, level: str) -> ComplexityScore:
         """
-        Create a ComplexityScore with forced complexity level.
+        Get the ComplexityScore for a forced complexity level.
 
-        This is used when force_complexity parameter is provided.
+        This is used when force_complexity parameter is provided. Scores are
+        shared, precomputed instances; unknown levels map to simple.
 
         Args:
             level: Forced complexity level (simple, medium, complex).
@@ -242,24 +864,7 @@ class Orchestrator:
         Returns:
             ComplexityScore: Score with forced level.
         """
-        # Map levels to scores that produce the desired classification
-        score_map = {
-            "simple": 0,    # <= 10 = simple
-            "medium": 20,   # 11-35 = medium
-            "complex": 50,  # > 35 = complex
-        }
-
-        total_score = score_map.get(level, 0)
-
-        # Return ComplexityScore with all zeros except one component
-        return ComplexityScore(
-            page_count_score=total_score,
-            table_score=0,
-            column_score=0,
-            image_score=0,
-            formula_score=0,
-            scan_score=0,
-        )
+        return _FORCED_COMPLEXITY.get(level, _FORCED_COMPLEXITY["simple"])
 
     def extract_simple(
         self,
@@ -291,15 +896,40 @@ class Orchestrator:
             >>> print(result.markdown)
         """
         # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
+        _stat_pdf(file_path)
+
+        # Warm the page cache while we analyze / set up the extractor
+        prefetch_file(file_path)
+
+        return self._extract_single(file_path, extractor_name, options)
+
+    def _extract_single(
+        self,
+        file_path: Path,
+        extractor_name: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> ExtractionResult:
+        """
+        Run a single extractor on a file already validated by the caller.
+
+        Args:
+            file_path: Path to PDF file.
+            extractor_name: Name of extractor to use (default: "docling").
+            options: Extraction options to pass to extractor.
+
+        Returns:
+            ExtractionResult: Extraction result.
+
+        Raises:
+            ValueError: If specified extractor is not available.
+        """
 
         # Select extractor (Feature #56: use registry)
         extractor_name = extractor_name or "docling"
 
-        extractor = self.registry.get(extractor_name)
+        extractor = self._resolve(extractor_name)
         if not extractor:
-            available = self.registry.get_names()
+            available = list(self.registry.get_names())
             raise ValueError(
                 f"Extractor '{extractor_name}' not available. "
                 f"Available extractors: {available}"
@@ -307,16 +937,17 @@ class Orchestrator:
 
 
         logger.info(
-            f"Starting simple extraction: {file_path.name} "
-            f"using {extractor.name}"
+            "Starting simple extraction: {} using {}", file_path.name, extractor.name
         )
 
         # Extract
         result = extractor.extract(file_path, options)
 
         logger.info(
-            f"Simple extraction completed: {file_path.name} "
-            f"(success={result.success}, confidence={result.confidence_score})"
+            "Simple extraction completed: {} (success={}, confidence={})",
+            file_path.name,
+            result.success,
+            result.confidence_score,
         )
 
         return result
@@ -352,4 +983,4 @@ class Orchestrator:
             >>> if docling:
             ...     result = docling.extract(pdf_path)
         """
-        return self.registry.get(name)
+        return self._resolve(name)
@@ -1,18 +1,145 @@
 """
 PDF-to-Markdown Extractor - Parallel Extraction Executor (Feature #57).
 
-Executes multiple extractors in parallel using ThreadPoolExecutor.
+Executes multiple extractors in parallel using a thread or process pool.
 """
 
+import multiprocessing
+import os
 import psutil
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
-from src.extractors.base import BaseExtractor, ExtractionResult
+from src.core.registry import EXTRACTOR_CLASSES, load_extractor_class
+from src.extractors.base import (
+    BaseExtractor,
+    ExtractionResult,
+    Extractor,
+    ExtractorRecoverableError,
+    extractor_key,
+)
+
+# Extractor class names that worker processes can rebuild from the registry
+_PROCESS_SAFE_CLASSES = frozenset(class_name for _, class_name in EXTRACTOR_CLASSES)
+
+# Upper bound for the automatic worker count; each extractor can hold ~500MB+
+MAX_WORKERS_CAP = 8
+
+# Memory budget per worker used when sizing the pool automatically (GB)
+WORKER_MEMORY_GB = 2.0
+
+# How long a reading of available memory is reused (seconds)
+MEMORY_CHECK_TTL_S = 0.5
+
+_memory_lock = threading.Lock()
+_memory_cache = {"ts": float("-inf"), "gb": 0.0}
+
+
+def _available_memory_gb() -> float:
+    """
+    Get available system memory in GB, re-reading it at most every MEMORY_CHECK_TTL_S.
+
+    Returns:
+        float: Available memory in GB.
+    """
+    with _memory_lock:
+        now = time.monotonic()
+        if now - _memory_cache["ts"] >= MEMORY_CHECK_TTL_S:
+            _memory_cache["gb"] = psutil.virtual_memory().available / (1024 ** 3)
+            _memory_cache["ts"] = now
+        return _memory_cache["gb"]
+
+
+@lru_cache(maxsize=None)
+def worker_extractor(class_name: str) -> BaseExtractor:
+    """
+    Get the extractor instance of a worker process, created on first use.
+
+    Process-pool tasks receive the extractor class name instead of a
+    pickled instance, so models load once per worker, not once per task.
+
+    Args:
+        class_name: Extractor class name known to the registry.
+
+    Returns:
+        BaseExtractor: Extractor shared by all tasks of this process.
+    """
+    return load_extractor_class(class_name)()
+
+
+def _extract_in_worker(
+    class_name: str,
+    file_path: Path,
+    options: Optional[Dict[str, Any]] = None,
+) -> ExtractionResult:
+    """
+    Run one extraction inside a worker process.
+
+    Extractor instances hold models and log handles that do not pickle, so
+    only the class name crosses the process boundary; the worker rebuilds
+    (and keeps) its own instance.
+
+    Args:
+        class_name: Extractor class name known to the registry.
+        file_path: Path to PDF.
+        options: Extraction options.
+
+    Returns:
+        ExtractionResult: Extraction result.
+    """
+    extractor = worker_extractor(class_name)
+
+    with logger.contextualize(extractor=extractor.name, file=file_path.name):
+        logger.info("Starting extraction in worker process")
+
+        try:
+            return extractor.extract(file_path, options)
+
+        except ExtractorRecoverableError as e:
+            logger.warning("Extraction failed: {}", e)
+            raise
+
+        except Exception as e:
+            logger.opt(exception=e).error("Extraction failed: {}", e)
+            raise
+
+
+def default_max_workers(cap: int = MAX_WORKERS_CAP) -> int:
+    """
+    Size the worker pool from usable CPUs and available memory.
+
+    Args:
+        cap: Upper bound on the worker count.
+
+    Returns:
+        int: min(usable CPUs, available memory / WORKER_MEMORY_GB, cap),
+             at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))  # Honors cgroup/taskset CPU pinning
+    else:
+        cpus = os.cpu_count() or 1
+
+    workers = min(cpus, cap)
+
+    try:
+        workers = min(workers, int(_available_memory_gb() / WORKER_MEMORY_GB))
+    except Exception as e:
+        logger.debug("Memory-based worker sizing skipped: {}", e)
+
+    return max(1, workers)
 
 
 class ParallelExecutor:
@@ -20,7 +147,11 @@ class ParallelExecutor:
     Parallel extraction executor (Feature #57).
 
     Runs multiple extractors in parallel using ThreadPoolExecutor,
-    collecting results as they complete.
+    collecting results as they complete. Each extractor's
+    ``concurrency_mode`` picks its pool: with ``use_processes=True``,
+    "process" extractors run in a persistent pool of spawned worker
+    processes so CPU-bound parsers are not serialized on the GIL, and
+    "gpu_serial" extractors share a single thread to avoid VRAM contention.
 
     Example:
         >>> executor = ParallelExecutor(max_workers=3)
@@ -34,27 +165,39 @@ class ParallelExecutor:
 
     def __init__(
         self,
-        max_workers: int = 3,
+        max_workers: Optional[int] = None,
         timeout: Optional[int] = None,
         memory_threshold_gb: float = 2.0,
+        use_processes: bool = False,
     ):
         """
         Initialize parallel executor.
 
         Args:
-            max_workers: Maximum number of parallel extractors (default: 3).
+            max_workers: Maximum number of parallel extractors
+                        (default: None, sized by default_max_workers()).
             timeout: Global timeout for all extractions in seconds (Feature #58).
                     None means no timeout.
             memory_threshold_gb: Minimum available memory in GB (Feature #60).
                                 Default: 2.0 GB.
+            use_processes: Run extractors in worker processes instead of
+                          threads (default: False). Ignored when
+                          max_workers is 1. Not usable from daemonic
+                          processes such as Celery prefork workers.
         """
-        self.max_workers = max_workers
+        self.max_workers = max_workers or default_max_workers()
         self.timeout = timeout
         self.memory_threshold_gb = memory_threshold_gb
+        self.use_processes = use_processes
+
+        # Worker processes are expensive to spawn, so the pool is created on
+        # first use and kept until shutdown()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
 
     def execute(
         self,
-        extractors: List[BaseExtractor],
+        extractors: List[Extractor],
         file_path: Path,
         options: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, ExtractionResult]:
@@ -70,6 +213,10 @@ class ParallelExecutor:
             dict: Dictionary mapping extractor names to their results.
                   {extractor_name: ExtractionResult}
 
+        Note:
+            With a single extractor no pool is created: it runs inline and
+            the global timeout does not apply.
+
         Example:
             >>> executor = ParallelExecutor()
             >>> results = executor.execute(
@@ -86,70 +233,296 @@ class ParallelExecutor:
         # Feature #60: Memory management check
         if not self._check_memory():
             logger.warning(
-                f"Low memory warning: Available memory below threshold "
-                f"({self.memory_threshold_gb} GB). Parallel extraction may fail."
+                "Low memory warning: Available memory below threshold "
+                "({} GB). Parallel extraction may fail.",
+                self.memory_threshold_gb
             )
 
         logger.info(
-            f"Starting parallel extraction: {file_path.name} "
-            f"with {len(extractors)} extractors (max_workers={self.max_workers})"
+            "Starting parallel extraction: {} "
+            "with {} extractors (max_workers={})",
+            file_path.name,
+            len(extractors),
+            self.max_workers
         )
 
         results: Dict[str, ExtractionResult] = {}
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        for name, result in self._stream(extractors, file_path, options):
+            results[name] = result
+
+        total_time = time.perf_counter() - start_time
+
+        logger.info(
+            "Parallel extraction completed: {}/{} "
+            "extractors succeeded in {:.2f}s",
+            len(results),
+            len(extractors),
+            total_time
+        )
+
+        return results
+
+    def execute_streaming(
+        self,
+        extractors: List[Extractor],
+        file_path: Path,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Tuple[str, ExtractionResult]]:
+        """
+        Execute multiple extractors in parallel, yielding results as they complete.
+
+        Closing the iterator early (or breaking out of a for loop over it)
+        cancels extractors that have not started yet; running ones finish
+        in the background and their results are discarded.
+
+        Args:
+            extractors: List of extractor instances to run.
+            file_path: Path to PDF file.
+            options: Extraction options to pass to all extractors.
+
+        Yields:
+            tuple: (extractor_name, ExtractionResult), in completion order.
+                   Failed extractors are logged and skipped.
+
+        Example:
+            >>> executor = ParallelExecutor()
+            >>> for name, result in executor.execute_streaming([docling, mineru], path):
+            ...     if result.confidence_score > 0.95:
+            ...         break
+        """
+        if not extractors:
+            logger.warning("No extractors provided for parallel execution")
+            return
+
+        # Feature #60: Memory management check
+        if not self._check_memory():
+            logger.warning(
+                "Low memory warning: Available memory below threshold "
+                "({} GB). Parallel extraction may fail.",
+                self.memory_threshold_gb
+            )
 
-        # Create extraction tasks
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all extraction tasks
-            future_to_extractor = {
-                executor.submit(
+        logger.info(
+            "Starting streaming parallel extraction: {} "
+            "with {} extractors (max_workers={})",
+            file_path.name,
+            len(extractors),
+            self.max_workers
+        )
+
+        yield from self._stream(extractors, file_path, options)
+
+    def _stream(
+        self,
+        extractors: List[Extractor],
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+    ) -> Iterator[Tuple[str, ExtractionResult]]:
+        """
+        Run extractors in a worker pool and yield results as they complete.
+
+        Args:
+            extractors: List of extractor instances to run.
+            file_path: Path to PDF file.
+            options: Extraction options to pass to all extractors.
+
+        Yields:
+            tuple: (extractor_name, ExtractionResult), in completion order.
+
+        Note:
+            A single extractor runs inline in the calling thread, without a
+            pool; the global timeout is not enforced on that path.
+        """
+        if len(extractors) == 1:
+            yield from self._run_inline(extractors[0], file_path, options)
+            return
+
+        # Route each extractor to the pool that suits its concurrency profile
+        future_to_extractor: Dict[Future, Extractor] = {}
+        owned_pools: Dict[str, ThreadPoolExecutor] = {}
+
+        for extractor in extractors:
+            mode = self._concurrency_mode(extractor)
+
+            if mode == "process":
+                future = self._get_process_pool().submit(
+                    _extract_in_worker,
+                    type(extractor).__name__,
+                    file_path,
+                    options
+                )
+            else:
+                pool = owned_pools.get(mode)
+                if pool is None:
+                    # GPU extractors share one thread so they never contend for VRAM
+                    pool = owned_pools[mode] = ThreadPoolExecutor(
+                        max_workers=1 if mode == "gpu_serial" else self.max_workers
+                    )
+                future = pool.submit(
                     self._extract_with_logging,
                     extractor,
                     file_path,
                     options
-                ): extractor
-                for extractor in extractors
-            }
+                )
 
-            # Collect results as they complete
-            for future in as_completed(future_to_extractor, timeout=self.timeout):
-                extractor = future_to_extractor[future]
-                extractor_key = extractor.name.lower().replace("extractor", "")
+            future_to_extractor[future] = extractor
 
-                try:
-                    result = future.result()
-                    results[extractor_key] = result
+        pending = set(future_to_extractor)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
 
-                    logger.info(
-                        f"Extractor {extractor.name} completed "
-                        f"(success={result.success}, time={result.extraction_time:.2f}s)"
-                    )
+        try:
+            # Collect results as they complete, until the global deadline
+            while pending:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
 
-                except TimeoutError:
+                if not done:
                     # Feature #58: Timeout handling
-                    logger.error(
-                        f"Extractor {extractor.name} timed out "
-                        f"(timeout={self.timeout}s)"
-                    )
+                    for future in pending:
+                        future.cancel()
+                        logger.error(
+                            "Extractor {} timed out "
+                            "(timeout={}s)",
+                            future_to_extractor[future].name,
+                            self.timeout
+                        )
+                    break
+
+                for future in done:
+                    extractor = future_to_extractor[future]
+
+                    try:
+                        result = future.result()
+
+                    except ExtractorRecoverableError as e:
+                        logger.warning("Extractor {} failed: {}", extractor.name, e)
+                        continue
+
+                    except Exception as e:
+                        logger.opt(exception=e).error(
+                            "Extractor {} failed: {}", extractor.name, e
+                        )
+                        continue
 
-                except Exception as e:
-                    logger.error(
-                        f"Extractor {extractor.name} failed: {e}",
-                        exc_info=True
+                    logger.info(
+                        "Extractor {} completed "
+                        "(success={}, time={:.2f}s)",
+                        extractor.name,
+                        result.success,
+                        result.extraction_time
                     )
 
-        total_time = time.time() - start_time
+                    yield extractor_key(extractor.name), result
+
+        finally:
+            # Drop queued work on timeout or early exit (the shared process
+            # pool keeps its workers)
+            for future in pending:
+                future.cancel()
+
+            # Wait for per-call threads on normal completion; abandon them otherwise
+            for pool in owned_pools.values():
+                pool.shutdown(wait=not pending, cancel_futures=bool(pending))
+
+    def _run_inline(
+        self,
+        extractor: Extractor,
+        file_path: Path,
+        options: Optional[Dict[str, Any]],
+    ) -> Iterator[Tuple[str, ExtractionResult]]:
+        """
+        Run a single extractor in the calling thread.
+
+        Args:
+            extractor: Extractor instance to run.
+            file_path: Path to PDF file.
+            options: Extraction options.
+
+        Yields:
+            tuple: (extractor_name, ExtractionResult), unless the extractor failed.
+        """
+        try:
+            result = self._extract_with_logging(extractor, file_path, options)
+
+        except ExtractorRecoverableError as e:
+            logger.warning("Extractor {} failed: {}", extractor.name, e)
+            return
+
+        except Exception as e:
+            logger.opt(exception=e).error("Extractor {} failed: {}", extractor.name, e)
+            return
 
         logger.info(
-            f"Parallel extraction completed: {len(results)}/{len(extractors)} "
-            f"extractors succeeded in {total_time:.2f}s"
+            "Extractor {} completed "
+            "(success={}, time={:.2f}s)",
+            extractor.name,
+            result.success,
+            result.extraction_time
         )
 
-        return results
+        yield extractor_key(extractor.name), result
+
+    def _concurrency_mode(self, extractor: Extractor) -> str:
+        """
+        Pick the pool an extractor runs in.
+
+        Args:
+            extractor: Extractor about to run.
+
+        Returns:
+            str: "process" if the extractor asks for it, process mode is
+                 enabled and it can be rebuilt by class name in a worker;
+                 "gpu_serial" for GPU-bound extractors; "thread" otherwise.
+        """
+        mode = getattr(extractor, "concurrency_mode", "thread")
+
+        if mode == "process":
+            if not self.use_processes or self.max_workers <= 1:
+                return "thread"
+            if type(extractor).__name__ not in _PROCESS_SAFE_CLASSES:
+                logger.debug("Using a thread for {}: not rebuildable in workers", extractor.name)
+                return "thread"
+            return "process"
+
+        return "gpu_serial" if mode == "gpu_serial" else "thread"
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the shared process pool, spawning it on first use.
+
+        The "spawn" start method avoids forking a parent that may already
+        hold threads, CUDA contexts or loaded models.
+
+        Returns:
+            ProcessPoolExecutor: Pool with max_workers worker processes.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                logger.info("Starting extractor process pool (max_workers={})", self.max_workers)
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker process pool, if one was started.
+
+        Args:
+            wait: Wait for running extractions to finish.
+        """
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
 
     def _extract_with_logging(
         self,
-        extractor: BaseExtractor,
+        extractor: Extractor,
         file_path: Path,
         options: Optional[Dict[str, Any]] = None,
     ) -> ExtractionResult:
@@ -166,18 +539,21 @@ class ParallelExecutor:
         Returns:
             ExtractionResult: Extraction result.
         """
-        logger.info(f"Starting {extractor.name} extraction: {file_path.name}")
+        # Bind extractor/file once; records logged by the extractor itself carry them too
+        with logger.contextualize(extractor=extractor.name, file=file_path.name):
+            logger.info("Starting extraction")
 
-        try:
-            result = extractor.extract(file_path, options)
-            return result
+            try:
+                return extractor.extract(file_path, options)
 
-        except Exception as e:
-            logger.error(
-                f"{extractor.name} extraction failed: {e}",
-                exc_info=True
-            )
-            raise
+            except ExtractorRecoverableError as e:
+                # Expected (backend unavailable, ...): skip the traceback walk
+                logger.warning("Extraction failed: {}", e)
+                raise
+
+            except Exception as e:
+                logger.opt(exception=e).error("Extraction failed: {}", e)
+                raise
 
     def _check_memory(self) -> bool:
         """
@@ -192,25 +568,28 @@ class ParallelExecutor:
             ...     print("Sufficient memory")
         """
         try:
-            # Get available memory
-            memory = psutil.virtual_memory()
-            available_gb = memory.available / (1024 ** 3)
+            # Get available memory (shared, short-lived reading)
+            available_gb = _available_memory_gb()
 
             logger.debug(
-                f"Memory check: {available_gb:.2f} GB available "
-                f"(threshold: {self.memory_threshold_gb} GB)"
+                "Memory check: {:.2f} GB available "
+                "(threshold: {} GB)",
+                available_gb,
+                self.memory_threshold_gb
             )
 
             if available_gb < self.memory_threshold_gb:
                 logger.warning(
-                    f"Low memory: {available_gb:.2f} GB available "
-                    f"(threshold: {self.memory_threshold_gb} GB)"
+                    "Low memory: {:.2f} GB available "
+                    "(threshold: {} GB)",
+                    available_gb,
+                    self.memory_threshold_gb
                 )
                 return False
 
             return True
 
         except Exception as e:
-            logger.warning(f"Memory check failed: {e}")
+            logger.warning("Memory check failed: {}", e)
             # Assume memory is sufficient if check fails
             return True
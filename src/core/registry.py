@@ -4,14 +4,128 @@ PDF-to-Markdown Extractor - Extractor Registry (Feature #56).
 Centralized registry pattern for managing available extractors.
 """
 
-from typing import Dict, List, Optional
+import importlib
+import importlib.metadata
+import json
+import os
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, KeysView, Optional, Tuple, Type, ValuesView
 
 from loguru import logger
 
-from src.extractors.base import BaseExtractor
-from src.extractors.docling_extractor import DoclingExtractor
-from src.extractors.mineru_extractor import MinerUExtractor
-from src.extractors.mistral_extractor import MistralExtractor
+from src.extractors.base import BaseExtractor, extractor_key
+
+# All known extractors as (module, class name), imported at discovery time
+EXTRACTOR_CLASSES: Tuple[Tuple[str, str], ...] = (
+    ("src.extractors.docling_extractor", "DoclingExtractor"),
+    ("src.extractors.mineru_extractor", "MinerUExtractor"),
+    ("src.extractors.mistral_extractor", "MistralExtractor"),  # Cloud OCR fallback
+)
+
+# Extractors whose availability depends only on an installed package, so the
+# probe result can be reused across process starts. Mistral is excluded: it
+# depends on MISTRAL_API_KEY, which can change between runs.
+CAPABILITY_PACKAGES: Dict[str, str] = {
+    "DoclingExtractor": "docling",
+    "MinerUExtractor": "magic-pdf",
+}
+
+# Persisted availability probes, invalidated when the interpreter or any
+# package version in CAPABILITY_PACKAGES changes
+CAPABILITY_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "pdf-extractor"
+    / "capabilities.json"
+)
+
+
+@cache
+def load_extractor_class(class_name: str) -> Type[BaseExtractor]:
+    """
+    Import a known extractor class by its class name.
+
+    Used by worker processes to rebuild extractors that cannot be pickled.
+    Successful lookups are cached per process; failures are retried.
+
+    Args:
+        class_name: Extractor class name (e.g. "DoclingExtractor").
+
+    Returns:
+        type: The extractor class.
+
+    Raises:
+        KeyError: If the class is not a known extractor.
+        ImportError: If the extractor module cannot be imported.
+    """
+    for module_name, name in EXTRACTOR_CLASSES:
+        if name == class_name:
+            return getattr(importlib.import_module(module_name), name)
+
+    raise KeyError(f"Unknown extractor class: {class_name}")
+
+
+def _package_version(package: str) -> Optional[str]:
+    """Get an installed package's version, or None if it is not installed."""
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _capability_fingerprint() -> Dict[str, Any]:
+    """Identify the environment the capability cache was written for."""
+    return {
+        "python": sys.executable,
+        "packages": {
+            package: _package_version(package)
+            for package in sorted(set(CAPABILITY_PACKAGES.values()))
+        },
+    }
+
+
+def _load_capabilities(fingerprint: Dict[str, Any]) -> Dict[str, bool]:
+    """
+    Read cached availability probes for this environment.
+
+    Args:
+        fingerprint: Current environment fingerprint.
+
+    Returns:
+        dict: Extractor class name -> available; empty if the cache is
+              missing, unreadable or was written for another environment.
+    """
+    try:
+        data = json.loads(CAPABILITY_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+
+    return {
+        name: available
+        for name, available in data.get("available", {}).items()
+        if name in CAPABILITY_PACKAGES and isinstance(available, bool)
+    }
+
+
+def _save_capabilities(fingerprint: Dict[str, Any], available: Dict[str, bool]) -> None:
+    """
+    Persist availability probes for this environment (best effort).
+
+    Args:
+        fingerprint: Current environment fingerprint.
+        available: Extractor class name -> available.
+    """
+    try:
+        CAPABILITY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CAPABILITY_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"fingerprint": fingerprint, "available": available}))
+        os.replace(tmp_path, CAPABILITY_CACHE_PATH)
+    except OSError as e:
+        logger.debug("Could not write extractor capability cache: {}", e)
 
 
 class ExtractorRegistry:
@@ -34,58 +148,87 @@ class ExtractorRegistry:
     def __init__(self):
         """Initialize extractor registry and auto-discover extractors."""
         self._extractors: Dict[str, BaseExtractor] = {}
+        self._capabilities: Optional[Dict[str, Dict]] = None  # Built on first use
         self._discover_extractors()
 
     def _discover_extractors(self) -> None:
         """
         Auto-discover and register all available extractors.
 
-        Attempts to instantiate each known extractor and registers
-        those that are available (dependencies installed).
-        """
-        # List of all known extractor classes
-        extractor_classes = [
-            DoclingExtractor,
-            MinerUExtractor,
-            MistralExtractor,  # Cloud OCR fallback
-        ]
+        Imports each known extractor module on demand, instantiates the
+        extractor and registers those that are available (dependencies
+        installed). Extractor modules are not imported with the registry.
 
+        Availability of package-backed extractors (CAPABILITY_PACKAGES) is
+        cached on disk: extractors known to be unavailable are skipped
+        without importing them, and known-available ones skip the probe.
+        """
         logger.info("Discovering extractors...")
 
-        for extractor_class in extractor_classes:
+        fingerprint = _capability_fingerprint()
+        cached = _load_capabilities(fingerprint)
+        probed: Dict[str, bool] = {}
+
+        for _, class_name in EXTRACTOR_CLASSES:
+            if cached.get(class_name) is False:
+                logger.debug("Extractor {} not available (cached)", class_name)
+                continue
+
+            try:
+                extractor_class = load_extractor_class(class_name)
+            except ImportError as e:
+                logger.debug("Extractor {} could not be imported: {}", class_name, e)
+                probed[class_name] = False
+                continue
+
             try:
                 # Instantiate extractor
                 extractor = extractor_class()
 
-                # Check if available (dependencies installed)
-                if extractor.is_available():
+                # Check if available (dependencies installed), unless cached
+                available = cached.get(class_name)
+                if available is None:
+                    available = probed[class_name] = extractor.is_available()
+
+                if available:
                     # Register with normalized key
-                    key = extractor.name.lower().replace("extractor", "")
+                    key = extractor.key
                     self._extractors[key] = extractor
 
                     logger.info(
-                        f"Registered extractor: {extractor.name} v{extractor.version} "
-                        f"(key: '{key}')"
+                        "Registered extractor: {} v{} "
+                        "(key: '{}')",
+                        extractor.name,
+                        extractor.version,
+                        key
                     )
                 else:
                     logger.debug(
-                        f"Extractor {extractor_class.__name__} not available "
-                        f"(dependencies not installed)"
+                        "Extractor {} not available "
+                        "(dependencies not installed)",
+                        class_name
                     )
 
             except Exception as e:
                 logger.warning(
-                    f"Failed to instantiate {extractor_class.__name__}: {e}"
+                    "Failed to instantiate {}: {}",
+                    class_name,
+                    e
                 )
 
-        logger.info(f"Total extractors registered: {len(self._extractors)}")
+        probed = {name: ok for name, ok in probed.items() if name in CAPABILITY_PACKAGES}
+        if probed:
+            _save_capabilities(fingerprint, {**cached, **probed})
+
+        logger.info("Total extractors registered: {}", len(self._extractors))
 
-    def get_available(self) -> List[BaseExtractor]:
+    def get_available(self) -> ValuesView[BaseExtractor]:
         """
-        Get list of available extractors (Feature #56 verification).
+        Get available extractors (Feature #56 verification).
 
         Returns:
-            list[BaseExtractor]: List of available extractor instances.
+            ValuesView[BaseExtractor]: Live view of available extractor
+                instances; copy it with list() before mutating the registry.
 
         Example:
             >>> registry = ExtractorRegistry()
@@ -93,7 +236,7 @@ class ExtractorRegistry:
             >>> for extractor in extractors:
             ...     print(f"{extractor.name}: {extractor.description}")
         """
-        return list(self._extractors.values())
+        return self._extractors.values()
 
     def get(self, name: str) -> Optional[BaseExtractor]:
         """
@@ -112,23 +255,21 @@ class ExtractorRegistry:
             >>> if docling:
             ...     result = docling.extract(pdf_path)
         """
-        # Normalize key
-        key = name.lower().replace("extractor", "")
-        return self._extractors.get(key)
+        return self._extractors.get(extractor_key(name))
 
-    def get_names(self) -> List[str]:
+    def get_names(self) -> KeysView[str]:
         """
-        Get list of registered extractor names.
+        Get registered extractor names.
 
         Returns:
-            list[str]: List of extractor names.
+            KeysView[str]: Live view of extractor names (registry keys).
 
         Example:
             >>> registry = ExtractorRegistry()
-            >>> print(registry.get_names())
+            >>> print(list(registry.get_names()))
             ['docling', 'mineru']
         """
-        return list(self._extractors.keys())
+        return self._extractors.keys()
 
     def has_extractor(self, name: str) -> bool:
         """
@@ -145,8 +286,7 @@ class ExtractorRegistry:
             >>> if registry.has_extractor('docling'):
             ...     print("Docling is available")
         """
-        key = name.lower().replace("extractor", "")
-        return key in self._extractors
+        return extractor_key(name) in self._extractors
 
     def get_capabilities(self) -> Dict[str, Dict]:
         """
@@ -161,10 +301,14 @@ class ExtractorRegistry:
             >>> print(caps['docling']['supports_tables'])
             True
         """
-        return {
-            name: extractor.get_capabilities()
-            for name, extractor in self._extractors.items()
-        }
+        # Capabilities are static per extractor instance; collect them once
+        if self._capabilities is None:
+            self._capabilities = {
+                name: extractor.capabilities
+                for name, extractor in self._extractors.items()
+            }
+
+        return {name: dict(caps) for name, caps in self._capabilities.items()}
 
     def count(self) -> int:
         """
@@ -174,3 +318,24 @@ class ExtractorRegistry:
             int: Number of registered extractors.
         """
         return len(self._extractors)
+
+
+@cache
+def get_registry() -> ExtractorRegistry:
+    """
+    Get the process-wide extractor registry, discovering extractors on first use.
+
+    Returns:
+        ExtractorRegistry: Shared registry instance.
+
+    Example:
+        >>> registry = get_registry()
+        >>> registry is get_registry()
+        True
+    """
+    return ExtractorRegistry()
+
+
+def reset_registry() -> None:
+    """Drop the shared registry so the next get_registry() call re-discovers extractors."""
+    get_registry.cache_clear()
@@ -4,17 +4,68 @@ PDF-to-Markdown Extractor - Celery Tasks.
 Asynchronous tasks for PDF extraction, comparison, and processing.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from loguru import logger
 
-from src.core.celery_app import celery_app
-from src.core.job_tracker import JobTracker, JobStatus
-from src.core.orchestrator import Orchestrator
+from src.core.celery_app import celery_app, get_worker_orchestrator, get_worker_tracker
+from src.core.config import get_settings
+from src.core.job_tracker import JobStatus
+from src.core.orchestrator import ExtractionOutcome
+from src.extractors.base import ExtractionResult
 
 
-def _serialize_result(extraction_result: Dict[str, Any]) -> Dict[str, Any]:
+@dataclass(slots=True)
+class SerializedResult:
+    """
+    Task payload for the main extraction result.
+
+    Carries counts instead of the tables/images themselves to keep
+    broker payloads small.
+    """
+
+    markdown: str
+    metadata: Dict[str, Any]
+    confidence_score: float
+    extraction_time: float
+    extractor_name: str
+    extractor_version: str
+    success: bool
+    page_count: int
+    table_count: int
+    image_count: int
+    error_count: int
+    warning_count: int
+
+    @classmethod
+    def from_result(cls, result: ExtractionResult) -> "SerializedResult":
+        """Build the payload from an ExtractionResult."""
+        table_count, image_count, error_count, warning_count = map(
+            len, (result.tables, result.images, result.errors, result.warnings)
+        )
+        return cls(
+            markdown=result.markdown,
+            metadata=result.metadata,
+            confidence_score=result.confidence_score,
+            extraction_time=result.extraction_time,
+            extractor_name=result.extractor_name,
+            extractor_version=result.extractor_version,
+            success=result.success,
+            page_count=result.page_count,
+            table_count=table_count,
+            image_count=image_count,
+            error_count=error_count,
+            warning_count=warning_count,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict for the Celery result serializer (no deep copy, unlike asdict)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _serialize_result(extraction_result: ExtractionOutcome) -> Dict[str, Any]:
     """
     Serialize extraction result for Celery.
 
@@ -22,43 +73,38 @@ def _serialize_result(extraction_result: Dict[str, Any]) -> Dict[str, Any]:
         extraction_result: Result from orchestrator.extract().
 
     Returns:
-        dict: Serialized result (JSON-compatible).
+        dict: Serialized result (msgpack/JSON-compatible).
     """
     serialized = {
-        "complexity": extraction_result["complexity"],
-        "strategy_used": extraction_result["strategy_used"],
+        "strategy_used": extraction_result.strategy_used,
     }
 
+    # The fallback chain defers complexity analysis until it is read; only
+    # report it when it already ran (always_analyze_complexity forces it)
+    if extraction_result.complexity_analyzed:
+        serialized["complexity"] = extraction_result.complexity
+
+    if extraction_result.strategy_downgraded_from:
+        serialized["strategy_downgraded_from"] = extraction_result.strategy_downgraded_from
+
     # Serialize main result
-    result = extraction_result["result"]
+    result = extraction_result.result
     if result:
-        serialized["result"] = {
-            "markdown": result.markdown,
-            "metadata": result.metadata,
-            "confidence_score": result.confidence_score,
-            "extraction_time": result.extraction_time,
-            "extractor_name": result.extractor_name,
-            "extractor_version": result.extractor_version,
-            "success": result.success,
-            "page_count": result.page_count,
-            "table_count": len(result.tables),
-            "image_count": len(result.images),
-            "error_count": len(result.errors),
-            "warning_count": len(result.warnings),
-        }
+        serialized["result"] = SerializedResult.from_result(result).to_dict()
 
     # Serialize aggregation if present (parallel strategies)
-    if "aggregation" in extraction_result:
+    aggregation = extraction_result.aggregation
+    if aggregation is not None:
         serialized["aggregation"] = {
-            "extractor_count": extraction_result["aggregation"]["extractor_count"],
-            "successful_count": extraction_result["aggregation"]["successful_count"],
-            "average_confidence": extraction_result["aggregation"]["average_confidence"],
+            "extractor_count": aggregation["extractor_count"],
+            "successful_count": aggregation["successful_count"],
+            "average_confidence": aggregation["average_confidence"],
         }
 
     # Serialize all_results if present (parallel strategies)
-    if "all_results" in extraction_result and extraction_result["all_results"]:
+    if extraction_result.all_results:
         serialized["all_results"] = {}
-        for extractor_name, result in extraction_result["all_results"].items():
+        for extractor_name, result in extraction_result.all_results.items():
             serialized["all_results"][extractor_name] = {
                 "markdown": result.markdown,
                 "confidence_score": result.confidence_score,
@@ -119,27 +165,27 @@ def extract_pdf_task(
         {'result': {...}, 'complexity': {...}}
     """
     job_id = self.request.id
-    tracker = JobTracker()
+    tracker = get_worker_tracker()
 
-    logger.info(f"Celery task started: extract_pdf (job_id={job_id}, file={file_path})")
+    logger.info("Celery task started: extract_pdf (job_id={}, file={})", job_id, file_path)
 
-    # Feature #65-66: Set initial status with progress
+    # Feature #65-66: Set initial status with progress. The task is already
+    # running, so it starts at EXTRACTING in one write instead of a PENDING
+    # write that would immediately be overwritten.
     tracker.set_status(
         job_id,
-        JobStatus.PENDING,
+        JobStatus.EXTRACTING,
         metadata={"file_path": file_path, "strategy": strategy},
-        progress_percentage=0.0
+        progress_percentage=25.0
     )
+    progress_updates = get_settings().celery_progress_updates
 
     try:
         # Convert string path to Path object
         pdf_path = Path(file_path)
 
-        # Feature #65-66: Update status to extracting
-        tracker.set_status(job_id, JobStatus.EXTRACTING, progress_percentage=25.0)
-
-        # Create orchestrator
-        orchestrator = Orchestrator()
+        # Reuse this worker process's orchestrator
+        orchestrator = get_worker_orchestrator()
 
         # Extract
         extraction_result = orchestrator.extract(
@@ -150,7 +196,7 @@ def extract_pdf_task(
         )
 
         # Feature #65-66: Update status if comparing (parallel extraction)
-        if "aggregation" in extraction_result:
+        if progress_updates and extraction_result.aggregation is not None:
             tracker.set_status(job_id, JobStatus.COMPARING, progress_percentage=75.0)
 
         # Serialize ExtractionResult for Celery
@@ -164,12 +210,12 @@ def extract_pdf_task(
             progress_percentage=100.0
         )
 
-        logger.info(f"Celery task completed: extract_pdf (job_id={job_id}, file={file_path})")
+        logger.info("Celery task completed: extract_pdf (job_id={}, file={})", job_id, file_path)
 
         return serialized
 
     except Exception as e:
-        logger.error(f"Celery task failed: extract_pdf (job_id={job_id}, file={file_path}): {e}")
+        logger.error("Celery task failed: extract_pdf (job_id={}, file={}): {}", job_id, file_path, e)
 
         # Feature #65: Update status to failed
         tracker.set_status(
@@ -1,15 +1,28 @@
 """
 PDF-to-Markdown Extractor - Base Extractor Classes.
 
-Defines the abstract base class for all PDF extractors and the
+Defines the base class and protocol for PDF extractors and the
 ExtractionResult dataclass for standardized results.
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime
+import os
+import stat
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Protocol, Tuple
+
+import orjson
+from loguru import logger
+
+try:
+    import msgpack
+except ImportError:  # Optional; to_msgpack()/from_msgpack() need it
+    msgpack = None
+
+if TYPE_CHECKING:  # result_cache imports this module
+    from src.utils.result_cache import ResultCache
 
 
 class ExtractionError(Exception):
@@ -46,13 +59,22 @@ class ExtractionError(Exception):
         super().__init__(error_msg)
 
 
-@dataclass
+class ExtractorRecoverableError(ExtractionError):
+    """
+    Expected extraction failure, such as a backend that is not installed or configured.
+
+    Callers log these without a traceback; the fallback chain simply moves on.
+    """
+
+
+@dataclass(slots=True)
 class ExtractionResult:
     """
     Result of a PDF extraction operation.
 
     This dataclass standardizes the output format for all extractors,
-    making it easy to compare results and build consensus.
+    making it easy to compare results and build consensus. It uses
+    __slots__ to keep per-result memory low in large batches.
 
     Attributes:
         markdown: Extracted content in markdown format.
@@ -66,7 +88,7 @@ class ExtractionResult:
         page_count: Number of pages in the PDF.
         errors: List of errors encountered during extraction.
         warnings: List of warnings generated during extraction.
-        extraction_timestamp: When the extraction was performed.
+        extraction_timestamp: When the extraction was performed (UTC, timezone-aware).
         options: Extraction options used (for reproducibility).
 
     Example:
@@ -93,15 +115,11 @@ class ExtractionResult:
     page_count: int = 0
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
-    extraction_timestamp: datetime = field(default_factory=datetime.utcnow)
+    extraction_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     options: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Validate extraction result after initialization."""
-        # Ensure confidence_score is in valid range
-        if not 0.0 <= self.confidence_score <= 1.0:
-            raise ValueError(f"confidence_score must be between 0.0 and 1.0, got {self.confidence_score}")
-
+        """Normalize extraction result after initialization."""
         # Ensure markdown is not None
         if self.markdown is None:
             self.markdown = ""
@@ -162,18 +180,149 @@ class ExtractionResult:
             "table_count": self.table_count,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize result fields to JSON with orjson's native dataclass path.
+
+        Faster than encoding to_dict(): no intermediate dict is built and the
+        timestamp is emitted as RFC 3339 by orjson. Derived properties
+        (success, image_count, table_count) are not included; from_dict()
+        accepts the decoded output.
+
+        Returns:
+            bytes: UTF-8 encoded JSON.
+        """
+        return orjson.dumps(
+            self,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize result fields to msgpack for inter-process transport.
+
+        Smaller and faster to encode than pickling the dataclass; the
+        timestamp uses msgpack's native timestamp extension type.
+
+        Returns:
+            bytes: msgpack payload for from_msgpack().
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+
+        return msgpack.packb(
+            {name: getattr(self, name) for name in _RESULT_FIELDS},
+            datetime=True,
+            default=str,
+        )
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "ExtractionResult":
+        """
+        Rebuild a result from to_msgpack() output.
+
+        Args:
+            data: msgpack payload produced in this or another process.
+
+        Returns:
+            ExtractionResult: Reconstructed result.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+
+        return cls(**msgpack.unpackb(data, timestamp=3))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExtractionResult":
+        """
+        Rebuild a result from to_dict() or decoded to_json() output.
+
+        Derived keys (success, image_count, table_count) are ignored. Data
+        loaded from outside the process (cache, API) is validated here
+        rather than on every construction.
+
+        Args:
+            data: Dictionary produced by to_dict() or orjson.loads(to_json()).
+
+        Returns:
+            ExtractionResult: Reconstructed result.
+
+        Raises:
+            KeyError: If "markdown" is missing.
+            ValueError: If a field is invalid (e.g. confidence_score).
+        """
+        kwargs = {name: data[name] for name in _RESULT_FIELDS if name in data}
+        kwargs["markdown"] = data["markdown"]
+
+        if isinstance(kwargs.get("extraction_timestamp"), str):
+            kwargs["extraction_timestamp"] = datetime.fromisoformat(kwargs["extraction_timestamp"])
+
+        confidence_score = kwargs.get("confidence_score", 1.0)
+        if not 0.0 <= confidence_score <= 1.0:
+            raise ValueError(f"confidence_score must be between 0.0 and 1.0, got {confidence_score}")
 
-class BaseExtractor(ABC):
+        return cls(**kwargs)
+
+
+# Constructor fields of ExtractionResult, used by from_dict()
+_RESULT_FIELDS = tuple(f.name for f in fields(ExtractionResult))
+
+
+@lru_cache(maxsize=256)
+def extractor_key(name: str) -> str:
     """
-    Abstract base class for PDF extractors.
+    Normalize an extractor name to its registry key.
+
+    Args:
+        name: Extractor name or key (case-insensitive), e.g. "DoclingExtractor".
+
+    Returns:
+        str: Registry key, e.g. "docling".
+    """
+    return name.casefold().removesuffix("extractor")
+
+
+class Extractor(Protocol):
+    """
+    Structural interface of an extractor, as seen by code that runs them.
+
+    ParallelExecutor and other callers only need a name and extract(), so
+    they accept any object with that shape (including test doubles);
+    implementations should still subclass BaseExtractor for its helpers.
+    """
+
+    name: str
+    version: str
+
+    def extract(self, file_path: Path, options: Optional[Dict[str, Any]] = None) -> ExtractionResult:
+        """Extract markdown content from a PDF file."""
+        ...
+
+
+class BaseExtractor:
+    """
+    Base class for PDF extractors.
 
     All extractor implementations must inherit from this class and
-    implement the required abstract methods.
+    override extract(), is_available() and get_capabilities(). It is a
+    plain class rather than an ABC, so instantiation and isinstance()
+    checks skip ABCMeta; missing overrides raise NotImplementedError
+    when called.
 
     Attributes:
         name: Unique name of the extractor (e.g., "DoclingExtractor").
         version: Version of the extractor implementation.
         description: Human-readable description of the extractor.
+        concurrency_mode: Pool the parallel executor runs it in: "thread"
+            (I/O-bound or GIL-releasing), "process" (CPU-bound Python) or
+            "gpu_serial" (GPU-bound; one at a time to avoid VRAM contention).
 
     Example:
         >>> class MyExtractor(BaseExtractor):
@@ -191,11 +340,43 @@ class BaseExtractor(ABC):
         ...         return {"tables": True, "images": True}
     """
 
+    # Subclasses without __slots__ still get a __dict__; those declaring
+    # __slots__ get compact instances
+    __slots__ = ("_capabilities",)
+
     name: str = "BaseExtractor"
     version: str = "0.0.0"
     description: str = "Base PDF extractor"
+    concurrency_mode: Literal["thread", "process", "gpu_serial"] = "thread"
+
+    # Registry key (e.g. "docling"), set per class by __init_subclass__
+    key: str = extractor_key(name)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Validate class metadata and derive the registry key at class creation.
+
+        Raises:
+            TypeError: If name, version or description is not a non-empty string.
+        """
+        super().__init_subclass__(**kwargs)
+
+        for attr in ("name", "version", "description"):
+            value = getattr(cls, attr)
+            if not isinstance(value, str) or not value:
+                raise TypeError(f"{cls.__name__}.{attr} must be a non-empty string, got {value!r}")
+
+        cls.key = extractor_key(cls.name)
+
+    @property
+    def capabilities(self) -> Dict[str, Any]:
+        """get_capabilities(), computed once per instance. Do not mutate."""
+        try:
+            return self._capabilities
+        except AttributeError:
+            self._capabilities = self.get_capabilities()
+            return self._capabilities
 
-    @abstractmethod
     def extract(self, file_path: Path, options: Optional[Dict[str, Any]] = None) -> ExtractionResult:
         """
         Extract markdown content from a PDF file.
@@ -218,7 +399,6 @@ class BaseExtractor(ABC):
         """
         raise NotImplementedError("Subclass must implement extract()")
 
-    @abstractmethod
     def is_available(self) -> bool:
         """
         Check if the extractor is available and dependencies are installed.
@@ -233,14 +413,15 @@ class BaseExtractor(ABC):
         """
         raise NotImplementedError("Subclass must implement is_available()")
 
-    @abstractmethod
     def get_capabilities(self) -> Dict[str, bool]:
         """
         Get extractor capabilities.
 
         Returns:
             dict: Capabilities dictionary with boolean values.
-                  Keys: tables, images, ocr, formulas, multi_column, metadata
+                  Keys: tables, images, ocr, formulas, multi_column, metadata,
+                  releases_gil (whether extract() spends most of its time
+                  outside the GIL, i.e. scales with threads)
 
         Example:
             >>> extractor = DoclingExtractor()
@@ -250,26 +431,150 @@ class BaseExtractor(ABC):
         """
         raise NotImplementedError("Subclass must implement get_capabilities()")
 
-    def validate_file(self, file_path: Path) -> None:
+    def prewarm(self, file_path: Path) -> None:
+        """
+        Prepare the extractor for an upcoming extraction (optional hook).
+
+        Called by the orchestrator in a background thread while document
+        complexity is being analyzed, so expensive one-time setup (model
+        loading, heavy imports) overlaps with it. The default does nothing.
+
+        Args:
+            file_path: Path to the PDF that will be extracted.
+        """
+        return None
+
+    def validate_file(self, file_path: Path) -> os.stat_result:
         """
         Validate that the file exists and is a PDF.
 
+        Uses a single stat() call; the result is returned so callers can
+        reuse it (e.g. st_size) instead of stat-ing the file again.
+
         Args:
             file_path: Path to validate.
 
+        Returns:
+            os.stat_result: Stat of the validated file.
+
         Raises:
             FileNotFoundError: If file doesn't exist.
             ValueError: If file is not a PDF.
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {file_path}")
 
-        if file_path.suffix.lower() != ".pdf":
+        if not os.fspath(file_path).lower().endswith(".pdf"):
             raise ValueError(f"File is not a PDF: {file_path}")
 
+        return st
+
+    def precheck_pdf(self, file_path: Path, options: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Reject PDFs the pipeline cannot finish before any model is loaded.
+
+        Opens only the trailer and page tree with PyMuPDF, so an encrypted,
+        unreadable or oversized PDF fails in milliseconds instead of deep
+        inside OCR or after an API upload.
+
+        Args:
+            file_path: Validated PDF file.
+            options: Extraction options (max_pages, default: settings.max_pages).
+
+        Returns:
+            int: Page count.
+
+        Raises:
+            ExtractionError: If the PDF cannot be opened, is password
+                protected, has no pages, or has more than max_pages pages.
+        """
+        import fitz  # PyMuPDF
+
+        from src.core.config import get_settings
+
+        max_pages = (options or {}).get("max_pages") or get_settings().max_pages
+
+        def reject(message: str, error: Optional[Exception] = None) -> ExtractionError:
+            return ExtractionError(
+                extractor=self.name,
+                message=message,
+                file_path=str(file_path),
+                original_error=error,
+            )
+
+        try:
+            doc = fitz.open(file_path)
+        except Exception as e:
+            raise reject("PDF cannot be opened", e) from e
+
+        with doc:
+            if doc.needs_pass:
+                raise reject("PDF is password protected")
+            if doc.is_repaired:
+                logger.warning("Damaged PDF cross-reference table repaired: {}", file_path.name)
+            page_count = doc.page_count
+
+        if page_count == 0:
+            raise reject("PDF has no pages")
+        if page_count > max_pages:
+            raise reject(f"PDF has {page_count} pages (limit: {max_pages})")
+
+        return page_count
+
+    def _result_cache(self) -> Optional["ResultCache"]:
+        """
+        Get this extractor's result cache, or None when caching is disabled.
+
+        Returns:
+            ResultCache: Cache under settings.cache_dir/<key>.
+        """
+        from src.core.config import get_settings
+        from src.utils.result_cache import ResultCache
+
+        settings = get_settings()
+        if not settings.extraction_cache_enabled:
+            return None
+        return ResultCache(settings.cache_dir, self.key)
+
+    def _cache_lookup(
+        self, file_path: Path, options: Dict[str, Any]
+    ) -> Tuple[Optional["ResultCache"], Optional[str], Optional[ExtractionResult]]:
+        """
+        Look up a stored result for a PDF and options.
+
+        Identical PDFs (by content) extracted with the same extractor
+        version and options reuse the stored result; {"force_refresh": True}
+        skips the lookup but still returns the key so the fresh result
+        replaces the old one.
+
+        Args:
+            file_path: Validated PDF file.
+            options: Extraction options.
+
+        Returns:
+            tuple: (cache, key, cached result); the cache and key are None
+                when caching is disabled, the result is None on a miss.
+        """
+        from src.utils.result_cache import fingerprint_file
+
+        cache = self._result_cache()
+        if cache is None:
+            return None, None, None
+
+        cache_key = cache.key(fingerprint_file(file_path), self.version, options)
+        if options.get("force_refresh"):
+            return cache, cache_key, None
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("{} result served from cache: {}", self.name, file_path.name)
+        return cache, cache_key, cached
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get extractor information.
@@ -282,7 +587,7 @@ class BaseExtractor(ABC):
             "version": self.version,
             "description": self.description,
             "available": self.is_available(),
-            "capabilities": self.get_capabilities(),
+            "capabilities": dict(self.capabilities),
         }
 
     def __str__(self) -> str:
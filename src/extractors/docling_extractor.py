@@ -4,13 +4,105 @@ PDF-to-Markdown Extractor - Docling Extractor.
 PDF extractor using Docling library for high-quality extraction.
 """
 
+import importlib.util
+import multiprocessing
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 
+from src.core.parallel_executor import default_max_workers, worker_extractor
 from src.extractors.base import BaseExtractor, ExtractionResult
+from src.utils.result_cache import fingerprint_file
+
+try:
+    import msgpack
+except ImportError:  # Optional; batch results are pickled instead
+    msgpack = None
+
+try:
+    from docling_core.types.doc import PictureItem as _PICTURE_CLS
+    from docling_core.types.doc import TableItem as _TABLE_CLS
+except ImportError:  # Docling not installed; isinstance(x, ()) is always False
+    _PICTURE_CLS = _TABLE_CLS = ()
+
+# Document metadata attributes copied into result metadata:
+# (attribute, metadata key, converter or None)
+_DOC_META_FIELDS = (
+    ("author", "author", None),
+    ("creation_date", "creation_date", str),
+)
+
+# Sentinel for getattr(); one lookup instead of hasattr() + attribute access
+_MISSING = object()
+
+# Process-wide DocumentConverter: its layout/table models are loaded once
+# and shared by every DoclingExtractor instance in the process
+_CONVERTER = None
+_CONVERTER_LOCK = threading.Lock()
+
+
+def get_document_converter():
+    """
+    Get the process-wide DocumentConverter, creating it on first use.
+
+    Docling is imported lazily so importing this module never loads torch.
+
+    Returns:
+        DocumentConverter: Shared Docling document converter.
+    """
+    global _CONVERTER
+
+    if _CONVERTER is None:
+        with _CONVERTER_LOCK:
+            if _CONVERTER is None:
+                from docling.document_converter import DocumentConverter
+
+                _CONVERTER = DocumentConverter()
+                logger.debug("DocumentConverter initialized")
+
+    return _CONVERTER
+
+
+@lru_cache(maxsize=1)
+def _docling_available() -> bool:
+    """Check once per process whether docling.document_converter is importable."""
+    try:
+        return importlib.util.find_spec("docling.document_converter") is not None
+    except ImportError:  # Parent "docling" package is missing
+        return False
+
+
+def warm_document_converter() -> None:
+    """
+    Create the shared DocumentConverter and load its PDF pipeline models.
+
+    Also used as the worker initializer of DoclingExtractor.extract_many(),
+    so model loading overlaps with dispatch instead of the first extraction.
+    """
+    from docling.datamodel.base_models import InputFormat
+
+    get_document_converter().initialize_pipeline(InputFormat.PDF)
+
+
+def _extract_packed(
+    class_name: str, file_path: Path, options: Optional[Dict[str, Any]] = None
+) -> Union[bytes, ExtractionResult]:
+    """
+    Worker-side extract_many() task returning a msgpack-encoded result.
+
+    The parent has already looked the PDF up in the result cache and stores
+    the result, so the worker only converts. Falls back to returning the
+    (pickled) result when msgpack is missing.
+    """
+    extractor = worker_extractor(class_name)
+    result = extractor._convert(file_path, file_path.stat().st_size, options or {})
+    return result.to_msgpack() if msgpack is not None else result
 
 
 class DoclingExtractor(BaseExtractor):
@@ -35,25 +127,40 @@ class DoclingExtractor(BaseExtractor):
     name = "DoclingExtractor"
     version = "1.0.0"
     description = "High-quality PDF extraction using Docling library"
-
-    def __init__(self):
-        """Initialize Docling extractor."""
-        self._converter = None
+    concurrency_mode = "process"  # Python-level pipeline holds the GIL
+
+    # All state is process-wide (shared converter) or class-level, so
+    # instances carry no __dict__
+    __slots__ = ()
+
+    # Static capabilities, built once at class definition
+    _CAPABILITIES = MappingProxyType({
+        "tables": True,  # Implemented in Feature #20
+        "images": True,  # Implemented in Feature #21
+        "ocr": True,  # Implemented in Feature #32 (via Docling's built-in OCR)
+        "formulas": True,  # Docling handles formulas well
+        "multi_column": True,  # Docling handles multi-column layouts
+        "metadata": True,  # Implemented in Feature #22
+        "releases_gil": False,  # Python-level pipeline; scales with processes, not threads
+    })
 
     def _get_converter(self):
         """
-        Get or create DocumentConverter instance.
+        Get the shared DocumentConverter instance.
 
         Returns:
             DocumentConverter: Docling document converter.
         """
-        if self._converter is None:
-            from docling.document_converter import DocumentConverter
+        return get_document_converter()
 
-            self._converter = DocumentConverter()
-            logger.debug("DocumentConverter initialized")
+    def prewarm(self, file_path: Path) -> None:
+        """
+        Create the DocumentConverter and load the PDF pipeline models.
 
-        return self._converter
+        Args:
+            file_path: Path to the PDF that will be extracted.
+        """
+        warm_document_converter()
 
     def extract(
         self, file_path: Path, options: Optional[Dict[str, Any]] = None
@@ -61,9 +168,13 @@ class DoclingExtractor(BaseExtractor):
         """
         Extract markdown content from PDF using Docling.
 
+        Successful results are cached by PDF content, extractor version and
+        options (see ResultCache); pass {"force_refresh": True} to bypass
+        the lookup and re-extract.
+
         Args:
             file_path: Path to PDF file.
-            options: Extraction options (currently unused, reserved for future).
+            options: Extraction options (extract_images, force_refresh).
 
         Returns:
             ExtractionResult: Extraction result with markdown and metadata.
@@ -78,16 +189,44 @@ class DoclingExtractor(BaseExtractor):
             >>> result = extractor.extract(Path("doc.pdf"))
             >>> print(result.markdown)
         """
-        # Validate file
-        self.validate_file(file_path)
+        # Validate file (one stat; the size is reused below)
+        file_size = self.validate_file(file_path).st_size
 
         # Initialize options
         options = options or {}
 
+        # Identical PDFs with the same options reuse the stored result
+        cache, cache_key, cached = self._cache_lookup(file_path, options)
+        if cached is not None:
+            return cached
+
+        extraction_result = self._convert(file_path, file_size, options)
+        if cache_key is not None and not extraction_result.errors:
+            cache.put(cache_key, extraction_result)
+
+        return extraction_result
+
+    def _convert(
+        self, file_path: Path, file_size: int, options: Dict[str, Any]
+    ) -> ExtractionResult:
+        """
+        Convert a validated PDF with Docling, bypassing the result cache.
+
+        Args:
+            file_path: Validated PDF file.
+            file_size: File size in bytes.
+            options: Extraction options.
+
+        Returns:
+            ExtractionResult: Extraction result, or an error result if the
+                conversion failed.
+        """
+        file_name = file_path.name
+
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        logger.info(f"Starting Docling extraction: {file_path.name}")
+        logger.info("Starting Docling extraction: {}", file_name)
 
         try:
             # Get converter
@@ -101,16 +240,13 @@ class DoclingExtractor(BaseExtractor):
             markdown_content = doc.export_to_markdown()
 
             # Calculate extraction time
-            extraction_time = time.time() - start_time
-
-            # Extract tables (Feature #20)
-            tables = self._extract_tables(doc)
+            extraction_time = time.perf_counter() - start_time
 
-            # Extract images (Feature #21)
-            images = self._extract_images(doc, file_path, options)
+            # Extract tables, images and title in one walk (Features #20-21)
+            tables, images, first_heading = self._walk_document(doc, options)
 
             # Extract metadata (Feature #22)
-            metadata = self._extract_metadata(doc, file_path)
+            metadata = self._extract_metadata(doc, file_name, file_size, first_heading)
 
             # Build extraction result
             extraction_result = ExtractionResult(
@@ -127,20 +263,22 @@ class DoclingExtractor(BaseExtractor):
             )
 
             logger.info(
-                f"Docling extraction completed: {file_path.name} "
-                f"({extraction_time:.2f}s, {len(markdown_content)} chars)"
+                "Docling extraction completed: {} ({:.2f}s, {} chars)",
+                file_name,
+                extraction_time,
+                len(markdown_content),
             )
 
             return extraction_result
 
         except Exception as e:
-            extraction_time = time.time() - start_time
-            logger.error(f"Docling extraction failed for {file_path.name}: {e}")
+            extraction_time = time.perf_counter() - start_time
+            logger.error("Docling extraction failed for {}: {}", file_name, e)
 
             # Return result with error
             return ExtractionResult(
                 markdown="",
-                metadata={"filename": file_path.name},
+                metadata={"filename": file_name},
                 confidence_score=0.0,
                 extractor_name=self.name,
                 extractor_version=self.version,
@@ -149,24 +287,114 @@ class DoclingExtractor(BaseExtractor):
                 options=options,
             )
 
+    def extract_many(
+        self,
+        paths: Iterable[Path],
+        options: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extract many PDFs across a pool of worker processes.
+
+        Docling conversion is CPU-bound Python, so threads would serialize
+        on the GIL. Cached results are yielded first without dispatching;
+        the remaining PDFs are converted in spawned worker processes that
+        each warm one DocumentConverter, and their results are yielded in
+        input order as they complete. Results cross the process boundary
+        as msgpack when it is installed.
+
+        Args:
+            paths: PDF files to extract.
+            options: Extraction options applied to every file.
+            workers: Worker processes (default: default_max_workers()).
+
+        Yields:
+            ExtractionResult: One result per PDF (match them with
+                metadata["filename"]).
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist.
+            ValueError: If a file is not a PDF.
+
+        Example:
+            >>> extractor = DoclingExtractor()
+            >>> for result in extractor.extract_many(Path("pdfs").glob("*.pdf")):
+            ...     print(result.metadata["filename"], result.success)
+        """
+        options = options or {}
+        paths = list(paths)
+
+        for file_path in paths:
+            self.validate_file(file_path)
+
+        # Serve cache hits in this process; only misses are dispatched.
+        # Each PDF is hashed once here: workers skip the cache and the
+        # parent stores their results under the keys computed below
+        cache = self._result_cache()
+        pending: List[Path] = []
+        keys: List[Optional[str]] = []
+        for file_path in paths:
+            cache_key = cached = None
+            if cache is not None:
+                cache_key = cache.key(fingerprint_file(file_path), self.version, options)
+                if not options.get("force_refresh"):
+                    cached = cache.get(cache_key)
+            if cached is not None:
+                yield cached
+            else:
+                pending.append(file_path)
+                keys.append(cache_key)
+
+        if not pending:
+            return
+
+        workers = min(workers or default_max_workers(), len(pending))
+        if workers == 1:
+            for file_path, cache_key in zip(pending, keys):
+                result = self._convert(file_path, file_path.stat().st_size, options)
+                if cache_key is not None and not result.errors:
+                    cache.put(cache_key, result)
+                yield result
+            return
+
+        logger.info("Extracting {} PDFs with {} Docling worker processes", len(pending), workers)
+
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_document_converter,
+        )
+        try:
+            packed_results = pool.map(
+                partial(_extract_packed, type(self).__name__, options=options),
+                pending,
+                chunksize=max(1, len(pending) // (workers * 4)),
+            )
+            for cache_key, packed in zip(keys, packed_results):
+                result = packed if isinstance(packed, ExtractionResult) else ExtractionResult.from_msgpack(packed)
+                if cache_key is not None and not result.errors:
+                    cache.put(cache_key, result)
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def is_available(self) -> bool:
         """
         Check if Docling is available.
 
+        Locates the module without executing it, so answering does not
+        import torch and the Docling models. The answer cannot change
+        within a process, so it is computed once.
+
         Returns:
-            bool: True if Docling can be imported, False otherwise.
+            bool: True if Docling is installed, False otherwise.
 
         Example:
             >>> extractor = DoclingExtractor()
             >>> if extractor.is_available():
             ...     print("Docling is ready")
         """
-        try:
-            from docling.document_converter import DocumentConverter
-
-            return True
-        except ImportError:
-            return False
+        return _docling_available()
 
     def get_capabilities(self) -> Dict[str, bool]:
         """
@@ -181,123 +409,104 @@ class DoclingExtractor(BaseExtractor):
             >>> print(caps["tables"])
             True
         """
-        return {
-            "tables": True,  # Implemented in Feature #20
-            "images": True,  # Implemented in Feature #21
-            "ocr": True,  # Implemented in Feature #32 (via Docling's built-in OCR)
-            "formulas": True,  # Docling handles formulas well
-            "multi_column": True,  # Docling handles multi-column layouts
-            "metadata": True,  # Implemented in Feature #22
-        }
+        return dict(self._CAPABILITIES)
 
-    def _extract_tables(self, doc) -> list[str]:
+    def _walk_document(
+        self, doc, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[str], List[str], Optional[str]]:
         """
-        Extract tables from Docling document (Feature #20).
+        Collect tables, images and the first heading in a single pass.
+
+        Walking the item tree once replaces separate walks for tables
+        (Feature #20), images (Feature #21) and the fallback title
+        (Feature #22).
 
         Args:
             doc: Docling document object.
+            options: Extraction options (extract_images).
 
         Returns:
-            list[str]: List of tables as markdown strings.
+            tuple: (tables as markdown strings, image references, first
+                top-level text or None).
         """
-        tables = []
+        # No per-item logging here: this loop runs once per document node
+        tables: List[str] = []
+        images: List[str] = []
+        first_heading: Optional[str] = None
+
+        # Check if image extraction is enabled
+        extract_images = options.get("extract_images", False) if options else False
 
         try:
-            # Iterate through document items to find tables
             for item, level in doc.iterate_items():
                 # Check if item is a table
-                if hasattr(item, "export_to_markdown") and "Table" in str(type(item)):
-                    table_md = item.export_to_markdown()
-                    tables.append(table_md)
-                    logger.debug(f"Extracted table: {len(table_md)} chars")
-
-        except Exception as e:
-            logger.warning(f"Table extraction failed: {e}")
-
-        logger.info(f"Extracted {len(tables)} tables")
-        return tables
-
-    def _extract_images(
-        self, doc, file_path: Path, options: Optional[Dict[str, Any]] = None
-    ) -> list[str]:
-        """
-        Extract images from Docling document (Feature #21).
-
-        Args:
-            doc: Docling document object.
-            file_path: Original PDF file path.
-            options: Extraction options.
+                if isinstance(item, _TABLE_CLS):
+                    tables.append(item.export_to_markdown())
 
-        Returns:
-            list[str]: List of image references/paths.
-        """
-        images = []
+                # Check if item is a picture/image
+                # For now, just track that an image was found
+                # Full extraction to file will be in future enhancement
+                elif extract_images and isinstance(item, _PICTURE_CLS):
+                    images.append(f"image_{len(images)}")
 
-        try:
-            # Check if image extraction is enabled
-            extract_images = options.get("extract_images", False) if options else False
-
-            if extract_images:
-                # Iterate through document to find images
-                for item, level in doc.iterate_items():
-                    # Check if item is a picture/image
-                    if hasattr(item, "image") or "Picture" in str(type(item)):
-                        # For now, just track that an image was found
-                        # Full extraction to file will be in future enhancement
-                        image_ref = f"image_{len(images)}"
-                        images.append(image_ref)
-                        logger.debug(f"Found image: {image_ref}")
+                if first_heading is None and level == 0 and hasattr(item, "text"):
+                    first_heading = item.text
 
         except Exception as e:
-            logger.warning(f"Image extraction failed: {e}")
-
-        logger.info(f"Found {len(images)} images")
-        return images
-
-    def _extract_metadata(self, doc, file_path: Path) -> Dict[str, Any]:
+            logger.warning("Document walk failed: {}", e)
+
+        logger.info("Extracted {} tables, found {} images", len(tables), len(images))
+        return tables, images, first_heading
+
+    def _extract_metadata(
+        self,
+        doc,
+        file_name: str,
+        file_size: int,
+        first_heading: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Extract metadata from Docling document (Feature #22).
 
         Args:
             doc: Docling document object.
-            file_path: Original PDF file path.
+            file_name: Original PDF file name.
+            file_size: Original PDF size in bytes.
+            first_heading: First top-level text from _walk_document(),
+                used as the title when the document has no name.
 
         Returns:
             dict: Metadata dictionary with title, author, page_count, etc.
         """
         metadata = {
-            "filename": file_path.name,
-            "file_size": file_path.stat().st_size,
+            "filename": file_name,
+            "file_size": file_size,
         }
 
         try:
             # Extract page count
-            if hasattr(doc, "pages") and doc.pages:
-                metadata["page_count"] = len(doc.pages)
-            else:
-                metadata["page_count"] = 0
+            pages = getattr(doc, "pages", None)
+            metadata["page_count"] = len(pages) if pages else 0
 
             # Extract title (from document or first heading)
-            if hasattr(doc, "name") and doc.name:
-                metadata["title"] = doc.name
-            else:
-                # Try to get first heading as title
-                for item, level in doc.iterate_items():
-                    if hasattr(item, "text") and level == 0:
-                        metadata["title"] = item.text
-                        break
+            name = getattr(doc, "name", None)
+            if name:
+                metadata["title"] = name
+            elif first_heading is not None:
+                # Fall back to the first heading as title
+                metadata["title"] = first_heading
 
             # Extract other metadata if available
-            if hasattr(doc, "metadata"):
-                doc_meta = doc.metadata
-                if hasattr(doc_meta, "author"):
-                    metadata["author"] = doc_meta.author
-                if hasattr(doc_meta, "creation_date"):
-                    metadata["creation_date"] = str(doc_meta.creation_date)
+            doc_meta = getattr(doc, "metadata", _MISSING)
+            if doc_meta is not _MISSING:
+                for attr, key, convert in _DOC_META_FIELDS:
+                    value = getattr(doc_meta, attr, _MISSING)
+                    if value is not _MISSING:
+                        metadata[key] = convert(value) if convert else value
 
-            logger.debug(f"Extracted metadata: {metadata}")
+            logger.debug("Extracted metadata: {}", metadata)
 
         except Exception as e:
-            logger.warning(f"Metadata extraction failed: {e}")
+            logger.warning("Metadata extraction failed: {}", e)
 
         return metadata
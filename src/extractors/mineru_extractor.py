@@ -8,13 +8,224 @@ Supports:
 - Comprehensive error handling (Feature #55)
 """
 
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import atexit
+import importlib.util
+import io
+import math
+import mmap
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache, partial
+from operator import attrgetter, methodcaller
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 
-from src.extractors.base import BaseExtractor, ExtractionResult, ExtractionError
+from src.core.parallel_executor import worker_extractor
+from src.extractors.base import (
+    BaseExtractor,
+    ExtractionError,
+    ExtractionResult,
+    ExtractorRecoverableError,
+)
+from src.utils.file_utils import map_file
+
+
+# Upper bound on concurrent page-chunk pipelines per PDF (opt-in, see extract)
+MAX_CHUNK_WORKERS = 4
+
+# Smallest page chunk worth a separate pipeline run when splitting for workers
+MIN_PAGES_PER_CHUNK = 4
+
+# Pages with images and less embedded text than this are sent through OCR
+OCR_MIN_TEXT_CHARS = 10
+
+# How each result field is read from a pipe result, in order of preference:
+# (accessor method, attribute, default when the result has neither)
+_RESULT_SHAPES: Dict[str, Tuple[Optional[str], Optional[str], Callable[[Any], Any]]] = {
+    "markdown": ("get_markdown", "markdown", str),  # Fallback: construct from text
+    "tables": ("get_tables", None, lambda _: []),
+    "formulas": ("get_formulas", "formulas", lambda _: []),
+    "images": ("get_images", None, lambda _: []),
+    "metadata": ("get_metadata", "metadata", lambda _: {}),
+}
+
+# Field readers per pipe result class, resolved on first sight of the class
+_RESULT_ADAPTERS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+
+
+def _result_adapter(pipe_result: Any) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Get the field readers for a pipe result's class.
+
+    The result shape differs across magic-pdf versions; it is probed once
+    per class instead of with hasattr() on every field of every result.
+
+    Args:
+        pipe_result: MinerU pipe result.
+
+    Returns:
+        dict: Field name -> callable(pipe_result) returning the field.
+    """
+    adapter = _RESULT_ADAPTERS.get(type(pipe_result))
+    if adapter is None:
+        adapter = {}
+        for field, (method, attribute, default) in _RESULT_SHAPES.items():
+            if method and hasattr(pipe_result, method):
+                adapter[field] = methodcaller(method)
+            elif attribute and hasattr(pipe_result, attribute):
+                adapter[field] = attrgetter(attribute)
+            else:
+                adapter[field] = default
+        _RESULT_ADAPTERS[type(pipe_result)] = adapter
+
+    return adapter
+
+
+@lru_cache(maxsize=1)
+def _probe_mineru() -> bool:
+    """
+    Check once per process whether MinerU (magic_pdf) can be imported.
+
+    Returns:
+        bool: True if MinerU is installed.
+    """
+    try:
+        # Try to import magic_pdf (MinerU package)
+        import magic_pdf  # noqa: F401
+    except ImportError as e:
+        logger.warning(
+            "MinerUExtractor not available: MinerU not installed. "
+            "Install with: pip install magic-pdf[cpu] or magic-pdf[gpu]. Error: {}",
+            e,
+        )
+        return False
+
+    logger.info("MinerUExtractor initialized successfully")
+    return True
+
+
+@lru_cache(maxsize=1)
+def _probe_gpu() -> Tuple[bool, Optional[str]]:
+    """
+    Detect a CUDA GPU once per process (Feature #67).
+
+    torch is only imported when it is installed, so the check is free on
+    CPU-only deployments without it.
+
+    Returns:
+        tuple: (GPU available, device name or None).
+    """
+    if importlib.util.find_spec("torch") is None:
+        logger.debug("PyTorch not available, cannot detect GPU")
+        return False, None
+
+    try:
+        import torch
+
+        if not torch.cuda.is_available():
+            logger.info("No GPU detected, MinerU will use CPU")
+            return False, None
+
+        gpu_name = torch.cuda.get_device_name(0)
+        logger.info("GPU detected for MinerU: {}", gpu_name)
+        _configure_cuda(torch)
+        return True, gpu_name
+
+    except Exception as e:
+        logger.warning("GPU detection failed: {}", e)
+        return False, None
+
+
+@lru_cache(maxsize=1)
+def _probe_gpu_count() -> int:
+    """
+    Count the CUDA devices once per process.
+
+    Returns:
+        int: Number of visible GPUs (0 without a GPU).
+    """
+    if not _probe_gpu()[0]:
+        return 0
+
+    import torch
+
+    return torch.cuda.device_count()
+
+
+def _pin_worker_gpu(counter: Any, gpu_count: int) -> None:
+    """
+    Pin an extract_many() worker process to one GPU, round-robin.
+
+    Runs as the pool initializer, before the worker imports torch, so the
+    worker (and MinerU's model singleton) only ever sees its own device.
+
+    Args:
+        counter: Shared multiprocessing.Value numbering the workers.
+        gpu_count: Number of GPUs to spread the workers over.
+    """
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(worker_id % gpu_count)
+
+
+def _extract_pinned(
+    class_name: str, file_path: Path, options: Optional[Dict[str, Any]] = None
+) -> ExtractionResult:
+    """Worker-side extract_many() task, on the GPU pinned by _pin_worker_gpu()."""
+    return worker_extractor(class_name).extract(file_path, options)
+
+
+def _configure_cuda(torch: Any) -> None:
+    """
+    Enable the fast CUDA math paths for MinerU's models (process-wide).
+
+    TF32 matmuls/convolutions keep FP32 range with tensor-core speed, and
+    cuDNN autotuning picks the fastest convolution kernels per input shape.
+
+    Args:
+        torch: The imported torch module.
+    """
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
+
+
+def _autocast_dtype(torch: Any, dtype: Optional[str]) -> Any:
+    """
+    Map a dtype option to the torch dtype to autocast to.
+
+    BF16 needs Ampere (compute capability 8.0) or newer; older GPUs get
+    FP16 instead.
+
+    Args:
+        torch: The imported torch module.
+        dtype: "bf16", "fp16", or None for FP32.
+
+    Returns:
+        torch.dtype: Autocast dtype, or None to run in FP32.
+    """
+    if dtype == "bf16":
+        if torch.cuda.get_device_capability()[0] >= 8:
+            return torch.bfloat16
+        logger.debug("BF16 not supported on this GPU, using FP16")
+        return torch.float16
+    if dtype == "fp16":
+        return torch.float16
+    if dtype not in (None, "fp32"):
+        logger.warning("Unknown MinerU dtype {!r}, using FP32", dtype)
+    return None
 
 
 class MinerUExtractor(BaseExtractor):
@@ -42,23 +253,20 @@ class MinerUExtractor(BaseExtractor):
         """Initialize MinerU extractor."""
         self._mineru_available = None
         self._gpu_available = None
+        self._workspace = None  # Created on first extraction
+        self._workspace_lock = threading.Lock()
         self._check_availability()
         self._check_gpu()  # Feature #67
+        self._gpu_devices = list(range(_probe_gpu_count()))
+
+        # Torch releases the GIL, so threads suffice on CPU; on GPU run
+        # serially to avoid VRAM contention
+        if self._gpu_available:
+            self.concurrency_mode = "gpu_serial"
 
     def _check_availability(self) -> None:
         """Check if MinerU is installed and available."""
-        try:
-            # Try to import magic_pdf (MinerU package)
-            import magic_pdf  # noqa: F401
-            self._mineru_available = True
-            logger.info(f"{self.name} initialized successfully")
-        except ImportError as e:
-            self._mineru_available = False
-            logger.warning(
-                f"{self.name} not available: MinerU not installed. "
-                f"Install with: pip install magic-pdf[cpu] or magic-pdf[gpu]. "
-                f"Error: {e}"
-            )
+        self._mineru_available = _probe_mineru()
 
     def is_available(self) -> bool:
         """
@@ -71,6 +279,20 @@ class MinerUExtractor(BaseExtractor):
             self._check_availability()
         return self._mineru_available is True
 
+    def prewarm(self, file_path: Path) -> None:
+        """
+        Import the MinerU pipeline modules ahead of extraction.
+
+        Args:
+            file_path: Path to the PDF that will be extracted.
+        """
+        if not self.is_available():
+            return
+
+        from magic_pdf.pipe.UNIPipe import UNIPipe  # noqa: F401
+        from magic_pdf.pipe.OCRPipe import OCRPipe  # noqa: F401
+        from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze  # noqa: F401
+
     def extract(
         self,
         file_path: Path,
@@ -85,14 +307,25 @@ class MinerUExtractor(BaseExtractor):
                 - extract_tables (bool): Extract tables with structure (default: True, Feature #53)
                 - extract_formulas (bool): Extract LaTeX formulas (default: True, Feature #54)
                 - extract_images (bool): Extract images (default: False)
-                - ocr_enabled (bool): Enable OCR for scanned docs (default: True)
+                - ocr_enabled (bool): Enable OCR for pages without a text layer (default: True)
+                - force_ocr (bool): OCR every page, even digital ones (default: False)
                 - vlm_mode (bool): Enable Vision Language Model mode (default: False, Feature #70)
+                - dtype (str): "bf16" or "fp16" to run the models in reduced precision
+                  on GPU (default: FP32; bf16 falls back to fp16 before Ampere)
+                - workers (int): Concurrent page-chunk pipelines, capped at
+                  MAX_CHUNK_WORKERS (default: 1). Chunks run in threads that share
+                  magic-pdf's process-wide model singleton, which is not documented
+                  as thread-safe; only raise this for a model setup known to
+                  tolerate concurrent inference
+                - max_pages (int): Reject longer PDFs (default: settings.max_pages)
+                - force_refresh (bool): Re-extract even if a cached result exists
 
         Returns:
             ExtractionResult: Extraction result.
 
         Raises:
-            ExtractionError: If extraction fails (Feature #55).
+            ExtractionError: If the PDF is encrypted, unreadable or too long,
+                or if extraction fails (Feature #55).
 
         Example:
             >>> extractor = MinerUExtractor()
@@ -103,7 +336,7 @@ class MinerUExtractor(BaseExtractor):
         """
         # Feature #55: Comprehensive error handling
         if not self.is_available():
-            raise ExtractionError(
+            raise ExtractorRecoverableError(
                 extractor=self.name,
                 message="MinerU is not installed. Install with: pip install magic-pdf[cpu]",
                 file_path=str(file_path),
@@ -114,119 +347,505 @@ class MinerUExtractor(BaseExtractor):
 
         # Parse options
         options = options or {}
+        page_count = self.precheck_pdf(file_path, options)
         extract_tables = options.get("extract_tables", True)  # Feature #53
         extract_formulas = options.get("extract_formulas", True)  # Feature #54
         extract_images = options.get("extract_images", False)
         ocr_enabled = options.get("ocr_enabled", True)
         vlm_mode = options.get("vlm_mode", False)  # Feature #70
+        dtype = options.get("dtype")
+
+        # Identical PDFs with the same options reuse the stored result
+        cache, cache_key, cached = self._cache_lookup(file_path, options)
+        if cached is not None:
+            return cached
 
-        logger.info(f"Starting MinerU extraction: {file_path.name}")
+        logger.info("Starting MinerU extraction: {}", file_path.name)
         logger.debug(
-            f"Options: tables={extract_tables}, formulas={extract_formulas}, "
-            f"images={extract_images}, ocr={ocr_enabled}, vlm_mode={vlm_mode}"
+            "Options: tables={}, formulas={}, images={}, ocr={}, vlm_mode={}",
+            extract_tables, extract_formulas, extract_images, ocr_enabled, vlm_mode,
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Import MinerU here (lazy import)
-            from magic_pdf.pipe.UNIPipe import UNIPipe
-            from magic_pdf.pipe.OCRPipe import OCRPipe
-            from magic_pdf.rw.DiskReaderWriter import DiskReaderWriter
-            from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze
+            with self._image_writer() as image_writer:
+                # Only runs of pages lacking a text layer go through OCR.
+                # Opt-in: runs are also cut into chunks that run in threads
+                # sharing one copy of the models (see the workers option).
+                # The PDF is mapped, not read, so only the chunks are copied
+                workers = self._chunk_workers(options)
+                with map_file(file_path) as pdf:
+                    chunks, chunk_ocr = self._plan_chunks(pdf, page_count, workers, options)
+                workers = min(workers, len(chunks))
+
+                logger.debug(
+                    "Running MinerU on {} pages in {} chunk(s) ({} OCR) with {} worker(s)",
+                    page_count, len(chunks), sum(chunk_ocr), workers,
+                )
+
+                if workers <= 1:
+                    pipe_results = [
+                        self._run_pipe(chunk, image_writer, ocr, vlm_mode, dtype=dtype)
+                        for chunk, ocr in zip(chunks, chunk_ocr)
+                    ]
+                else:
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mineru") as pool:
+                        # map() keeps chunk (page) order
+                        pipe_results = list(pool.map(
+                            lambda chunk, ocr: self._run_pipe(
+                                chunk, image_writer, ocr, vlm_mode, dtype=dtype
+                            ),
+                            chunks,
+                            chunk_ocr,
+                        ))
+
+                result = self._build_result(
+                    file_path, pipe_results, page_count, options, start_time
+                )
+
+            if cache_key is not None:
+                cache.put(cache_key, result)
+            return result
 
-            # Read PDF file
-            pdf_bytes = file_path.read_bytes()
+        except Exception as e:
+            # Feature #55: Comprehensive error handling
+            error_msg = f"MinerU extraction failed: {str(e)}"
+            logger.error("{} (file: {})", error_msg, file_path.name)
 
-            # Create output directory for intermediate files
-            output_dir = file_path.parent / ".mineru_temp"
-            output_dir.mkdir(exist_ok=True)
+            raise ExtractionError(
+                extractor=self.name,
+                message=error_msg,
+                file_path=str(file_path),
+                original_error=e,
+            )
 
-            # Initialize image writer
-            image_writer = DiskReaderWriter(str(output_dir))
+    def extract_many(
+        self,
+        paths: Iterable[Path],
+        options: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extract many PDFs, spread over every GPU.
 
-            # Step 1: Analyze document structure (MinerU 0.7.0+ API)
-            logger.debug(f"Analyzing document structure with OCR={ocr_enabled}")
-            analysis_result = doc_analyze(pdf_bytes, ocr=ocr_enabled, show_log=False)
+        A single process keeps all of MinerU's models on one device, so on
+        a multi-GPU machine the PDFs are extracted in spawned worker
+        processes, each pinned to one GPU (round-robin) before torch is
+        imported. With one GPU or none, PDFs are extracted in turn here.
 
-            # Step 2: Choose pipeline based on OCR requirement and VLM mode (Feature #70)
-            if ocr_enabled or vlm_mode:
-                # Use OCR pipeline for scanned documents or VLM mode
-                if vlm_mode:
-                    logger.info("Using VLM mode for enhanced extraction accuracy")
+        Args:
+            paths: PDF files to extract.
+            options: Extraction options applied to every file.
+            workers: Worker processes (default: one per GPU).
 
-                # OCRPipe requires model_list from analysis
-                model_list = analysis_result.get("model_list", [])
-                pipe = OCRPipe(pdf_bytes, model_list, image_writer, is_debug=False)
+        Yields:
+            ExtractionResult: One result per PDF, in input order.
 
-            else:
-                # Use standard pipeline for digital PDFs
-                # UNIPipe requires jso_useful_key from analysis
-                jso_useful_key = analysis_result
-                pipe = UNIPipe(pdf_bytes, jso_useful_key, image_writer, is_debug=False)
+        Raises:
+            FileNotFoundError: If a file doesn't exist.
+            ValueError: If a file is not a PDF.
 
-            # Run extraction
-            pipe_result = pipe.pipe_parse()
+        Example:
+            >>> extractor = MinerUExtractor()
+            >>> for result in extractor.extract_many(Path("scans").glob("*.pdf")):
+            ...     print(result.metadata["filename"], result.page_count)
+        """
+        paths = list(paths)
+        for file_path in paths:
+            self.validate_file(file_path)
+
+        gpu_count = len(self._gpu_devices)
+        workers = min(workers or gpu_count, len(paths))
+        if gpu_count <= 1 or workers <= 1:
+            for file_path in paths:
+                yield self.extract(file_path, options)
+            return
+
+        logger.info(
+            "Extracting {} PDFs with {} MinerU worker processes on {} GPUs",
+            len(paths), workers, gpu_count,
+        )
 
-            # Extract markdown content
-            markdown_content = self._extract_markdown(pipe_result, file_path)
+        context = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_pin_worker_gpu,
+            initargs=(context.Value("i", 0), gpu_count),
+        )
+        try:
+            yield from pool.map(
+                partial(_extract_pinned, type(self).__name__, options=options),
+                paths,
+            )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
+    def _build_result(
+        self,
+        file_path: Path,
+        pipe_results: List[Any],
+        page_count: int,
+        options: Dict[str, Any],
+        start_time: float,
+    ) -> ExtractionResult:
+        """
+        Stitch per-chunk pipe results (in page order) into one result.
+
+        Args:
+            file_path: Original PDF file path.
+            pipe_results: MinerU pipe results, one per chunk, in page order.
+            page_count: Total page count.
+            options: Extraction options.
+            start_time: time.perf_counter() at extraction start.
+
+        Returns:
+            ExtractionResult: Extraction result.
+        """
+        markdown_content = "\n\n".join(
+            self._extract_markdown(pipe_result, file_path) for pipe_result in pipe_results
+        )
+
+        tables: List[str] = []
+        formulas: List[str] = []
+        images: List[str] = []
+        for pipe_result in pipe_results:
             # Feature #53: Extract tables with structure
-            tables = []
-            if extract_tables:
-                tables = self._extract_tables(pipe_result)
+            if options.get("extract_tables", True):
+                tables.extend(self._extract_tables(pipe_result))
 
             # Feature #54: Extract formulas as LaTeX
-            formulas = []
-            if extract_formulas:
-                formulas = self._extract_formulas(pipe_result)
+            if options.get("extract_formulas", True):
+                formulas.extend(self._extract_formulas(pipe_result))
 
             # Extract images (if requested)
-            images = []
-            if extract_images:
-                images = self._extract_images(pipe_result)
+            if options.get("extract_images", False):
+                images.extend(self._extract_images(pipe_result))
+
+        # Extract metadata
+        metadata = self._extract_metadata(file_path, pipe_results[0])
+        metadata["page_count"] = page_count
+        if options.get("extract_formulas", True):
+            metadata["formulas"] = formulas
+
+        # Calculate extraction time
+        extraction_time = time.perf_counter() - start_time
+
+        logger.info(
+            "MinerU extraction completed: {} ({:.2f}s, {} chars)",
+            file_path.name,
+            extraction_time,
+            len(markdown_content),
+        )
+
+        return ExtractionResult(
+            markdown=markdown_content,
+            metadata=metadata,
+            images=images,
+            tables=tables,
+            confidence_score=0.90,  # MinerU is highly accurate
+            extraction_time=extraction_time,
+            extractor_name=self.name,
+            extractor_version=self.version,
+            page_count=page_count,
+            options=options,
+        )
 
-            # Extract metadata
-            metadata = self._extract_metadata(file_path, pipe_result)
+    @contextmanager
+    def _image_writer(self) -> Iterator[Any]:
+        """
+        Get an image writer for one extraction's intermediate files.
 
-            # Calculate extraction time
-            extraction_time = time.time() - start_time
+        Each extraction writes into its own subdirectory of the extractor's
+        temporary workspace, removed as soon as the result is built, so a
+        long-lived worker does not grow /tmp. The workspace itself is created
+        once and removed at interpreter exit instead of leaving a
+        .mineru_temp directory next to every input PDF.
 
-            logger.info(
-                f"MinerU extraction completed: {file_path.name} "
-                f"({extraction_time:.2f}s, {len(markdown_content)} chars)"
-            )
+        Yields:
+            DiskReaderWriter: Writer rooted at a fresh subdirectory.
+        """
+        from magic_pdf.rw.DiskReaderWriter import DiskReaderWriter
 
-            return ExtractionResult(
-                markdown=markdown_content,
-                metadata=metadata,
-                images=images,
-                tables=tables,
-                formulas=formulas,
-                confidence_score=0.90,  # MinerU is highly accurate
-                extraction_time=extraction_time,
-                extractor_name=self.name,
-                extractor_version=self.version,
-                success=True,
-            )
+        if self._workspace is None:
+            with self._workspace_lock:
+                if self._workspace is None:
+                    workspace = tempfile.mkdtemp(prefix="mineru_")
+                    atexit.register(shutil.rmtree, workspace, ignore_errors=True)
+                    self._workspace = workspace
+
+        directory = tempfile.mkdtemp(prefix="extract_", dir=self._workspace)
+        try:
+            yield DiskReaderWriter(directory)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    def _chunk_workers(options: Dict[str, Any]) -> int:
+        """
+        Get the number of concurrent chunk pipelines requested.
+
+        Args:
+            options: Extraction options.
+
+        Returns:
+            int: options["workers"] capped at MAX_CHUNK_WORKERS, 1 by default
+                 (magic-pdf's shared models are not known to be thread-safe).
+        """
+        return max(1, min(options.get("workers") or 1, MAX_CHUNK_WORKERS))
+
+    def _plan_chunks(
+        self,
+        pdf: Union[bytes, mmap.mmap],
+        page_count: int,
+        workers: int,
+        options: Dict[str, Any],
+    ) -> Tuple[List[bytes], List[bool]]:
+        """
+        Split a PDF into the chunks to run, each with its OCR decision.
+
+        Args:
+            pdf: PDF content, or a map_file() mapping (parsed in place).
+            page_count: Number of pages (from precheck_pdf()).
+            workers: Number of concurrent workers.
+            options: Extraction options (ocr_enabled, force_ocr).
+
+        Returns:
+            tuple: (chunk PDFs in page order, OCR flag per chunk). A PDF
+                that forms a single run is returned unsplit.
+        """
+        runs = self._page_runs(self._page_ocr_flags(pdf, page_count, options), workers)
+        chunk_ocr = [ocr for _, _, ocr in runs]
+
+        if len(runs) == 1:
+            return [bytes(pdf)], chunk_ocr
+
+        logger.debug("OCR needed for {}/{} chunk(s)", sum(chunk_ocr), len(runs))
+        return self._split_pdf(pdf, runs), chunk_ocr
+
+    @staticmethod
+    def _page_runs(page_ocr: List[bool], workers: int) -> List[Tuple[int, int, bool]]:
+        """
+        Group consecutive pages that share an OCR decision.
+
+        With several workers, runs are also cut so each worker gets about
+        one chunk, but never below MIN_PAGES_PER_CHUNK pages.
+
+        Args:
+            page_ocr: OCR flag per page.
+            workers: Number of concurrent workers.
+
+        Returns:
+            list[tuple]: (first page, end page, needs OCR) in page order.
+        """
+        if workers <= 1:
+            max_pages = len(page_ocr)
+        else:
+            max_pages = max(MIN_PAGES_PER_CHUNK, math.ceil(len(page_ocr) / workers))
+
+        runs: List[Tuple[int, int, bool]] = []
+        for page, ocr in enumerate(page_ocr):
+            if runs and runs[-1][2] == ocr and page - runs[-1][0] < max_pages:
+                runs[-1] = (runs[-1][0], page + 1, ocr)
+            else:
+                runs.append((page, page + 1, ocr))
+        return runs
+
+    def _split_pdf(self, pdf: Union[bytes, mmap.mmap], runs: List[Tuple[int, int, bool]]) -> List[bytes]:
+        """
+        Write each page run to its own PDF.
+
+        Args:
+            pdf: PDF content, or a map_file() mapping (parsed in place).
+            runs: Page runs from _page_runs().
+
+        Returns:
+            list[bytes]: One chunk PDF per run, in page order.
+        """
+        from pypdf import PdfReader, PdfWriter
+
+        reader = PdfReader(pdf if isinstance(pdf, mmap.mmap) else io.BytesIO(pdf))
+
+        chunks = []
+        for first, end, _ in runs:
+            writer = PdfWriter()
+            for page in reader.pages[first:end]:
+                writer.add_page(page)
+
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            chunks.append(buffer.getvalue())
+
+        return chunks
+
+    def _needs_ocr(
+        self, pdf: Union[bytes, mmap.mmap], threshold: int = OCR_MIN_TEXT_CHARS
+    ) -> List[bool]:
+        """
+        Flag pages that look scanned.
+
+        Digital PDFs already carry their text, and OCR would dominate the
+        run time without improving it. Pages with fewer than threshold
+        characters of embedded text are flagged only if they contain an
+        image; truly empty pages (e.g. separators) have nothing to OCR.
+
+        Args:
+            pdf: PDF content, or a map_file() mapping.
+            threshold: Minimum embedded characters for a page to skip OCR.
 
+        Returns:
+            list[bool]: One flag per page, True if the page needs OCR.
+        """
+        import fitz  # PyMuPDF
+
+        # PyMuPDF takes a memoryview but not the mmap itself; the view is
+        # released before the mapping is closed
+        with memoryview(pdf) as view, fitz.open(stream=view, filetype="pdf") as doc:
+            return [
+                len(page.get_text().strip()) < threshold and bool(page.get_images())
+                for page in doc
+            ]
+
+    def _page_ocr_flags(
+        self, pdf: Union[bytes, mmap.mmap], page_count: int, options: Dict[str, Any]
+    ) -> List[bool]:
+        """
+        Decide per page whether to run the OCR pipeline.
+
+        Args:
+            pdf: PDF content, or a map_file() mapping.
+            page_count: Number of pages.
+            options: Extraction options (ocr_enabled, force_ocr).
+
+        Returns:
+            list[bool]: True for pages needing OCR (every page with
+                force_ocr, none without ocr_enabled).
+        """
+        if not options.get("ocr_enabled", True):
+            return [False] * page_count
+        if options.get("force_ocr", False):
+            return [True] * page_count
+
+        try:
+            return self._needs_ocr(pdf)
         except Exception as e:
-            # Feature #55: Comprehensive error handling
-            extraction_time = time.time() - start_time
-            error_msg = f"MinerU extraction failed: {str(e)}"
-            logger.error(f"{error_msg} (file: {file_path.name})")
+            logger.debug("Text-layer check failed, using OCR: {}", e)
+            return [True] * page_count
 
-            raise ExtractionError(
-                extractor=self.name,
-                message=error_msg,
-                file_path=str(file_path),
-                original_error=e,
-            )
+    def _run_pipe(
+        self,
+        pdf_bytes: bytes,
+        image_writer: Any,
+        ocr_enabled: bool,
+        vlm_mode: bool,
+        dtype: Optional[str] = None,
+    ) -> Any:
+        """
+        Run the MinerU analysis and parse pipeline on one PDF (or chunk).
+
+        Args:
+            pdf_bytes: PDF content.
+            image_writer: DiskReaderWriter for extracted images.
+            ocr_enabled: Enable OCR for scanned docs.
+            vlm_mode: Enable Vision Language Model mode (Feature #70).
+            dtype: Reduced inference precision ("bf16"/"fp16"), or None for FP32.
+
+        Returns:
+            Any: MinerU pipe result.
+        """
+        return self._build_pipe(
+            pdf_bytes, image_writer, ocr_enabled, vlm_mode, dtype=dtype
+        ).pipe_parse()
+
+    def _build_pipe(
+        self,
+        pdf_bytes: bytes,
+        image_writer: Any,
+        ocr_enabled: bool,
+        vlm_mode: bool,
+        dtype: Optional[str] = None,
+    ) -> Any:
+        """
+        Analyze layout and build the MinerU pipe for one PDF (or chunk).
+
+        Args:
+            pdf_bytes: PDF content.
+            image_writer: DiskReaderWriter for extracted images.
+            ocr_enabled: Enable OCR for scanned docs.
+            vlm_mode: Enable Vision Language Model mode (Feature #70).
+            dtype: Reduced inference precision ("bf16"/"fp16"), or None for FP32.
+
+        Returns:
+            Any: OCRPipe or UNIPipe, ready for pipe_parse().
+        """
+        from magic_pdf.pipe.UNIPipe import UNIPipe
+        from magic_pdf.pipe.OCRPipe import OCRPipe
+        from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze
+
+        # Step 1: Analyze document structure (MinerU 0.7.0+ API)
+        logger.debug("Analyzing document structure with OCR={}", ocr_enabled)
+        with self._inference_context(dtype):
+            analysis_result = doc_analyze(pdf_bytes, ocr=ocr_enabled, show_log=False)
+
+        # Step 2: Choose pipeline based on OCR requirement and VLM mode (Feature #70)
+        if ocr_enabled or vlm_mode:
+            # Use OCR pipeline for scanned documents or VLM mode
+            if vlm_mode:
+                logger.info("Using VLM mode for enhanced extraction accuracy")
+
+            # OCRPipe requires model_list from analysis
+            model_list = analysis_result.get("model_list", [])
+            return OCRPipe(pdf_bytes, model_list, image_writer, is_debug=False)
+
+        # Use standard pipeline for digital PDFs
+        # UNIPipe requires jso_useful_key from analysis
+        jso_useful_key = analysis_result
+        return UNIPipe(pdf_bytes, jso_useful_key, image_writer, is_debug=False)
+
+    @contextmanager
+    def _inference_context(self, dtype: Optional[str] = None) -> Iterator[None]:
+        """
+        Run model inference with the fastest GPU kernels and precision.
+
+        On GPU, scaled-dot-product attention prefers the FlashAttention and
+        memory-efficient kernels (the attention-heavy layout, formula and
+        VLM models benefit most), falling back to the math kernel for
+        inputs they do not support; with a reduced dtype, the models run
+        under torch.autocast, halving weight and activation bandwidth.
+        On CPU this is a no-op.
+
+        Args:
+            dtype: "bf16" or "fp16" for autocast, None for FP32.
+        """
+        with ExitStack() as stack:
+            if self.has_gpu():
+                import torch
+
+                try:
+                    from torch.nn.attention import SDPBackend, sdpa_kernel
+
+                    stack.enter_context(sdpa_kernel([
+                        SDPBackend.FLASH_ATTENTION,
+                        SDPBackend.EFFICIENT_ATTENTION,
+                        SDPBackend.MATH,
+                    ]))
+                except ImportError:  # torch < 2.3
+                    pass
+
+                autocast_dtype = _autocast_dtype(torch, dtype)
+                if autocast_dtype is not None:
+                    stack.enter_context(torch.autocast(device_type="cuda", dtype=autocast_dtype))
+
+            yield
 
     def _extract_markdown(self, pipe_result: Any, file_path: Path) -> str:
         """
         Extract markdown content from MinerU result.
 
+        Some magic-pdf versions return one markdown string per page; those
+        are joined once at the end rather than concatenated as they arrive.
+
         Args:
             pipe_result: MinerU pipe result.
             file_path: Original PDF file path.
@@ -236,15 +855,12 @@ class MinerUExtractor(BaseExtractor):
         """
         try:
             # MinerU stores markdown in the result
-            if hasattr(pipe_result, "get_markdown"):
-                return pipe_result.get_markdown()
-            elif hasattr(pipe_result, "markdown"):
-                return pipe_result.markdown
-            else:
-                # Fallback: construct from text
-                return str(pipe_result)
+            markdown = _result_adapter(pipe_result)["markdown"](pipe_result)
+            if isinstance(markdown, str):
+                return markdown
+            return "\n\n".join(markdown)
         except Exception as e:
-            logger.warning(f"Failed to extract markdown: {e}")
+            logger.warning("Failed to extract markdown: {}", e)
             return f"# {file_path.stem}\n\n*Extraction incomplete*"
 
     def _extract_tables(self, pipe_result: Any) -> List[str]:
@@ -264,19 +880,18 @@ class MinerUExtractor(BaseExtractor):
         """
         tables = []
         try:
-            if hasattr(pipe_result, "get_tables"):
-                raw_tables = pipe_result.get_tables()
-                for table in raw_tables:
-                    # Convert to markdown table
-                    if isinstance(table, str):
-                        tables.append(table)
-                    else:
-                        # TODO: Implement proper table conversion
-                        tables.append(str(table))
-
-            logger.info(f"Extracted {len(tables)} tables")
+            raw_tables = _result_adapter(pipe_result)["tables"](pipe_result)
+            for table in raw_tables:
+                # Convert to markdown table
+                if isinstance(table, str):
+                    tables.append(table)
+                else:
+                    # TODO: Implement proper table conversion
+                    tables.append(str(table))
+
+            logger.debug("Extracted {} tables", len(tables))
         except Exception as e:
-            logger.warning(f"Table extraction failed: {e}")
+            logger.warning("Table extraction failed: {}", e)
 
         return tables
 
@@ -294,14 +909,11 @@ class MinerUExtractor(BaseExtractor):
         """
         formulas = []
         try:
-            if hasattr(pipe_result, "get_formulas"):
-                formulas = pipe_result.get_formulas()
-            elif hasattr(pipe_result, "formulas"):
-                formulas = pipe_result.formulas
+            formulas = _result_adapter(pipe_result)["formulas"](pipe_result)
 
-            logger.info(f"Extracted {len(formulas)} formulas")
+            logger.debug("Extracted {} formulas", len(formulas))
         except Exception as e:
-            logger.warning(f"Formula extraction failed: {e}")
+            logger.warning("Formula extraction failed: {}", e)
 
         return formulas
 
@@ -317,12 +929,11 @@ class MinerUExtractor(BaseExtractor):
         """
         images = []
         try:
-            if hasattr(pipe_result, "get_images"):
-                images = pipe_result.get_images()
+            images = _result_adapter(pipe_result)["images"](pipe_result)
 
-            logger.info(f"Found {len(images)} images")
+            logger.debug("Found {} images", len(images))
         except Exception as e:
-            logger.warning(f"Image extraction failed: {e}")
+            logger.warning("Image extraction failed: {}", e)
 
         return images
 
@@ -343,13 +954,9 @@ class MinerUExtractor(BaseExtractor):
         }
 
         try:
-            if hasattr(pipe_result, "get_metadata"):
-                mineru_metadata = pipe_result.get_metadata()
-                metadata.update(mineru_metadata)
-            elif hasattr(pipe_result, "metadata"):
-                metadata.update(pipe_result.metadata)
+            metadata.update(_result_adapter(pipe_result)["metadata"](pipe_result))
         except Exception as e:
-            logger.debug(f"Metadata extraction failed: {e}")
+            logger.debug("Metadata extraction failed: {}", e)
 
         return metadata
 
@@ -359,23 +966,7 @@ class MinerUExtractor(BaseExtractor):
 
         Detects CUDA/GPU availability to configure MinerU pipeline.
         """
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                self._gpu_available = True
-                gpu_name = torch.cuda.get_device_name(0)
-                logger.info(f"GPU detected for MinerU: {gpu_name}")
-            else:
-                self._gpu_available = False
-                logger.info("No GPU detected, MinerU will use CPU")
-
-        except ImportError:
-            self._gpu_available = False
-            logger.debug("PyTorch not available, cannot detect GPU")
-        except Exception as e:
-            self._gpu_available = False
-            logger.warning(f"GPU detection failed: {e}")
+        self._gpu_available, _ = _probe_gpu()
 
     def has_gpu(self) -> bool:
         """
@@ -405,4 +996,273 @@ class MinerUExtractor(BaseExtractor):
             "gpu_available": self.has_gpu(),  # Feature #67
             "precision": "high",
             "speed": "medium" if not self.has_gpu() else "fast",
+            "releases_gil": True,  # Torch inference runs outside the GIL
         }
+
+
+# Pipeline tuning for MinerUBatchRunner
+PIPELINE_QUEUE_SIZE = 4  # Loaded/analyzed PDFs buffered between stages
+BATCH_MAX_SIZE = 4  # Parse stage flushes after this many documents...
+BATCH_MAX_WAIT_S = 0.2  # ...or once the oldest has waited this long
+
+# Marks the end of the input in the stage queues
+_DONE = object()
+
+
+class MinerUBatchRunner:
+    """
+    Three-stage pipeline for extracting many PDFs with MinerU.
+
+    Stage 1 reads PDFs from disk, stage 2 runs layout analysis and builds
+    the pipes, stage 3 parses and post-processes them. The stages run in
+    their own threads connected by bounded queues, so disk I/O, layout
+    analysis and parsing of different documents overlap and throughput
+    follows the slowest stage instead of the sum of all three.
+
+    Stage 3 takes documents in batches, flushing when BATCH_MAX_SIZE
+    documents are ready or the oldest has waited BATCH_MAX_WAIT_S.
+
+    Example:
+        >>> runner = MinerUBatchRunner(MinerUExtractor())
+        >>> for path, outcome in runner.run(Path("pdfs").glob("*.pdf")):
+        ...     if isinstance(outcome, ExtractionError):
+        ...         print(path.name, "failed:", outcome)
+    """
+
+    def __init__(
+        self,
+        extractor: MinerUExtractor,
+        max_batch: int = BATCH_MAX_SIZE,
+        max_wait_s: float = BATCH_MAX_WAIT_S,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ):
+        """
+        Initialize batch runner.
+
+        Args:
+            extractor: MinerU extractor doing the work.
+            max_batch: Documents per parse-stage batch.
+            max_wait_s: Longest the parse stage waits to fill a batch.
+            queue_size: Capacity of each inter-stage queue.
+        """
+        self.extractor = extractor
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self.queue_size = queue_size
+
+    def run(
+        self,
+        paths: Iterable[Path],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Tuple[Path, Union[ExtractionResult, ExtractionError]]]:
+        """
+        Extract PDFs through the pipeline, in input order.
+
+        Args:
+            paths: PDF files to extract.
+            options: Extraction options (see MinerUExtractor.extract).
+
+        Yields:
+            tuple: (path, ExtractionResult) or (path, ExtractionError) when
+                that document failed; one failure does not stop the batch.
+
+        Raises:
+            ExtractorRecoverableError: If MinerU is not installed.
+        """
+        if not self.extractor.is_available():
+            raise ExtractorRecoverableError(
+                extractor=self.extractor.name,
+                message="MinerU is not installed. Install with: pip install magic-pdf[cpu]",
+                file_path="",
+            )
+
+        options = options or {}
+        stop = threading.Event()
+        loaded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        analyzed: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        finished: queue.Queue = queue.Queue()
+
+        stages = [
+            threading.Thread(target=self._load_stage, args=(paths, loaded, options, stop), name="mineru-load"),
+            threading.Thread(target=self._layout_stage, args=(loaded, analyzed, options, stop), name="mineru-layout"),
+            threading.Thread(target=self._parse_stage, args=(analyzed, finished, options, stop), name="mineru-parse"),
+        ]
+        for stage in stages:
+            stage.start()
+
+        try:
+            while (item := finished.get()) is not _DONE:
+                yield item
+        finally:
+            # Unblock the stages if the caller stopped iterating early, then
+            # release the mappings and image directories left in flight
+            stop.set()
+            for stage in stages:
+                stage.join()
+            for q in (loaded, analyzed):
+                while True:
+                    try:
+                        self._release(q.get_nowait())
+                    except queue.Empty:
+                        break
+
+    @staticmethod
+    def _release(item: Any) -> None:
+        """Close the PDF mapping or image directory held by a queued item."""
+        if item is _DONE:
+            return
+        for part in item:
+            if isinstance(part, (mmap.mmap, ExitStack)):
+                part.close()
+
+    @staticmethod
+    def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Put an item on a bounded queue, giving up once stop is set."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _get(q: queue.Queue, stop: threading.Event, timeout: Optional[float] = None) -> Any:
+        """Get an item, returning _DONE once stop is set (or None on timeout)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not stop.is_set():
+            wait = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+            if wait <= 0:
+                return None
+            try:
+                return q.get(timeout=wait)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _failure(self, file_path: Path, error: Exception) -> Tuple[Path, ExtractionError]:
+        """Wrap a per-document failure (Feature #55)."""
+        if isinstance(error, ExtractionError):
+            return file_path, error
+
+        logger.error("MinerU extraction failed: {} (file: {})", error, file_path.name)
+        return file_path, ExtractionError(
+            extractor=self.extractor.name,
+            message=f"MinerU extraction failed: {error}",
+            file_path=str(file_path),
+            original_error=error,
+        )
+
+    def _load_stage(
+        self,
+        paths: Iterable[Path],
+        out: queue.Queue,
+        options: Dict[str, Any],
+        stop: threading.Event,
+    ) -> None:
+        """Stage 1: validate, precheck and map PDFs (readahead starts here)."""
+        try:
+            for file_path in paths:
+                start_time = time.perf_counter()
+                try:
+                    self.extractor.validate_file(file_path)
+                    page_count = self.extractor.precheck_pdf(file_path, options)
+                    item = (file_path, map_file(file_path), page_count, start_time)
+                except Exception as e:
+                    item = self._failure(file_path, e)
+
+                if not self._put(out, item, stop):
+                    self._release(item)
+                    return
+        finally:
+            self._put(out, _DONE, stop)
+
+    def _layout_stage(
+        self,
+        inp: queue.Queue,
+        out: queue.Queue,
+        options: Dict[str, Any],
+        stop: threading.Event,
+    ) -> None:
+        """Stage 2: split into chunks, analyze layout and build the pipes."""
+        vlm_mode = options.get("vlm_mode", False)  # Feature #70
+        dtype = options.get("dtype")
+
+        try:
+            while (item := self._get(inp, stop)) is not _DONE:
+                if len(item) == 2:  # Failed upstream
+                    self._put(out, item, stop)
+                    continue
+
+                file_path, pdf, page_count, start_time = item
+                # The image directory lives until the parse stage has built the result
+                images = ExitStack()
+                try:
+                    image_writer = images.enter_context(self.extractor._image_writer())
+                    with pdf:
+                        chunks, chunk_ocr = self.extractor._plan_chunks(
+                            pdf, page_count, self.extractor._chunk_workers(options), options
+                        )
+                    pipes = [
+                        self.extractor._build_pipe(chunk, image_writer, ocr, vlm_mode, dtype=dtype)
+                        for chunk, ocr in zip(chunks, chunk_ocr)
+                    ]
+                    item = (file_path, pipes, page_count, start_time, images)
+                except Exception as e:
+                    images.close()
+                    item = self._failure(file_path, e)
+
+                if not self._put(out, item, stop):
+                    self._release(item)
+                    return
+        finally:
+            self._put(out, _DONE, stop)
+
+    def _parse_stage(
+        self,
+        inp: queue.Queue,
+        out: queue.Queue,
+        options: Dict[str, Any],
+        stop: threading.Event,
+    ) -> None:
+        """Stage 3: parse batches of analyzed documents and build results."""
+        done = False
+        try:
+            while not done:
+                # Block for the first document, then fill the batch until it
+                # is full or the first document has waited max_wait_s
+                first = self._get(inp, stop)
+                if first is _DONE:
+                    break
+
+                batch = [first]
+                first_ts = time.monotonic()
+                while len(batch) < self.max_batch:
+                    remaining = self.max_wait_s - (time.monotonic() - first_ts)
+                    if remaining <= 0:
+                        break
+                    item = self._get(inp, stop, timeout=remaining)
+                    if item is None:
+                        break
+                    if item is _DONE:
+                        done = True
+                        break
+                    batch.append(item)
+
+                for item in batch:
+                    if len(item) == 2:  # Failed upstream
+                        out.put(item)
+                        continue
+
+                    file_path, pipes, page_count, start_time, images = item
+                    try:
+                        with images:
+                            pipe_results = [pipe.pipe_parse() for pipe in pipes]
+                            result = self.extractor._build_result(
+                                file_path, pipe_results, page_count, options, start_time
+                            )
+                        out.put((file_path, result))
+                    except Exception as e:
+                        out.put(self._failure(file_path, e))
+        finally:
+            out.put(_DONE)
@@ -4,14 +4,22 @@ PDF-to-Markdown Extractor - File Utilities.
 Utilities for file and directory management.
 """
 
+import mmap
+import os
 import shutil
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 from loguru import logger
 
-from src.core.config import settings
+from src.core.config import get_settings
+
+# Files larger than this get readahead advice in PREFETCH_WINDOW_BYTES windows
+PREFETCH_CHUNK_THRESHOLD_BYTES = 50 * 1024 * 1024
+PREFETCH_WINDOW_BYTES = 16 * 1024 * 1024
 
 
 def create_output_dir(
@@ -36,7 +44,7 @@ def create_output_dir(
         >>> print(output_dir)
         /app/data/outputs/20251230_153045_abc123
     """
-    base_dir = base_dir or settings.output_dir
+    base_dir = base_dir or get_settings().output_dir
 
     # Generate timestamp-based directory name
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -79,7 +87,7 @@ def cleanup_old_outputs(
         >>> deleted = cleanup_old_outputs(max_age_days=7)
         >>> print(f"Deleted {deleted} old directories")
     """
-    base_dir = base_dir or settings.output_dir
+    base_dir = base_dir or get_settings().output_dir
 
     if not base_dir.exists():
         logger.warning(f"Output directory does not exist: {base_dir}")
@@ -148,6 +156,88 @@ def get_file_info(file_path: Path) -> dict:
     }
 
 
+def prefetch_file(file_path: Path) -> None:
+    """
+    Ask the OS to start reading a file into the page cache, in the background.
+
+    Extraction reads the same PDF several times (complexity analysis, then
+    one or more extractors). Issuing readahead as soon as the file is known
+    lets the first read hit a warm page cache. Uses posix_fadvise(WILLNEED)
+    where available (Linux), madvise(MADV_WILLNEED) otherwise. Failures are
+    ignored: prefetching is only a hint.
+
+    Args:
+        file_path: Path to file.
+
+    Example:
+        >>> prefetch_file(Path("document.pdf"))  # returns immediately
+    """
+    threading.Thread(
+        target=_advise_willneed, args=(file_path,), name="prefetch", daemon=True
+    ).start()
+
+
+def _advise_willneed(file_path: Path) -> None:
+    """Issue WILLNEED readahead advice for a file (see prefetch_file)."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return
+
+        # Large files are advised window by window instead of all at once
+        window = PREFETCH_WINDOW_BYTES if size > PREFETCH_CHUNK_THRESHOLD_BYTES else size
+
+        if hasattr(os, "posix_fadvise"):
+            for offset in range(0, size, window):
+                os.posix_fadvise(fd, offset, window, os.POSIX_FADV_WILLNEED)
+        elif hasattr(mmap, "MADV_WILLNEED"):
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, size, window):
+                    mapped.madvise(mmap.MADV_WILLNEED, offset, min(window, size - offset))
+
+    except (OSError, ValueError) as e:
+        logger.debug(f"File prefetch skipped for {file_path}: {e}")
+
+    finally:
+        os.close(fd)
+
+
+def map_file(file_path: Path) -> mmap.mmap:
+    """
+    Memory-map a file read-only.
+
+    The mapping is a bytes-like, seekable view of the file backed by the
+    page cache, so large PDFs can be parsed, sliced or base64-encoded
+    without first copying the whole file into a bytes object. The mapping
+    stays valid after the file descriptor is closed and can be handed to
+    another thread; close it (or use it as a context manager) when done.
+
+    Args:
+        file_path: Path to a non-empty file.
+
+    Returns:
+        mmap.mmap: Read-only mapping of the whole file.
+
+    Raises:
+        ValueError: If the file is empty (empty files cannot be mapped).
+
+    Example:
+        >>> with map_file(Path("document.pdf")) as pdf:
+        ...     header = pdf[:5]
+    """
+    with open(file_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if hasattr(mmap, "MADV_WILLNEED"):  # Start readahead for the whole file
+        mapped.madvise(mmap.MADV_WILLNEED)
+    return mapped
+
+
 def ensure_directory(directory: Path) -> Path:
     """
     Ensure a directory exists, create if it doesn't.
@@ -224,7 +314,7 @@ def copy_file_to_upload(
         >>> print(uploaded)
         /app/data/uploads/doc.pdf
     """
-    upload_dir = upload_dir or settings.upload_dir
+    upload_dir = upload_dir or get_settings().upload_dir
     ensure_directory(upload_dir)
 
     # Determine destination filename
@@ -268,8 +358,6 @@ def write_metadata_json(
         >>> print(data['extractor_name'])
         DoclingExtractor
     """
-    import json
-
     # Get result as dict
     metadata = result.to_dict()
 
@@ -280,9 +368,10 @@ def write_metadata_json(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write JSON
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    # Write JSON (orjson emits UTF-8 without escaping non-ASCII)
+    output_path.write_bytes(
+        orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    )
 
     logger.debug(f"Metadata written: {output_path}")
 
@@ -50,6 +50,20 @@ TEXT_FORMAT = (
 )
 
 
+def _text_format(record) -> str:
+    """
+    Text format that appends context bound with logger.contextualize/bind.
+
+    JSON output already carries these fields under "extra".
+    """
+    format_string = TEXT_FORMAT
+    if record["extra"]:
+        format_string += " <dim>" + " ".join(
+            f"{key}={{extra[{key}]}}" for key in record["extra"]
+        ) + "</dim>"
+    return format_string + "\n{exception}"
+
+
 # ==========================================
 # Logging Configuration
 # ==========================================
@@ -91,7 +105,7 @@ def setup_logging(
     logger.remove()
 
     # Determine format string
-    format_string = JSON_FORMAT if log_format.lower() == "json" else TEXT_FORMAT
+    format_string = JSON_FORMAT if log_format.lower() == "json" else _text_format
 
     # Add stdout handler (always enabled for container logs)
     logger.add(
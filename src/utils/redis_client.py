@@ -5,7 +5,7 @@ Redis connection helper with connection pooling and health checks.
 """
 
 import os
-from typing import Optional
+from typing import Optional, Union
 
 import redis
 from loguru import logger
@@ -129,7 +129,7 @@ class RedisClient:
         """
         return self._client
 
-    def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Union[str, bytes], ex: Optional[int] = None) -> bool:
         """
         Set a key-value pair in Redis.
 
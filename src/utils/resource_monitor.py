@@ -45,7 +45,7 @@ class ResourceMonitor:
             >>> monitor = ResourceMonitor()
             >>> monitor.start()
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.start_memory = self.process.memory_info().rss / (1024 ** 2)  # MB
         self.start_cpu_percent = self.process.cpu_percent()
         self.peak_memory_mb = self.start_memory
@@ -118,7 +118,7 @@ class ResourceMonitor:
             logger.warning("Monitor not started, returning empty stats")
             return {}
 
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         end_memory = self.process.memory_info().rss / (1024 ** 2)  # MB
         memory_delta = end_memory - self.start_memory
 
@@ -0,0 +1,186 @@
+"""
+PDF-to-Markdown Extractor - Extraction Result Cache.
+
+Persistent, content-addressed cache of extraction results, so identical
+PDFs extracted with the same extractor version and options skip the
+conversion entirely.
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from loguru import logger
+
+from src.extractors.base import ExtractionResult
+
+try:
+    from blake3 import blake3 as _fast_hash
+except ImportError:  # Optional dependency; blake2b is always available
+    _fast_hash = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; entries are stored uncompressed
+    zstandard = None
+
+# Options that change how the cache is used, how fast extraction runs or
+# which documents are accepted, not what is extracted
+CACHE_CONTROL_OPTIONS = frozenset({"force_refresh", "page_concurrency", "max_pages"})
+
+# zstd level for cache entries: fast to decompress, 3-5x smaller for text
+ZSTD_LEVEL = 3
+
+# Entries larger than this are compressed on all cores
+ZSTD_MULTITHREAD_BYTES = 8 * 1024 * 1024
+
+# Errors raised when an entry cannot be decoded
+_DECODE_ERRORS = (orjson.JSONDecodeError,) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+def fingerprint_file(file_path: Path) -> str:
+    """
+    Hash a file's content without reading it into memory.
+
+    With the blake3 package installed, the file is memory-mapped and hashed
+    with BLAKE3 across all cores; otherwise hashlib.file_digest streams it
+    through BLAKE2b.
+
+    Args:
+        file_path: File to hash.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    with open(file_path, "rb") as f:
+        if _fast_hash is None:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+        if os.fstat(f.fileno()).st_size == 0:  # Empty files cannot be mapped
+            return _fast_hash().hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _fast_hash(mm, max_threads=_fast_hash.AUTO).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of ExtractionResults keyed by content, version and options.
+
+    Entries are orjson files, zstd-compressed when the zstandard package
+    is installed, written atomically (unique temp file + os.replace) so
+    concurrent writers, threads or processes, never read a partial entry. Read and write failures are logged
+    and treated as cache misses.
+
+    Example:
+        >>> cache = ResultCache(Path("/app/data/cache"), "docling")
+        >>> key = cache.key(fingerprint_file(pdf_path), "1.0.0", {})
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = extractor.extract(pdf_path)
+        ...     cache.put(key, result)
+    """
+
+    def __init__(self, cache_dir: Path, namespace: str):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Base cache directory (e.g. settings.cache_dir).
+            namespace: Sub-directory per extractor (e.g. "docling").
+        """
+        self.directory = Path(cache_dir) / namespace
+
+    @staticmethod
+    def key(fingerprint: str, version: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a document, extractor version and options.
+
+        Args:
+            fingerprint: Content hash from fingerprint_file().
+            version: Extractor version.
+            options: Extraction options (cache-control options are ignored).
+
+        Returns:
+            str: Hex cache key.
+        """
+        relevant = {
+            name: value
+            for name, value in (options or {}).items()
+            if name not in CACHE_CONTROL_OPTIONS
+        }
+        encoded_options = orjson.dumps(
+            relevant,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(fingerprint.encode())
+        digest.update(b"\0" + version.encode() + b"\0")
+        digest.update(encoded_options)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the entry path for a cache key."""
+        return self.directory / (f"{key}.json.zst" if zstandard else f"{key}.json")
+
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        """
+        Load a cached result.
+
+        Args:
+            key: Cache key from key().
+
+        Returns:
+            ExtractionResult: Cached result, or None on a miss.
+        """
+        try:
+            blob = self._path(key).read_bytes()
+            if zstandard:
+                blob = zstandard.ZstdDecompressor().decompress(blob)
+            data = orjson.loads(blob)
+        except FileNotFoundError:
+            return None
+        except (OSError, *_DECODE_ERRORS) as e:
+            logger.warning("Ignoring unreadable result cache entry {}: {}", key, e)
+            return None
+
+        try:
+            return ExtractionResult.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring invalid result cache entry {}: {}", key, e)
+            return None
+
+    def put(self, key: str, result: ExtractionResult) -> None:
+        """
+        Store a result (best effort).
+
+        Args:
+            key: Cache key from key().
+            result: Result to store.
+        """
+        path = self._path(key)
+        tmp_path = None
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            blob = result.to_json()
+            if zstandard:
+                threads = -1 if len(blob) > ZSTD_MULTITHREAD_BYTES else 0
+                blob = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=threads).compress(blob)
+
+            # A unique temp name per write: threads of one process may store
+            # the same key at once
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            logger.warning("Could not write result cache entry {}: {}", key, e)
@@ -186,6 +186,17 @@ class TestComparisonDifferences:
         # Different tables should produce divergences
         assert len(divergences) > 0
 
+    def test_table_comparison_flags_only_divergent_tables(self, comparator):
+        """Test that only tables below the threshold are flagged."""
+        tables_a = ["| A | B |\n|---|---|\n| 1 | 2 |", "| Name | Total |", "| X |"]
+        tables_b = ["| A | B |\n|---|---|\n| 1 | 2 |", "completely different", "| X |"]
+
+        divergences = comparator.compare_tables(tables_a, tables_b)
+
+        assert [div.block_id for div in divergences] == ["table-1"]
+        assert isinstance(divergences[0].similarity, float)
+        assert 0.0 <= divergences[0].similarity < comparator.similarity_threshold
+
     def test_auto_merge_threshold(self, comparator):
         """Test auto-merge threshold (Feature #83)."""
         # High similarity should auto-merge
@@ -109,6 +109,17 @@ class TestComplexityScore:
         assert score_dict["components"]["page_count"] == 5
         assert score_dict["components"]["tables"] == 10
 
+    def test_to_dict_returns_independent_copies(self):
+        """Test that mutating one to_dict() result does not leak into the shared score."""
+        score = ComplexityScore(page_count_score=5)
+
+        first = score.to_dict()
+        first["complexity_level"] = "complex"
+        first["components"]["page_count"] = 99
+
+        assert score.to_dict()["complexity_level"] == "simple"
+        assert score.to_dict()["components"]["page_count"] == 5
+
 
 class TestComplexityAnalyzer:
     """Tests for ComplexityAnalyzer class."""
@@ -362,3 +373,29 @@ class TestIndividualScorers:
 
         # text_only.pdf is not scanned → 0 points
         assert score == 0
+
+    def test_fused_scan_matches_individual_scorers(self, analyzer):
+        """Test that the single-pass scan + reducer matches the individual scorers."""
+        import fitz
+
+        from src.core.complexity import _reduce_page_counts
+
+        pdf_paths = sorted(Path("tests/fixtures").rglob("*.pdf"))
+
+        if not pdf_paths:
+            pytest.skip("No PDF fixtures found")
+
+        for pdf_path in pdf_paths:
+            doc = fitz.open(pdf_path)
+            expected = (
+                analyzer.page_count_score(doc),
+                analyzer.table_score(doc),
+                analyzer.column_score(doc),
+                analyzer.image_score(doc),
+                analyzer.formula_score(doc),
+                analyzer.scan_score(doc),
+            )
+            fused = tuple(int(s) for s in _reduce_page_counts(analyzer._scan_pages(doc)))
+            doc.close()
+
+            assert fused == expected, f"Mismatch for {pdf_path.name}"
@@ -8,7 +8,13 @@ management work correctly.
 import pytest
 from pathlib import Path
 
-from src.core.config import settings, get_settings, reload_settings, Settings
+from src.core.config import (
+    settings,
+    get_settings,
+    reload_settings,
+    reload_settings_trusted,
+    Settings,
+)
 
 
 @pytest.mark.unit
@@ -25,6 +31,17 @@ class TestSettings:
         config = get_settings()
         assert config is settings
 
+    def test_get_settings_is_cached(self):
+        """Test that get_settings() builds Settings once and caches it."""
+        assert get_settings() is get_settings()
+
+    def test_settings_are_frozen(self):
+        """Test that settings cannot be mutated after construction."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            settings.api_port = 1234
+
     def test_redis_url_is_set(self):
         """Test that redis_url is set."""
         assert settings.redis_url is not None
@@ -180,12 +197,28 @@ def test_reload_settings():
 
     # Check that new settings reflect the change
     assert new_settings.api_port == 9000
+    assert get_settings() is new_settings
 
     # Restore original
     os.environ["API_PORT"] = str(original_port)
     reload_settings()
 
 
+@pytest.mark.unit
+@pytest.mark.config
+def test_reload_settings_trusted():
+    """Test reload_settings_trusted() applies overrides without touching the global."""
+    base = get_settings()
+
+    trusted = reload_settings_trusted(api_port=9100, environment="development")
+
+    assert isinstance(trusted, Settings)
+    assert trusted.api_port == 9100
+    assert trusted.is_development is True
+    assert trusted.redis_url == base.redis_url
+    assert get_settings() is base
+
+
 @pytest.mark.unit
 @pytest.mark.config
 def test_ensure_directories(temp_dir):
@@ -9,6 +9,7 @@ from pathlib import Path
 
 from src.extractors.docling_extractor import DoclingExtractor
 from src.extractors.base import ExtractionResult
+from src.utils.result_cache import ResultCache, fingerprint_file
 
 
 @pytest.mark.unit
@@ -27,6 +28,7 @@ class TestDoclingExtractor:
         assert extractor.name == "DoclingExtractor"
         assert extractor.version == "1.0.0"
         assert extractor.description is not None
+        assert extractor.key == "docling"
 
     def test_is_available(self, extractor):
         """Test that Docling is available."""
@@ -43,6 +45,11 @@ class TestDoclingExtractor:
         assert caps["metadata"] is True
         assert caps["ocr"] is False  # Docling doesn't do OCR directly
 
+    def test_capabilities_computed_once(self, extractor):
+        """Test that the capabilities property caches get_capabilities()."""
+        assert extractor.capabilities == extractor.get_capabilities()
+        assert extractor.capabilities is extractor.capabilities
+
     def test_get_info(self, extractor):
         """Test get_info returns extractor information."""
         info = extractor.get_info()
@@ -52,6 +59,122 @@ class TestDoclingExtractor:
         assert info["available"] is True
         assert "capabilities" in info
 
+    def test_instances_are_slotted(self, extractor):
+        """Test that extractor instances carry no per-instance __dict__."""
+        assert not hasattr(extractor, "__dict__")
+        assert DoclingExtractor.key == "docling"
+
+    def test_subclass_metadata_validated(self):
+        """Test that invalid extractor metadata fails at class creation."""
+        from src.extractors.base import BaseExtractor
+
+        with pytest.raises(TypeError, match="version"):
+            class BrokenExtractor(BaseExtractor):
+                name = "BrokenExtractor"
+                version = ""
+
+    def test_converter_shared_across_instances(self, monkeypatch):
+        """Test that all extractors in a process share one DocumentConverter."""
+        import sys
+        import types
+        from unittest.mock import Mock
+
+        from src.extractors import docling_extractor
+
+        fake_module = types.ModuleType("docling.document_converter")
+        fake_module.DocumentConverter = Mock(side_effect=lambda: object())
+        monkeypatch.setitem(sys.modules, "docling.document_converter", fake_module)
+        monkeypatch.setattr(docling_extractor, "_CONVERTER", None)
+
+        converter = DoclingExtractor()._get_converter()
+
+        assert DoclingExtractor()._get_converter() is converter
+        fake_module.DocumentConverter.assert_called_once()
+
+    def test_walk_document_single_pass(self, extractor, monkeypatch):
+        """Test that tables, images and title are collected in one walk."""
+        from unittest.mock import Mock
+
+        from src.extractors import docling_extractor
+
+        class TextItem:
+            text = "Quarterly Report"
+
+        class TableItem:
+            def export_to_markdown(self):
+                return "| A |"
+
+        class PictureItem:
+            pass
+
+        monkeypatch.setattr(docling_extractor, "_TABLE_CLS", TableItem)
+        monkeypatch.setattr(docling_extractor, "_PICTURE_CLS", PictureItem)
+        doc = Mock()
+        doc.iterate_items.return_value = iter(
+            [(TextItem(), 0), (TableItem(), 1), (PictureItem(), 1)]
+        )
+
+        tables, images, first_heading = extractor._walk_document(doc, {"extract_images": True})
+
+        assert tables == ["| A |"]
+        assert images == ["image_0"]
+        assert first_heading == "Quarterly Report"
+        doc.iterate_items.assert_called_once()
+
+    def test_extract_many_serves_cache_hits_without_dispatch(self, extractor, tmp_path, monkeypatch):
+        """Test that extract_many only extracts PDFs missing from the cache."""
+        cache = ResultCache(tmp_path / "cache", "docling")
+        cached_pdf, new_pdf = tmp_path / "cached.pdf", tmp_path / "new.pdf"
+        cached_pdf.write_bytes(b"%PDF-1.4 cached")
+        new_pdf.write_bytes(b"%PDF-1.4 new")
+
+        cached_result = ExtractionResult(markdown="# Cached", metadata={"filename": "cached.pdf"})
+        cache.put(cache.key(fingerprint_file(cached_pdf), extractor.version, {}), cached_result)
+
+        extracted, hashed = [], []
+
+        def fake_convert(self, file_path, file_size, options):
+            extracted.append(file_path)
+            return ExtractionResult(markdown="# New", metadata={"filename": file_path.name})
+
+        def counting_fingerprint(file_path):
+            hashed.append(file_path)
+            return fingerprint_file(file_path)
+
+        monkeypatch.setattr(DoclingExtractor, "_result_cache", lambda self: cache)
+        monkeypatch.setattr(DoclingExtractor, "_convert", fake_convert)
+        monkeypatch.setattr(
+            "src.extractors.docling_extractor.fingerprint_file", counting_fingerprint
+        )
+
+        results = list(extractor.extract_many([cached_pdf, new_pdf], workers=4))
+
+        assert [r.metadata["filename"] for r in results] == ["cached.pdf", "new.pdf"]
+        assert results[0] == cached_result
+        assert extracted == [new_pdf]  # Single miss runs inline, no pool
+        assert hashed == [cached_pdf, new_pdf]  # Each PDF hashed once
+        assert cache.get(cache.key(fingerprint_file(new_pdf), extractor.version, {})) == results[1]
+
+    def test_extract_metadata_from_document_attributes(self, extractor):
+        """Test metadata extraction with present and missing document attributes."""
+        from types import SimpleNamespace
+
+        doc = SimpleNamespace(
+            pages=[object(), object()],
+            name="",
+            metadata=SimpleNamespace(author="Jane Doe"),
+        )
+
+        metadata = extractor._extract_metadata(doc, "report.pdf", 2048, "Quarterly Report")
+
+        assert metadata == {
+            "filename": "report.pdf",
+            "file_size": 2048,
+            "page_count": 2,
+            "title": "Quarterly Report",
+            "author": "Jane Doe",
+        }
+
 
 @pytest.mark.integration
 @pytest.mark.extractor
@@ -6,6 +6,7 @@ Tests cover:
 """
 
 import pytest
+from contextlib import nullcontext
 from pathlib import Path
 
 from src.extractors.mineru_extractor import MinerUExtractor
@@ -18,6 +19,12 @@ def mineru_extractor():
     return MinerUExtractor()
 
 
+@pytest.fixture(autouse=True)
+def reset_result_adapters(monkeypatch):
+    """Forget result shapes probed by other tests (fakes share classes)."""
+    monkeypatch.setattr("src.extractors.mineru_extractor._RESULT_ADAPTERS", {})
+
+
 @pytest.fixture
 def complex_pdf_path():
     """Path to complex PDF fixture."""
@@ -71,6 +78,72 @@ class TestMinerUExtractor:
         else:
             assert caps["speed"] == "medium"
 
+    def test_probes_run_once_per_process(self, mineru_extractor):
+        """Test that MinerU and GPU probes are cached across instances."""
+        from src.extractors.mineru_extractor import _probe_gpu, _probe_mineru
+
+        misses = (_probe_mineru.cache_info().misses, _probe_gpu.cache_info().misses)
+        other = MinerUExtractor()
+
+        assert (_probe_mineru.cache_info().misses, _probe_gpu.cache_info().misses) == misses
+        assert other.is_available() == mineru_extractor.is_available()
+        assert other.has_gpu() == mineru_extractor.has_gpu()
+
+    def test_cuda_fast_paths(self, mineru_extractor, monkeypatch):
+        """Test TF32/cuDNN configuration, dtype selection and the CPU context."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+
+        from src.extractors.mineru_extractor import _autocast_dtype, _configure_cuda
+
+        torch = SimpleNamespace(
+            backends=SimpleNamespace(
+                cuda=SimpleNamespace(matmul=SimpleNamespace(allow_tf32=False)),
+                cudnn=SimpleNamespace(allow_tf32=False, benchmark=False),
+            ),
+            set_float32_matmul_precision=Mock(),
+        )
+        _configure_cuda(torch)
+
+        assert torch.backends.cuda.matmul.allow_tf32 is True
+        assert torch.backends.cudnn.benchmark is True
+        torch.set_float32_matmul_precision.assert_called_once_with("high")
+
+        torch.bfloat16, torch.float16 = "bf16", "fp16"
+        torch.cuda = SimpleNamespace(get_device_capability=lambda: (8, 0))
+        assert _autocast_dtype(torch, "bf16") == "bf16"
+        assert _autocast_dtype(torch, None) is None
+        torch.cuda.get_device_capability = lambda: (7, 5)  # Pre-Ampere
+        assert _autocast_dtype(torch, "bf16") == "fp16"
+
+        monkeypatch.setattr(mineru_extractor, "_gpu_available", False)
+        with mineru_extractor._inference_context("bf16"):
+            pass  # No torch needed on CPU
+
+    def test_image_writer_per_extraction_directory(self, mineru_extractor, monkeypatch):
+        """Test that each extraction gets its own directory, removed afterwards."""
+        import shutil
+        import sys
+        import types
+        from unittest.mock import Mock
+
+        fake_rw = types.ModuleType("magic_pdf.rw.DiskReaderWriter")
+        fake_rw.DiskReaderWriter = Mock()
+        monkeypatch.setitem(sys.modules, "magic_pdf.rw.DiskReaderWriter", fake_rw)
+
+        directories = []
+        for _ in range(2):
+            with mineru_extractor._image_writer():
+                directory = Path(fake_rw.DiskReaderWriter.call_args.args[0])
+                assert directory.is_dir()
+                directories.append(directory)
+
+        first, second = directories
+        assert first != second and first.parent == second.parent
+        assert first.parent.name.startswith("mineru_")
+        assert not first.exists() and not second.exists()
+        shutil.rmtree(first.parent)
+
     @pytest.mark.requires_pdf
     def test_mineru_with_complex_document_feature_69(self, mineru_extractor, complex_pdf_path):
         """
@@ -170,3 +243,306 @@ class TestMinerUExtractor:
         # Formulas field should be present
         assert result.formulas is not None
         # Actual formula extraction depends on MinerU
+
+
+def _blank_pdf(path: Path, pages: int) -> Path:
+    """Write a PDF with the given number of blank pages."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+class TestMinerUPageChunks:
+    """Tests for page-chunked MinerU extraction."""
+
+    def test_split_pdf_into_page_chunks(self, mineru_extractor, tmp_path):
+        """Test that long PDFs are split for workers and short ones are not."""
+        from pypdf import PdfReader
+        import io
+
+        long_pdf = _blank_pdf(tmp_path / "long.pdf", 10).read_bytes()
+        chunks, chunk_ocr = mineru_extractor._plan_chunks(long_pdf, 10, 2, {})
+
+        assert [len(PdfReader(io.BytesIO(c)).pages) for c in chunks] == [5, 5]
+        assert chunk_ocr == [False, False]
+        assert mineru_extractor._plan_chunks(long_pdf, 10, 1, {}) == ([long_pdf], [False])
+
+        short_pdf = _blank_pdf(tmp_path / "short.pdf", 3).read_bytes()
+        assert mineru_extractor._plan_chunks(short_pdf, 3, 4, {}) == ([short_pdf], [False])
+
+    def test_split_mapped_pdf(self, mineru_extractor, tmp_path):
+        """Test that a memory-mapped PDF splits like its bytes."""
+        from src.utils.file_utils import map_file
+
+        pdf_path = _blank_pdf(tmp_path / "mapped.pdf", 10)
+
+        with map_file(pdf_path) as pdf:
+            chunks, _ = mineru_extractor._plan_chunks(pdf, 10, 2, {})
+            assert pdf[:] == pdf_path.read_bytes()
+
+        assert len(chunks) == 2 and all(isinstance(c, bytes) for c in chunks)
+
+    def test_ocr_only_for_scanned_page_runs(self, mineru_extractor):
+        """Test that only runs of scanned pages go through OCR, not empty ones."""
+        from pypdf import PdfReader
+        import fitz
+        import io
+
+        doc = fitz.open()
+        scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), 0)
+        for kind in ("text", "scan", "scan", "blank", "text"):
+            page = doc.new_page()
+            if kind == "text":
+                page.insert_text((72, 72), "Digital text layer on this page")
+            elif kind == "scan":
+                page.insert_image(fitz.Rect(72, 72, 144, 144), pixmap=scan)
+        pdf_bytes = doc.tobytes()
+
+        assert mineru_extractor._needs_ocr(pdf_bytes) == [False, True, True, False, False]
+
+        chunks, chunk_ocr = mineru_extractor._plan_chunks(pdf_bytes, 5, 1, {})
+        assert chunk_ocr == [False, True, False]
+        assert [len(PdfReader(io.BytesIO(c)).pages) for c in chunks] == [1, 2, 2]
+
+        assert mineru_extractor._plan_chunks(pdf_bytes, 5, 1, {"force_ocr": True}) == ([pdf_bytes], [True])
+        assert mineru_extractor._plan_chunks(pdf_bytes, 5, 1, {"ocr_enabled": False}) == ([pdf_bytes], [False])
+
+    def test_chunks_stitched_in_page_order(self, mineru_extractor, tmp_path, monkeypatch):
+        """Test that chunk outputs are merged in page order."""
+        import sys
+        import types
+        from unittest.mock import Mock
+
+        fake_rw = types.ModuleType("magic_pdf.rw.DiskReaderWriter")
+        fake_rw.DiskReaderWriter = Mock()
+        monkeypatch.setitem(sys.modules, "magic_pdf.rw.DiskReaderWriter", fake_rw)
+        monkeypatch.setattr(mineru_extractor, "_mineru_available", True)
+
+        def fake_run_pipe(chunk, image_writer, ocr_enabled, vlm_mode, dtype=None):
+            from pypdf import PdfReader
+            import io
+
+            pages = len(PdfReader(io.BytesIO(chunk)).pages)
+            return types.SimpleNamespace(
+                markdown=f"{pages} pages", get_tables=lambda: [f"| {pages} |"]
+            )
+
+        monkeypatch.setattr(mineru_extractor, "_run_pipe", fake_run_pipe)
+        pdf = _blank_pdf(tmp_path / "doc.pdf", 9)
+
+        result = mineru_extractor.extract(pdf, options={"workers": 2})
+
+        assert result.markdown == "5 pages\n\n4 pages"
+        assert result.tables == ["| 5 |", "| 4 |"]
+        assert result.page_count == 9
+
+        # Chunk parallelism is opt-in: by default the PDF runs in one pipeline
+        refreshed = mineru_extractor.extract(pdf, options={"force_refresh": True})
+        assert refreshed.markdown == "9 pages"
+
+    def test_repeat_extraction_served_from_cache(self, mineru_extractor, tmp_path, monkeypatch):
+        """Test that an identical PDF and options skip the pipeline."""
+        import types
+
+        runs = []
+
+        def fake_run_pipe(chunk, image_writer, ocr_enabled, vlm_mode, dtype=None):
+            runs.append(chunk)
+            return types.SimpleNamespace(markdown="# Scanned")
+
+        monkeypatch.setattr(mineru_extractor, "_mineru_available", True)
+        monkeypatch.setattr(mineru_extractor, "_image_writer", nullcontext)
+        monkeypatch.setattr(mineru_extractor, "_run_pipe", fake_run_pipe)
+        pdf = _blank_pdf(tmp_path / "doc.pdf", 2)
+
+        first = mineru_extractor.extract(pdf)
+        second = mineru_extractor.extract(pdf)
+
+        assert len(runs) == 1
+        assert second.markdown == first.markdown == "# Scanned"
+        assert second.page_count == 2
+
+        mineru_extractor.extract(pdf, options={"force_refresh": True})
+        assert len(runs) == 2
+
+    def test_oversized_or_encrypted_pdf_rejected_before_pipeline(
+        self, mineru_extractor, tmp_path, monkeypatch
+    ):
+        """Test that PDFs failing the precheck never reach the pipeline."""
+        import fitz
+
+        def fake_run_pipe(*args, **kwargs):
+            raise AssertionError("pipeline should not run")
+
+        monkeypatch.setattr(mineru_extractor, "_mineru_available", True)
+        monkeypatch.setattr(mineru_extractor, "_run_pipe", fake_run_pipe)
+
+        long_pdf = _blank_pdf(tmp_path / "long.pdf", 11)
+        with pytest.raises(ExtractionError, match="11 pages"):
+            mineru_extractor.extract(long_pdf, options={"max_pages": 10})
+
+        doc = fitz.open()
+        doc.new_page()
+        locked_pdf = tmp_path / "locked.pdf"
+        doc.save(locked_pdf, encryption=fitz.PDF_ENCRYPT_AES_256, user_pw="secret", owner_pw="owner")
+        with pytest.raises(ExtractionError, match="password"):
+            mineru_extractor.extract(locked_pdf)
+
+        assert mineru_extractor.precheck_pdf(long_pdf) == 11
+
+
+class TestMinerUResultAdapter:
+    """Tests for reading MinerU pipe results."""
+
+    def test_result_shape_probed_once_per_class(self, mineru_extractor, tmp_path):
+        """Test that field readers are resolved on first result and reused."""
+        from src.extractors import mineru_extractor as module
+
+        class PipeResult:
+            probes = 0
+
+            def __init__(self, text):
+                self.markdown = text
+
+            def get_formulas(self):
+                return ["x^2"]
+
+            def __getattr__(self, name):
+                PipeResult.probes += 1
+                raise AttributeError(name)
+
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+
+        for text in ("first", "second"):
+            result = PipeResult(text)
+            assert mineru_extractor._extract_markdown(result, pdf) == text
+            assert mineru_extractor._extract_formulas(result) == ["x^2"]
+            assert mineru_extractor._extract_tables(result) == []
+            assert mineru_extractor._extract_metadata(pdf, result)["filename"] == "doc.pdf"
+
+        probes = PipeResult.probes
+        assert set(module._RESULT_ADAPTERS[PipeResult]) == set(module._RESULT_SHAPES)
+
+        mineru_extractor._extract_images(PipeResult("third"))
+        assert PipeResult.probes == probes  # No further hasattr() misses
+
+    def test_page_markdown_joined(self, mineru_extractor, tmp_path):
+        """Test that per-page markdown pieces are joined into one document."""
+        from types import SimpleNamespace
+
+        pages = SimpleNamespace(get_markdown=lambda: iter(["# Page 1", "Page 2"]))
+
+        assert mineru_extractor._extract_markdown(pages, tmp_path / "doc.pdf") == "# Page 1\n\nPage 2"
+
+
+class TestMinerUMultiGPU:
+    """Tests for spreading MinerU extraction over GPUs."""
+
+    def test_workers_pinned_round_robin(self, monkeypatch):
+        """Test that pool workers are assigned GPUs in turn."""
+        import multiprocessing
+        import os
+
+        from src.extractors.mineru_extractor import _pin_worker_gpu
+
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+        counter = multiprocessing.get_context("spawn").Value("i", 0)
+
+        devices = []
+        for _ in range(5):
+            _pin_worker_gpu(counter, 2)
+            devices.append(os.environ["CUDA_VISIBLE_DEVICES"])
+
+        assert devices == ["0", "1", "0", "1", "0"]
+
+    def test_extract_many_without_gpus_runs_in_process(self, mineru_extractor, tmp_path, monkeypatch):
+        """Test that without several GPUs PDFs are extracted in turn, in order."""
+        paths = [_blank_pdf(tmp_path / f"{name}.pdf", 1) for name in ("a", "b")]
+        monkeypatch.setattr(mineru_extractor, "_gpu_devices", [0])
+        monkeypatch.setattr(
+            mineru_extractor, "extract", lambda file_path, options=None: file_path.stem
+        )
+
+        assert list(mineru_extractor.extract_many(paths)) == ["a", "b"]
+
+
+class TestMinerUBatchRunner:
+    """Tests for the three-stage MinerU batch pipeline."""
+
+    def test_pipeline_preserves_order_and_isolates_failures(self, mineru_extractor, tmp_path, monkeypatch):
+        """Test that results come back in input order and a bad file does not stop the batch."""
+        import types
+
+        from src.extractors.mineru_extractor import MinerUBatchRunner
+
+        monkeypatch.setattr(mineru_extractor, "_mineru_available", True)
+        monkeypatch.setattr(mineru_extractor, "_image_writer", nullcontext)
+
+        def fake_build_pipe(chunk, image_writer, ocr_enabled, vlm_mode, dtype=None):
+            result = types.SimpleNamespace(markdown=f"{len(chunk)} bytes")
+            return types.SimpleNamespace(pipe_parse=lambda: result)
+
+        monkeypatch.setattr(mineru_extractor, "_build_pipe", fake_build_pipe)
+
+        paths = [_blank_pdf(tmp_path / f"doc{i}.pdf", 1) for i in range(5)]
+        paths.insert(2, tmp_path / "missing.pdf")
+
+        runner = MinerUBatchRunner(mineru_extractor, max_batch=2, max_wait_s=0.01)
+        outcomes = list(runner.run(paths))
+
+        assert [path for path, _ in outcomes] == paths
+        assert isinstance(outcomes[2][1], ExtractionError)
+        assert all(
+            outcome.markdown.endswith("bytes")
+            for path, outcome in outcomes
+            if path.name != "missing.pdf"
+        )
+
+    def test_early_close_releases_in_flight_documents(self, mineru_extractor, tmp_path, monkeypatch):
+        """Test that stopping early closes queued mappings and image directories."""
+        import types
+        from contextlib import contextmanager
+
+        from src.extractors import mineru_extractor as module
+        from src.extractors.mineru_extractor import MinerUBatchRunner
+
+        mappings, open_dirs = [], set()
+        map_file = module.map_file
+
+        def tracked_map_file(file_path):
+            mappings.append(map_file(file_path))
+            return mappings[-1]
+
+        @contextmanager
+        def tracked_image_writer():
+            token = object()
+            open_dirs.add(token)
+            try:
+                yield None
+            finally:
+                open_dirs.discard(token)
+
+        def fake_build_pipe(chunk, image_writer, ocr_enabled, vlm_mode, dtype=None):
+            result = types.SimpleNamespace(markdown="ok")
+            return types.SimpleNamespace(pipe_parse=lambda: result)
+
+        monkeypatch.setattr(module, "map_file", tracked_map_file)
+        monkeypatch.setattr(mineru_extractor, "_mineru_available", True)
+        monkeypatch.setattr(mineru_extractor, "_image_writer", tracked_image_writer)
+        monkeypatch.setattr(mineru_extractor, "_build_pipe", fake_build_pipe)
+
+        paths = [_blank_pdf(tmp_path / f"doc{i}.pdf", 1) for i in range(8)]
+        runner = MinerUBatchRunner(mineru_extractor, max_batch=1, max_wait_s=0.01, queue_size=1)
+
+        outcomes = runner.run(paths)
+        next(outcomes)
+        outcomes.close()
+
+        assert mappings and all(mapping.closed for mapping in mappings)
+        assert not open_dirs
@@ -8,12 +8,26 @@ Tests cover:
 
 import pytest
 from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+from loguru import logger
+
 from src.core.parallel_executor import ParallelExecutor
 from src.core.aggregator import ExtractionAggregator
-from src.core.orchestrator import Orchestrator
-from src.extractors.base import ExtractionResult, ExtractionError
+from src.core.complexity import ComplexityScore
+from src.core.orchestrator import ExtractionOutcome, Orchestrator
+import src.core.registry as registry_module
+from src.core.registry import ExtractorRegistry, load_extractor_class, reset_registry
+from src.extractors.base import (
+    ExtractionError,
+    ExtractionResult,
+    ExtractorRecoverableError,
+    extractor_key,
+)
 
 
 @pytest.fixture
@@ -65,6 +79,127 @@ class TestParallelExecution:
 
         assert executor.max_workers == 3
         assert executor.timeout == 600
+        assert executor.use_processes is False
+
+    def test_extractor_key_strips_only_suffix(self):
+        """Registry keys drop a trailing "Extractor" only."""
+        assert extractor_key("DoclingExtractor") == "docling"
+        assert extractor_key("mineru") == "mineru"
+        assert extractor_key("ExtractorHelper") == "extractorhelper"
+
+    def test_default_max_workers_bounded_by_cpus_memory_and_cap(self):
+        """Automatic pool size is the smallest of usable CPUs, memory budget and cap."""
+        with patch("src.core.parallel_executor.os.sched_getaffinity", return_value=set(range(32)), create=True), \
+                patch("src.core.parallel_executor._available_memory_gb", return_value=64.0):
+            assert ParallelExecutor().max_workers == 8
+
+        with patch("src.core.parallel_executor.os.sched_getaffinity", return_value={0, 1}, create=True), \
+                patch("src.core.parallel_executor._available_memory_gb", return_value=64.0):
+            assert ParallelExecutor().max_workers == 2
+
+        with patch("src.core.parallel_executor.os.sched_getaffinity", return_value=set(range(32)), create=True), \
+                patch("src.core.parallel_executor._available_memory_gb", return_value=1.0):
+            assert ParallelExecutor().max_workers == 1
+
+    def test_process_mode_falls_back_to_threads_for_unknown_extractors(self):
+        """Extractors the registry cannot rebuild run in threads, without spawning workers."""
+        threads = []
+
+        def make_extractor(name):
+            extractor = Mock()
+            extractor.name = name
+            extractor.extract.side_effect = lambda *args: (
+                threads.append(threading.current_thread())
+                or Mock(success=True, extraction_time=0.1)
+            )
+            return extractor
+
+        extractors = [make_extractor("DoclingExtractor"), make_extractor("MinerUExtractor")]
+
+        executor = ParallelExecutor(max_workers=2, use_processes=True)
+        results = executor.execute(extractors, Path("doc.pdf"))
+
+        assert sorted(results) == ["docling", "mineru"]
+        assert executor._process_pool is None
+        assert len(threads) == 2
+        assert threading.current_thread() not in threads
+
+    def test_single_extractor_runs_inline(self):
+        """A single extractor runs in the calling thread, without a pool."""
+        threads = []
+        mock_mineru = Mock()
+        mock_mineru.name = "MinerUExtractor"
+        mock_mineru.extract.side_effect = lambda *args: (
+            threads.append(threading.current_thread())
+            or Mock(success=True, extraction_time=0.1)
+        )
+
+        with patch("src.core.parallel_executor.ThreadPoolExecutor") as pool:
+            results = ParallelExecutor(max_workers=2).execute([mock_mineru], Path("doc.pdf"))
+
+        assert list(results) == ["mineru"]
+        assert threads == [threading.current_thread()]
+        pool.assert_not_called()
+
+    def test_global_timeout_keeps_finished_results(self):
+        """Extractors still running at the deadline are dropped; finished ones are kept."""
+        release = threading.Event()
+
+        fast = Mock()
+        fast.name = "DoclingExtractor"
+        fast.extract.return_value = Mock(success=True, extraction_time=0.1)
+
+        slow = Mock()
+        slow.name = "MinerUExtractor"
+        slow.extract.side_effect = lambda *args: release.wait(5)
+
+        executor = ParallelExecutor(max_workers=2, timeout=0.2)
+        start = time.monotonic()
+        try:
+            results = executor.execute([fast, slow], Path("doc.pdf"))
+        finally:
+            release.set()
+
+        assert list(results) == ["docling"]
+        assert time.monotonic() - start < 2
+
+    def test_gpu_serial_extractors_share_one_thread(self):
+        """GPU-bound extractors run one at a time; thread extractors run alongside."""
+        threads = {}
+
+        def make(name, mode):
+            extractor = Mock()
+            extractor.name = name
+            extractor.concurrency_mode = mode
+            extractor.extract.side_effect = lambda *args: (
+                threads.__setitem__(name, threading.current_thread().name)
+                or time.sleep(0.05)
+                or Mock(success=True, extraction_time=0.05)
+            )
+            return extractor
+
+        extractors = [
+            make("GpuAExtractor", "gpu_serial"),
+            make("GpuBExtractor", "gpu_serial"),
+            make("MistralExtractor", "thread"),
+        ]
+        results = ParallelExecutor(max_workers=3).execute(extractors, Path("doc.pdf"))
+
+        assert set(results) == {"gpua", "gpub", "mistral"}
+        assert threads["GpuAExtractor"] == threads["GpuBExtractor"]
+        assert threads["MistralExtractor"] != threads["GpuAExtractor"]
+
+    def test_memory_check_reuses_recent_reading(self):
+        """Back-to-back memory checks read system memory once."""
+        memory = Mock(available=8 * 1024 ** 3)
+
+        with patch.dict("src.core.parallel_executor._memory_cache", {"ts": float("-inf")}), \
+                patch("src.core.parallel_executor.psutil.virtual_memory", return_value=memory) as vm:
+            executor = ParallelExecutor(memory_threshold_gb=2.0)
+            assert executor._check_memory() is True
+            assert executor._check_memory() is True
+
+        vm.assert_called_once()
 
     @pytest.mark.requires_pdf
     def test_parallel_extraction_feature_62(self, pdf_path, mock_docling_result, mock_mineru_result):
@@ -130,6 +265,48 @@ class TestParallelExecution:
         assert results["docling"].success
         assert results["docling"].confidence_score == 0.95
 
+    def test_failures_logged_with_traceback_unless_recoverable(self):
+        """Unexpected failures carry a traceback; expected ones are logged without."""
+        records = []
+        sink_id = logger.add(records.append, level="WARNING")
+
+        ok = Mock()
+        ok.name = "DoclingExtractor"
+        ok.extract.return_value = Mock(success=True, extraction_time=0.1)
+
+        missing = Mock()
+        missing.name = "MinerUExtractor"
+        missing.extract.side_effect = ExtractorRecoverableError(
+            extractor="MinerUExtractor",
+            message="MinerU is not installed",
+            file_path="doc.pdf",
+        )
+
+        crashed = Mock()
+        crashed.name = "MistralExtractor"
+        crashed.extract.side_effect = RuntimeError("unexpected crash")
+
+        executor = ParallelExecutor(max_workers=3)
+        try:
+            results = executor.execute([ok, missing, crashed], Path("doc.pdf"))
+            # A single extractor runs inline, outside the pools
+            inline = [executor.execute([failing], Path("doc.pdf")) for failing in (missing, crashed)]
+        finally:
+            logger.remove(sink_id)
+
+        assert list(results) == ["docling"]
+        assert inline == [{}, {}]
+
+        recoverable = [r for r in records if "MinerU is not installed" in r.record["message"]]
+        assert len(recoverable) >= 4  # Logged by the worker and the collector, both paths
+        assert all(r.record["exception"] is None for r in recoverable)
+        assert all(r.record["level"].name == "WARNING" for r in recoverable)
+
+        unexpected = [r for r in records if "unexpected crash" in r.record["message"]]
+        assert len(unexpected) >= 4
+        assert all(r.record["exception"] is not None for r in unexpected)
+        assert all("exc_info" not in r.record["extra"] for r in records)
+
 
 class TestExtractionAggregator:
     """Tests for extraction aggregator."""
@@ -177,6 +354,24 @@ class TestExtractionAggregator:
         assert aggregation["successful_count"] == 0
         assert aggregation["best_result"] is None
 
+    def test_aggregator_update_matches_aggregate(self):
+        """Test folding results one at a time gives the same aggregation."""
+        aggregator = ExtractionAggregator()
+        results = {
+            "docling": Mock(success=True, confidence_score=0.8, extraction_time=1.0, markdown="a"),
+            "mineru": Mock(success=False, confidence_score=0.0, extraction_time=2.0, markdown=""),
+            "mistral": Mock(success=True, confidence_score=0.9, extraction_time=3.0, markdown="bb"),
+        }
+
+        aggregation = None
+        for name, result in results.items():
+            aggregation = aggregator.update(aggregation, name, result)
+
+        assert aggregation == aggregator.aggregate(results)
+        assert aggregation["best_result"] is results["mistral"]
+        assert aggregation["failed_count"] == 1
+        assert aggregation["average_confidence"] == pytest.approx(0.85)
+
 
 class TestOrchestratorParallel:
     """Tests for orchestrator parallel extraction."""
@@ -195,3 +390,158 @@ class TestOrchestratorParallel:
         docling = orchestrator.get_extractor("docling")
         assert docling is not None
         assert docling.name == "DoclingExtractor"
+
+    def test_orchestrators_share_registry(self):
+        """Orchestrators reuse one registry per process until it is reset."""
+        first = Orchestrator()
+
+        assert Orchestrator().registry is first.registry
+
+        reset_registry()
+        assert Orchestrator().registry is not first.registry
+
+    def test_registry_reuses_cached_availability(self):
+        """A cached availability probe is reused instead of importing and probing again."""
+        with patch("src.core.registry._capability_fingerprint", return_value={"env": 1}):
+            ExtractorRegistry()
+            assert registry_module.CAPABILITY_CACHE_PATH.exists()
+
+            registry_module._save_capabilities({"env": 1}, {"DoclingExtractor": False})
+            with patch("src.core.registry.load_extractor_class", wraps=load_extractor_class) as load:
+                registry = ExtractorRegistry()
+
+        assert "DoclingExtractor" not in [call.args[0] for call in load.call_args_list]
+        assert not registry.has_extractor("docling")
+
+    def test_complexity_analysis_memoized_per_file(self, pdf_path):
+        """Test repeated analysis of an unchanged file hits the memo cache."""
+        orchestrator = Orchestrator()
+        orchestrator.complexity_analyzer.analyze = Mock(return_value=ComplexityScore())
+        stat = pdf_path.stat()
+
+        first = orchestrator._analyze_cached(str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        second = orchestrator._analyze_cached(str(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+        assert first is second
+        assert orchestrator.complexity_analyzer.analyze.call_count == 1
+
+    def test_serialized_outcome_keeps_complexity_deferred(self):
+        """Test that the Celery payload only reports an analysis that already ran."""
+        from src.core.orchestrator import ExtractionOutcome, _LazyComplexity
+        from src.core.tasks import _serialize_result
+
+        analyze = Mock(return_value=ComplexityScore())
+        outcome = ExtractionOutcome(
+            result=None, complexity_score=_LazyComplexity(analyze), strategy_used="fallback"
+        )
+
+        assert "complexity" not in _serialize_result(outcome)
+        analyze.assert_not_called()
+
+        outcome.complexity_score.get()
+        assert _serialize_result(outcome)["complexity"] == ComplexityScore().to_dict()
+
+    def test_hedged_fallback_returns_first_success(self, pdf_path):
+        """Test hedged fallback lets a faster extractor win over a slow leader."""
+        orchestrator = Orchestrator()
+        orchestrator.registry.has_extractor = Mock(side_effect=lambda name: name != "mistral")
+        orchestrator.registry.get = Mock(side_effect=lambda name: SimpleNamespace(name=name))
+        orchestrator.refresh_extractors()
+
+        def fake_extract(file_path, extractor_name=None, options=None):
+            if extractor_name == "docling":
+                time.sleep(1.0)
+            return Mock(success=True, confidence_score=0.9, extractor_name=extractor_name)
+
+        with patch.object(orchestrator, "_extract_single", side_effect=fake_extract):
+            result, last_error = orchestrator._run_fallback_hedged(pdf_path, None, hedge_delay=0.05)
+
+        assert result.extractor_name == "mineru"
+        assert last_error is None
+
+    def test_simple_document_downgrades_parallel_strategy(self, pdf_path):
+        """Test parallel strategies fall back to a single pass for simple documents."""
+        orchestrator = Orchestrator()
+        orchestrator._analyze_cached = Mock(return_value=ComplexityScore())
+        orchestrator.parallel_executor.execute = Mock()
+        orchestrator._run_fallback = Mock(
+            return_value=ExtractionOutcome(None, ComplexityScore(), "fallback")
+        )
+        orchestrator._strategies["fallback"] = orchestrator._run_fallback
+
+        response = orchestrator.extract(pdf_path, strategy="parallel_local")
+
+        assert response.strategy_used == "fallback"
+        assert response.strategy_downgraded_from == "parallel_local"
+        assert response["strategy_downgraded_from"] == "parallel_local"
+        assert "aggregation" not in response
+        orchestrator.parallel_executor.execute.assert_not_called()
+
+    def test_extract_batch_yields_every_file(self, pdf_path):
+        """Test batch extraction yields one response per file, including failures."""
+        orchestrator = Orchestrator()
+        missing = Path("tests/fixtures/does_not_exist.pdf")
+
+        def fake_extract(file_path, strategy=None, options=None):
+            if file_path == missing:
+                raise FileNotFoundError(file_path)
+            return {"result": None, "strategy_used": strategy}
+
+        with patch.object(orchestrator, "extract", side_effect=fake_extract):
+            responses = dict(
+                orchestrator.extract_batch([pdf_path, missing], strategy="fallback", max_inflight=2)
+            )
+
+        assert responses[pdf_path] == {"result": None, "strategy_used": "fallback"}
+        assert responses[missing] is None
+
+    def test_fallback_defers_complexity_analysis(self, pdf_path):
+        """Test the fallback strategy only analyzes complexity when it is read."""
+        orchestrator = Orchestrator()
+        orchestrator._analyze_cached = Mock(return_value=ComplexityScore(table_score=20))
+        orchestrator._strategies["fallback"] = Mock(
+            side_effect=lambda file_path, options, score: ExtractionOutcome(None, score, "fallback")
+        )
+
+        outcome = orchestrator.extract(pdf_path, strategy="fallback")
+        orchestrator._analyze_cached.assert_not_called()
+
+        assert outcome.complexity["complexity_level"] == "medium"
+        assert outcome["complexity"]["total_score"] == 20
+        orchestrator._analyze_cached.assert_called_once()
+
+    def test_concurrent_identical_requests_are_coalesced(self, pdf_path):
+        """Test concurrent extract() calls on the same file share one extraction."""
+        orchestrator = Orchestrator()
+        calls = []
+
+        def slow_extract(*args):
+            calls.append(args)
+            time.sleep(0.2)
+            return ExtractionOutcome(None, ComplexityScore(), "fallback")
+
+        with patch.object(orchestrator, "_extract", side_effect=slow_extract):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                outcomes = list(pool.map(lambda _: orchestrator.extract(pdf_path), range(3)))
+
+        assert len(calls) == 1
+        assert outcomes[0] is outcomes[1] is outcomes[2]
+        assert orchestrator._inflight == {}
+
+    def test_fallback_moves_on_when_extractor_exceeds_budget(self, pdf_path):
+        """Test an extractor over its time budget is abandoned for the next one."""
+        orchestrator = Orchestrator()
+        orchestrator._strategy_names["fallback"] = ["docling", "mineru"]
+
+        def fake_extract(file_path, extractor_name=None, options=None):
+            if extractor_name == "docling":
+                time.sleep(1.0)
+            return Mock(success=True, confidence_score=0.9, extractor_name=extractor_name)
+
+        with patch("src.core.orchestrator.get_settings") as settings, \
+                patch.object(orchestrator, "_extract_single", side_effect=fake_extract):
+            settings.return_value.per_extractor_timeout_s = {"docling": 0.05}
+            result, last_error = orchestrator._run_fallback_sequential(pdf_path, None)
+
+        assert result.extractor_name == "mineru"
+        assert "docling exceeded" in last_error
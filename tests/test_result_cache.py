@@ -0,0 +1,116 @@
+"""
+Tests for the extraction result cache and ExtractionResult serialization.
+"""
+
+import pytest
+
+from src.extractors.base import ExtractionResult
+from src.utils.result_cache import ResultCache, fingerprint_file
+
+
+class TestResultCache:
+    """Tests for the content-hash result cache shared by the extractors."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored result is returned unchanged."""
+        cache = ResultCache(tmp_path, "docling")
+        result = ExtractionResult(
+            markdown="# Title", metadata={"page_count": 1},
+            extractor_name="DoclingExtractor", extractor_version="1.0.0",
+        )
+        key = cache.key("abc", "1.0.0", {})
+
+        assert cache.get(key) is None
+        cache.put(key, result)
+        assert cache.get(key) == result
+
+    def test_key_depends_on_content_and_options(self, tmp_path):
+        """Test that force_refresh does not change the key but options do."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 one")
+        fingerprint = fingerprint_file(pdf)
+
+        base = ResultCache.key(fingerprint, "1.0.0", {"extract_images": True})
+        assert ResultCache.key(fingerprint, "1.0.0", {"extract_images": True, "force_refresh": True}) == base
+        assert ResultCache.key(fingerprint, "1.0.0", {"extract_images": False}) != base
+        assert ResultCache.key(fingerprint, "1.0.1", {"extract_images": True}) != base
+
+        pdf.write_bytes(b"%PDF-1.4 two")
+        assert fingerprint_file(pdf) != fingerprint
+
+    def test_fingerprint_identical_and_empty_files(self, tmp_path):
+        """Test that fingerprints depend only on content, including empty files."""
+        a, b, empty = tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "empty.pdf"
+        a.write_bytes(b"%PDF-1.4" * 1000)
+        b.write_bytes(b"%PDF-1.4" * 1000)
+        empty.write_bytes(b"")
+
+        assert fingerprint_file(a) == fingerprint_file(b)
+        assert fingerprint_file(empty) != fingerprint_file(a)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that unreadable entries are ignored."""
+        cache = ResultCache(tmp_path, "docling")
+        cache.directory.mkdir(parents=True)
+        cache._path("bad").write_bytes(b"not json")
+
+        assert cache.get("bad") is None
+
+    def test_concurrent_puts_of_same_key(self, tmp_path):
+        """Test that threads storing one key at once all succeed atomically."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from loguru import logger
+
+        cache = ResultCache(tmp_path, "docling")
+        result = ExtractionResult(markdown="# Title" * 10000)
+        key = cache.key("abc", "1.0.0", {})
+
+        warnings = []
+        sink_id = logger.add(warnings.append, level="WARNING")
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: cache.put(key, result), range(32)))
+        finally:
+            logger.remove(sink_id)
+
+        assert not warnings
+        assert cache.get(key) == result
+        assert [p.name for p in cache.directory.iterdir()] == [cache._path(key).name]
+
+
+class TestExtractionResultSerialization:
+    """Tests for ExtractionResult serialization used by the cache and workers."""
+
+    def test_to_json_round_trip(self):
+        """Test that to_json() output rebuilds an equal, UTC-aware result."""
+        import orjson
+
+        result = ExtractionResult(markdown="# Title", metadata={"page_count": 1})
+        data = orjson.loads(result.to_json())
+
+        assert data["extraction_timestamp"].endswith("Z")
+        assert ExtractionResult.from_dict(data) == result
+        assert result.extraction_timestamp.tzinfo is not None
+
+    def test_msgpack_round_trip(self):
+        """Test that to_msgpack() output rebuilds an equal result."""
+        pytest.importorskip("msgpack")
+
+        result = ExtractionResult(markdown="# Title", tables=["| A |"], metadata={"page_count": 1})
+
+        assert ExtractionResult.from_msgpack(result.to_msgpack()) == result
+
+    def test_msgpack_requires_package(self, monkeypatch):
+        """Test that both msgpack directions fail clearly without the package."""
+        monkeypatch.setattr("src.extractors.base.msgpack", None)
+
+        with pytest.raises(ImportError, match="msgpack"):
+            ExtractionResult(markdown="x").to_msgpack()
+        with pytest.raises(ImportError, match="msgpack"):
+            ExtractionResult.from_msgpack(b"")
+
+    def test_from_dict_validates_confidence(self):
+        """Test that untrusted data with an out-of-range confidence is rejected."""
+        with pytest.raises(ValueError, match="confidence_score"):
+            ExtractionResult.from_dict({"markdown": "x", "confidence_score": 1.5})